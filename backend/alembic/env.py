@@ -10,7 +10,7 @@ from app.database import Base
 from app.config import settings
 
 # Import all models so Alembic can detect them
-from app.database import User, Job, Proposal, SavedJob, Notification, Conversation, Message
+from app.database import User, Job, Proposal, SavedJob, SavedSearch, Notification, Conversation, Message
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
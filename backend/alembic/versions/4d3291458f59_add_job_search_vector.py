@@ -0,0 +1,33 @@
+"""Add generated search_vector column and GIN index to jobs table
+
+Revision ID: 4d3291458f59
+Revises: 2dc01b84276b
+Create Date: 2026-10-16 09:12:41.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from app.database import JOB_SEARCH_TEXT_FUNCTION, JOB_SEARCH_VECTOR
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d3291458f59'
+down_revision: Union[str, None] = '2dc01b84276b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(JOB_SEARCH_TEXT_FUNCTION)
+    op.add_column('jobs', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(JOB_SEARCH_VECTOR, persisted=True), nullable=True))
+    op.create_index('ix_jobs_search_vector', 'jobs', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_search_vector', table_name='jobs', postgresql_using='gin')
+    op.drop_column('jobs', 'search_vector')
+    op.execute('DROP FUNCTION IF EXISTS job_search_text(text[])')
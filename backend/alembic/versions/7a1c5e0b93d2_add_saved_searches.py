@@ -0,0 +1,44 @@
+"""Add saved_searches table with a GIN-indexed reverse index of match keys
+
+Revision ID: 7a1c5e0b93d2
+Revises: 4d3291458f59
+Create Date: 2026-10-16 11:04:27.836412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a1c5e0b93d2'
+down_revision: Union[str, None] = '4d3291458f59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('saved_searches',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('user_address', sa.String(length=42), nullable=False),
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('query', sa.Text(), nullable=True),
+    sa.Column('terms', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('tags', sa.ARRAY(sa.String()), nullable=True),
+    sa.Column('category', sa.String(length=100), nullable=True),
+    sa.Column('match_keys', sa.ARRAY(sa.String()), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_address'], ['users.wallet_address'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_saved_searches_id'), 'saved_searches', ['id'], unique=False)
+    op.create_index(op.f('ix_saved_searches_user_address'), 'saved_searches', ['user_address'], unique=False)
+    op.create_index('ix_saved_searches_match_keys', 'saved_searches', ['match_keys'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_saved_searches_match_keys', table_name='saved_searches', postgresql_using='gin')
+    op.drop_index(op.f('ix_saved_searches_user_address'), table_name='saved_searches')
+    op.drop_index(op.f('ix_saved_searches_id'), table_name='saved_searches')
+    op.drop_table('saved_searches')
@@ -0,0 +1,68 @@
+"""Add composite and partial indexes for the hot job, notification and message queries
+
+Revision ID: b5e2c9d41f07
+Revises: 7a1c5e0b93d2
+Create Date: 2026-10-16 19:42:10.508213
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e2c9d41f07'
+down_revision: Union[str, None] = '7a1c5e0b93d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial index predicate)
+INDEXES = [
+    ('ix_jobs_created_at', 'jobs', [sa.text('created_at DESC')], None),
+    ('ix_jobs_client_address_created_at', 'jobs', ['client_address', sa.text('created_at DESC')], None),
+    ('ix_jobs_status_created_at', 'jobs', ['status', sa.text('created_at DESC')], None),
+    ('ix_jobs_status_category_created_at', 'jobs', ['status', 'category', sa.text('created_at DESC')], None),
+    ('ix_jobs_escrow_confirmed', 'jobs', ['escrow_address'],
+     'client_confirmed_completion = true AND freelancer_confirmed_completion = true'),
+    ('ix_jobs_escrow_revertable', 'jobs', ['escrow_address'],
+     'allow_escrow_revert = true AND freelancer_address IS NULL'),
+    ('ix_notifications_user_address_created_at', 'notifications', ['user_address', sa.text('created_at DESC')], None),
+    ('ix_notifications_unread', 'notifications', ['user_address', sa.text('created_at DESC')], 'is_read = false'),
+    ('ix_messages_conversation_id_created_at', 'messages', ['conversation_id', sa.text('created_at DESC')], None),
+    ('ix_messages_unread', 'messages', ['conversation_id'], 'is_read = false'),
+]
+
+# Single-column indexes made redundant by the leading columns above, or (the
+# boolean is_read ones) by the partial indexes; dropping them saves write cost
+REPLACED_INDEXES = [
+    ('ix_jobs_client_address', 'jobs', ['client_address']),
+    ('ix_jobs_status', 'jobs', ['status']),
+    ('ix_notifications_user_address', 'notifications', ['user_address']),
+    ('ix_notifications_is_read', 'notifications', ['is_read']),
+    ('ix_messages_conversation_id', 'messages', ['conversation_id']),
+    ('ix_messages_is_read', 'messages', ['is_read']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build; it cannot
+    # run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True
+            )
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
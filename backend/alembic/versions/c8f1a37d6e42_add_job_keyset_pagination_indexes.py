@@ -0,0 +1,61 @@
+"""Add (created_at, id) keyset indexes for the job listings
+
+Revision ID: c8f1a37d6e42
+Revises: b5e2c9d41f07
+Create Date: 2026-10-16 21:08:37.214590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f1a37d6e42'
+down_revision: Union[str, None] = 'b5e2c9d41f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns); the listings page on (created_at, id), so id is the
+# last key and a page resumes from an index position after the cursor
+INDEXES = [
+    ('ix_jobs_created_at_id', 'jobs', [sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_jobs_client_address_created_at_id', 'jobs',
+     ['client_address', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_jobs_freelancer_address_created_at_id', 'jobs',
+     ['freelancer_address', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_jobs_category_created_at_id', 'jobs', ['category', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_jobs_status_created_at_id', 'jobs', ['status', sa.text('created_at DESC'), sa.text('id DESC')]),
+    ('ix_jobs_status_category_created_at_id', 'jobs',
+     ['status', 'category', sa.text('created_at DESC'), sa.text('id DESC')]),
+]
+
+# Indexes that are prefixes of the ones above
+REPLACED_INDEXES = [
+    ('ix_jobs_created_at', 'jobs', [sa.text('created_at DESC')]),
+    ('ix_jobs_client_address_created_at', 'jobs', ['client_address', sa.text('created_at DESC')]),
+    ('ix_jobs_freelancer_address', 'jobs', ['freelancer_address']),
+    ('ix_jobs_category', 'jobs', ['category']),
+    ('ix_jobs_status_created_at', 'jobs', ['status', sa.text('created_at DESC')]),
+    ('ix_jobs_status_category_created_at', 'jobs', ['status', 'category', sa.text('created_at DESC')]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the table writable while the indexes build; it cannot
+    # run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
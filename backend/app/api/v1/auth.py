@@ -15,7 +15,7 @@ from app.database import get_db, User
 router = APIRouter()
 
 @router.post("/wallet-login", response_model=TokenResponse)
-async def wallet_login(
+def wallet_login(
     auth_request: WalletAuthRequest,
     db: Session = Depends(get_db)
 ):
@@ -4,8 +4,9 @@ Chat endpoints for messaging between users
 
 from fastapi import APIRouter, HTTPException, Depends, Query, UploadFile, File, Form
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import or_, and_, desc, func, select, update
 from datetime import datetime
 import uuid
 import logging
@@ -13,7 +14,7 @@ import os
 import shutil
 from pathlib import Path
 
-from app.database import get_db, Conversation, Message, MessageAttachment, User, Job
+from app.database import get_async_db, Conversation, Message, MessageAttachment
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -59,34 +60,41 @@ class ConversationResponse(BaseModel):
 @router.get("/conversations", response_model=List[ConversationResponse])
 async def get_conversations(
     user_address: str = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all conversations for a user"""
     try:
-        conversations = db.query(Conversation).filter(
-            or_(
-                Conversation.participant1_address == user_address.lower(),
-                Conversation.participant2_address == user_address.lower()
-            )
-        ).order_by(desc(Conversation.last_message_at)).all()
+        # Participants and job are loaded up front (no lazy loads on an async session)
+        conversations = (await db.execute(
+            select(Conversation).where(
+                or_(
+                    Conversation.participant1_address == user_address.lower(),
+                    Conversation.participant2_address == user_address.lower()
+                )
+            ).options(
+                selectinload(Conversation.participant1),
+                selectinload(Conversation.participant2),
+                selectinload(Conversation.job)
+            ).order_by(desc(Conversation.last_message_at))
+        )).scalars().all()
         
         result = []
         for conv in conversations:
-            # Get other participant
-            other_address = conv.participant2_address if conv.participant1_address.lower() == user_address.lower() else conv.participant1_address
-            other_user = db.query(User).filter(User.wallet_address == other_address.lower()).first()
-            
             # Get last message
-            last_message = db.query(Message).filter(
-                Message.conversation_id == conv.id
-            ).order_by(desc(Message.created_at)).first()
+            last_message = (await db.execute(
+                select(Message).where(
+                    Message.conversation_id == conv.id
+                ).order_by(desc(Message.created_at)).limit(1)
+            )).scalars().first()
             
             # Get unread count
-            unread_count = db.query(Message).filter(
-                Message.conversation_id == conv.id,
-                Message.sender_address != user_address.lower(),
-                Message.is_read == False
-            ).count()
+            unread_count = (await db.execute(
+                select(func.count()).select_from(Message).where(
+                    Message.conversation_id == conv.id,
+                    Message.sender_address != user_address.lower(),
+                    Message.is_read == False
+                )
+            )).scalar_one()
             
             result.append(ConversationResponse(
                 id=conv.id,
@@ -112,42 +120,44 @@ async def get_messages(
     conversation_id: str,
     user_address: str = Query(...),
     limit: int = Query(50, le=100),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get messages for a conversation"""
     try:
         # Verify user is part of conversation
-        conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+        conversation = await db.get(Conversation, conversation_id)
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
         
         if conversation.participant1_address.lower() != user_address.lower() and conversation.participant2_address.lower() != user_address.lower():
             raise HTTPException(status_code=403, detail="Not authorized to view this conversation")
         
-        messages = db.query(Message).filter(
-            Message.conversation_id == conversation_id
-        ).order_by(desc(Message.created_at)).limit(limit).all()
+        messages = (await db.execute(
+            select(Message).where(
+                Message.conversation_id == conversation_id
+            ).options(
+                selectinload(Message.sender),
+                selectinload(Message.attachments)
+            ).order_by(desc(Message.created_at)).limit(limit)
+        )).scalars().all()
         
         # Mark messages as read
-        db.query(Message).filter(
-            Message.conversation_id == conversation_id,
-            Message.sender_address != user_address.lower(),
-            Message.is_read == False
-        ).update({"is_read": True})
-        db.commit()
+        await db.execute(
+            update(Message).where(
+                Message.conversation_id == conversation_id,
+                Message.sender_address != user_address.lower(),
+                Message.is_read == False
+            ).values(is_read=True)
+        )
+        await db.commit()
         
         result = []
         for msg in reversed(messages):  # Reverse to show oldest first
-            sender = db.query(User).filter(User.wallet_address == msg.sender_address.lower()).first()
-            attachments = db.query(MessageAttachment).filter(
-                MessageAttachment.message_id == msg.id
-            ).all()
-            
             result.append(MessageResponse(
                 id=msg.id,
                 conversation_id=msg.conversation_id,
                 sender_address=msg.sender_address,
-                sender_username=sender.username if sender else None,
+                sender_username=msg.sender.username if msg.sender else None,
                 content=msg.content,
                 message_type=msg.message_type,
                 is_read=msg.is_read,
@@ -160,7 +170,7 @@ async def get_messages(
                         file_size=att.file_size,
                         file_url=att.file_url,
                         created_at=att.created_at
-                    ) for att in attachments
+                    ) for att in msg.attachments
                 ]
             ))
         
@@ -176,7 +186,7 @@ async def create_or_get_conversation(
     participant1_address: str = Query(...),
     participant2_address: str = Query(...),
     job_id: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create or get existing conversation"""
     try:
@@ -189,13 +199,15 @@ async def create_or_get_conversation(
             p1, p2 = p2, p1
         
         # Check if conversation exists
-        conversation = db.query(Conversation).filter(
-            and_(
-                Conversation.participant1_address == p1,
-                Conversation.participant2_address == p2,
-                Conversation.job_id == job_id
+        conversation = (await db.execute(
+            select(Conversation).where(
+                and_(
+                    Conversation.participant1_address == p1,
+                    Conversation.participant2_address == p2,
+                    Conversation.job_id == job_id
+                )
             )
-        ).first()
+        )).scalars().first()
         
         if conversation:
             return {"conversation_id": conversation.id, "created": False}
@@ -209,13 +221,12 @@ async def create_or_get_conversation(
             job_id=job_id
         )
         db.add(conversation)
-        db.commit()
-        db.refresh(conversation)
+        await db.commit()
         
         return {"conversation_id": conversation.id, "created": True}
     except Exception as e:
         logger.error(f"Error creating conversation: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/messages")
@@ -224,12 +235,12 @@ async def send_message(
     sender_address: str = Form(...),
     content: Optional[str] = Form(None),
     files: Optional[List[UploadFile]] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Send a message with optional file attachments"""
     try:
         # Verify conversation exists and user is part of it
-        conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+        conversation = await db.get(Conversation, conversation_id)
         if not conversation:
             raise HTTPException(status_code=404, detail="Conversation not found")
         
@@ -255,7 +266,7 @@ async def send_message(
             message_type=message_type
         )
         db.add(message)
-        db.flush()
+        await db.flush()
         
         # Handle file uploads
         attachments = []
@@ -285,11 +296,10 @@ async def send_message(
                     attachments.append(attachment)
         
         # Update conversation last_message_at
-        from sqlalchemy.sql import func
         conversation.last_message_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(message)
+        await db.commit()
+        await db.refresh(message)
         
         return {
             "message_id": message.id,
@@ -300,7 +310,7 @@ async def send_message(
         raise
     except Exception as e:
         logger.error(f"Error sending message: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/files/{filename}")
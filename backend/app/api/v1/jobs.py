@@ -11,16 +11,22 @@ import re
 from web3 import Web3
 
 from sqlalchemy.orm import Session
-from app.database import get_db, Job, User, SavedJob, Proposal
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db, get_async_db, Job, User, SavedJob, Proposal
 from app.models import (
-    JobCreate, JobResponse, JobUpdate, JobStatus,
+    JobCreate, JobResponse, JobListResponse, JobUpdate, JobStatus,
     JobCreateBlockchain, BlockchainJobResponse
 )
 from app.services.blockchain import blockchain_service
-from app.services.search import search_service
+from app.services.search import search_service, job_to_document
 from app.services.ipfs import ipfs_service
 from app.services.notification import notification_service
-from sqlalchemy import and_
+from app.services.saved_search import saved_search_service
+from app.services.recommendation import recommendation_service
+from app.services.job_listing import (
+    job_listing_service, render_jobs, render_job_page, JOB_RESPONSE_COLUMNS
+)
+from sqlalchemy import and_, func, select
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -28,7 +34,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.post("/", response_model=JobResponse)
-async def create_job(
+def create_job(
     job: JobCreate,
     client_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -56,6 +62,8 @@ async def create_job(
         # Upload job details to IPFS if not already provided
         ipfs_hash = job.ipfs_hash
         if not ipfs_hash and ipfs_service.provider:
+            # Hand the connection back for the duration of the upload
+            db.close()
             job_data = {
                 'title': job.title,
                 'description': job.description,
@@ -93,40 +101,16 @@ async def create_job(
         db.refresh(db_job)
         
         # Index in Redis for search
-        job_data = {
-            'id': db_job.id,
-            'title': db_job.title,
-            'description': db_job.description,
-            'category': db_job.category,
-            'tags': db_job.tags or [],
-            'status': db_job.status,
-            'skills_required': db_job.skills_required or [],
-        }
-        search_service.index_job(db_job.id, job_data)
-        
-        return JobResponse(
-            id=db_job.id,
-            client_address=db_job.client_address,
-            freelancer_address=db_job.freelancer_address,
-            title=db_job.title,
-            description=db_job.description,
-            category=db_job.category,
-            skills_required=db_job.skills_required or [],
-            tags=db_job.tags or [],
-            budget=db_job.budget,
-            deadline=db_job.deadline,
-            status=JobStatus(db_job.status),
-            ipfs_hash=db_job.ipfs_hash,
-            blockchain_job_id=db_job.blockchain_job_id,
-            deliverable_url=db_job.deliverable_url,
-            client_confirmed_completion=bool(db_job.client_confirmed_completion) if db_job.client_confirmed_completion is not None else False,
-            freelancer_confirmed_completion=bool(db_job.freelancer_confirmed_completion) if db_job.freelancer_confirmed_completion is not None else False,
-            escrow_address=db_job.escrow_address,
-            allow_escrow_revert=bool(db_job.allow_escrow_revert) if db_job.allow_escrow_revert is not None else False,
-            created_at=db_job.created_at,
-            updated_at=db_job.updated_at,
-            proposal_count=db_job.proposal_count or 0,
-        )
+        search_service.index_job(db_job.id, job_to_document(db_job))
+        
+        # Alert users whose saved searches match the new job
+        try:
+            saved_search_service.match_new_job(db, db_job)
+        except Exception as e:
+            logger.error(f"Error matching saved searches for job {db_job.id}: {e}")
+        recommendation_service.add_job(db_job.id, db_job.skills_required)
+        
+        return JobResponse.model_validate(db_job)
     
     except Exception as e:
         logger.error(f"Error creating job: {e}", exc_info=True)
@@ -134,7 +118,7 @@ async def create_job(
         raise HTTPException(status_code=500, detail=f"Failed to create job: {str(e)}")
 
 @router.post("/blockchain/create", response_model=dict)
-async def create_job_on_blockchain(
+def create_job_on_blockchain(
     job: JobCreateBlockchain,
     client_address: str = Query(...)
 ):
@@ -286,7 +270,7 @@ async def create_job_on_blockchain(
         )
 
 @router.post("/blockchain/submit-tx", response_model=dict)
-async def submit_signed_transaction(
+def submit_signed_transaction(
     signed_tx_hex: str,
     job_id: Optional[str] = None,
     db: Session = Depends(get_db)
@@ -329,6 +313,8 @@ async def submit_signed_transaction(
                         blockchain_job_id = int(logs[0]['args']['jobId'])
                         db_job.blockchain_job_id = blockchain_job_id
                         db.commit()
+                        search_service.sync_job(db_job)
+                        recommendation_service.sync_job(db_job)
                         logger.info(f"✅ Linked job {job_id} with blockchain job {blockchain_job_id}")
                 except Exception as e:
                     logger.warning(f"Could not extract job ID from event: {e}")
@@ -346,7 +332,7 @@ async def submit_signed_transaction(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/blockchain/{job_id}", response_model=BlockchainJobResponse)
-async def get_blockchain_job(job_id: int):
+def get_blockchain_job(job_id: int):
     """Get job details directly from blockchain"""
     try:
         job = blockchain_service.get_job(job_id)
@@ -358,7 +344,7 @@ async def get_blockchain_job(job_id: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/blockchain/accept")
-async def accept_job_on_blockchain(
+def accept_job_on_blockchain(
     job_id: str,
     blockchain_job_id: int,
     freelancer_address: str = Query(...),
@@ -396,7 +382,7 @@ async def accept_job_on_blockchain(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/blockchain/submit")
-async def submit_work_on_blockchain(
+def submit_work_on_blockchain(
     job_id: str,
     request_data: dict,
     freelancer_address: str = Query(...),
@@ -437,7 +423,7 @@ async def submit_work_on_blockchain(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/upload-deliverable", response_model=dict)
-async def upload_deliverable(
+def upload_deliverable(
     job_id: str,
     description: Optional[str] = Form(None),  # Make description optional
     files: List[UploadFile] = File(default=[]),
@@ -471,7 +457,7 @@ async def upload_deliverable(
         if files:
             file_info = []
             for file in files:
-                content = await file.read()
+                content = file.file.read()
                 file_info.append({
                     "name": file.filename,
                     "size": len(content),
@@ -491,6 +477,8 @@ async def upload_deliverable(
                 # Update job with deliverable URL
                 job.deliverable_url = ipfs_service.get_gateway_url(ipfs_hash)
                 db.commit()
+                search_service.sync_job(job)
+                recommendation_service.sync_job(job)
             else:
                 logger.warning("⚠️ Failed to upload deliverable to IPFS")
         else:
@@ -511,7 +499,7 @@ async def upload_deliverable(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/blockchain/approve")
-async def approve_work_on_blockchain(
+def approve_work_on_blockchain(
     job_id: str,
     blockchain_job_id: int,
     client_address: str = Query(...),
@@ -546,7 +534,7 @@ async def approve_work_on_blockchain(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/blockchain/cancel")
-async def cancel_job_on_blockchain(
+def cancel_job_on_blockchain(
     job_id: str,
     blockchain_job_id: int,
     client_address: str = Query(...),
@@ -581,7 +569,7 @@ async def cancel_job_on_blockchain(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/blockchain/status/{tx_hash}", response_model=dict)
-async def get_transaction_status(tx_hash: str):
+def get_transaction_status(tx_hash: str):
     """Get transaction status"""
     try:
         status = blockchain_service.get_transaction_status(tx_hash)
@@ -590,55 +578,40 @@ async def get_transaction_status(tx_hash: str):
         logger.error(f"Error getting transaction status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/", response_model=List[JobResponse])
+@router.get("/", response_model=JobListResponse)
 async def list_jobs(
     status: Optional[JobStatus] = None,
     category: Optional[str] = None,
-    limit: int = Query(50, le=100),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Include an approximate total"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """List all jobs with optional filters"""
+    """List all jobs with optional filters, newest first, one page at a time"""
     try:
-        query = db.query(Job)
+        filters = {}
         
         if status:
-            query = query.filter(Job.status == status.value)
+            filters["status"] = status.value
         
         if category:
-            query = query.filter(Job.category == category)
-        
-        jobs = query.order_by(Job.created_at.desc()).limit(limit).all()
-        
-        return [
-            JobResponse(
-                id=job.id,
-                client_address=job.client_address,
-                freelancer_address=job.freelancer_address,
-                title=job.title,
-                description=job.description,
-                category=job.category,
-                skills_required=job.skills_required or [],
-                tags=job.tags or [],
-                budget=job.budget,
-                deadline=job.deadline,
-                status=JobStatus(job.status),
-                ipfs_hash=job.ipfs_hash,
-                blockchain_job_id=job.blockchain_job_id,
-                deliverable_url=job.deliverable_url,
-                client_confirmed_completion=bool(job.client_confirmed_completion) if job.client_confirmed_completion is not None else False,
-                freelancer_confirmed_completion=bool(job.freelancer_confirmed_completion) if job.freelancer_confirmed_completion is not None else False,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-                proposal_count=job.proposal_count or 0,
-            )
-            for job in jobs
-        ]
+            filters["category"] = category
+        
+        jobs, next_cursor = await job_listing_service.page(db, filters, limit, cursor)
+        
+        return render_job_page(
+            jobs,
+            next_cursor,
+            await job_listing_service.approximate_total(db, filters) if include_total else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error listing jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str, db: Session = Depends(get_db)):
+def get_job(job_id: str, db: Session = Depends(get_db)):
     """Get a specific job by ID"""
     try:
         job = db.query(Job).filter(Job.id == job_id).first()
@@ -667,6 +640,8 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
                             job.status = 'in_progress'
                             job.updated_at = datetime.utcnow()
                             db.commit()
+                            search_service.sync_job(job)
+                            recommendation_service.sync_job(job)
                             logger.info(f"✅ Fixed job {job_id} status from open to in_progress (has confirmations)")
                         # Otherwise, keep database status
                         logger.debug(f"Job {job_id} has freelancer in DB, keeping status: {job.status} (blockchain says: {blockchain_status})")
@@ -707,31 +682,13 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
                     
                     job.updated_at = datetime.utcnow()
                     db.commit()
+                    search_service.sync_job(job)
+                    recommendation_service.sync_job(job)
             except Exception as e:
                 logger.warning(f"Could not sync with blockchain: {e}")
                 db.rollback()  # Rollback on error to prevent session issues
         
-        return JobResponse(
-            id=job.id,
-            client_address=job.client_address,
-            freelancer_address=job.freelancer_address,
-            title=job.title,
-            description=job.description,
-            category=job.category,
-            skills_required=job.skills_required or [],
-            tags=job.tags or [],
-            budget=job.budget,
-            deadline=job.deadline,
-            status=JobStatus(job.status),
-            ipfs_hash=job.ipfs_hash,
-            blockchain_job_id=job.blockchain_job_id,
-            deliverable_url=job.deliverable_url,
-            client_confirmed_completion=bool(job.client_confirmed_completion) if job.client_confirmed_completion is not None else False,
-            freelancer_confirmed_completion=bool(job.freelancer_confirmed_completion) if job.freelancer_confirmed_completion is not None else False,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            proposal_count=job.proposal_count or 0,
-        )
+        return JobResponse.model_validate(job)
     
     except HTTPException:
         raise
@@ -739,69 +696,32 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
         logger.error(f"Error getting job: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/client/{client_address}", response_model=dict)
+@router.get("/client/{client_address}", response_model=JobListResponse)
 async def get_client_jobs(
     client_address: str,
-    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(10, ge=1, le=50, description="Items per page"),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Include an approximate total"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all jobs posted by a client (based on wallet address) with pagination"""
+    """Get all jobs posted by a client (based on wallet address), latest first, one page at a time"""
     try:
-        # Get total count
-        total_count = db.query(Job).filter(Job.client_address == client_address.lower()).count()
-        
-        # Calculate offset
-        offset = (page - 1) * limit
-        
-        # Query with pagination and sorting (latest first)
-        jobs = db.query(Job).filter(
-            Job.client_address == client_address.lower()
-        ).order_by(Job.created_at.desc()).offset(offset).limit(limit).all()
-        
-        job_list = []
-        for job in jobs:
-            job_list.append(JobResponse(
-                id=job.id,
-                client_address=job.client_address,
-                freelancer_address=job.freelancer_address,
-                title=job.title,
-                description=job.description,
-                category=job.category,
-                skills_required=job.skills_required or [],
-                tags=job.tags or [],
-                budget=job.budget,
-                deadline=job.deadline,
-                status=JobStatus(job.status),
-                ipfs_hash=job.ipfs_hash,
-                blockchain_job_id=job.blockchain_job_id,
-                deliverable_url=job.deliverable_url,
-                client_confirmed_completion=job.client_confirmed_completion,
-                freelancer_confirmed_completion=job.freelancer_confirmed_completion,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-                proposal_count=job.proposal_count or 0,
-            ))
-        
-        total_pages = (total_count + limit - 1) // limit if total_count > 0 else 1
+        filters = {"client_address": client_address.lower()}
+        jobs, next_cursor = await job_listing_service.page(db, filters, limit, cursor)
         
-        return {
-            "jobs": job_list,
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total": total_count,
-                "total_pages": total_pages,
-                "has_next": page < total_pages,
-                "has_prev": page > 1
-            }
-        }
+        return render_job_page(
+            jobs,
+            next_cursor,
+            await job_listing_service.approximate_total(db, filters) if include_total else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting client jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/client/{client_address}/blockchain", response_model=List[int])
-async def get_client_blockchain_jobs(client_address: str):
+def get_client_blockchain_jobs(client_address: str):
     """Get all blockchain job IDs for a client"""
     try:
         job_ids = blockchain_service.get_client_jobs(client_address)
@@ -810,43 +730,32 @@ async def get_client_blockchain_jobs(client_address: str):
         logger.error(f"Error getting client blockchain jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/freelancer/{freelancer_address}", response_model=List[JobResponse])
-async def get_freelancer_jobs(freelancer_address: str, db: Session = Depends(get_db)):
-    """Get all jobs assigned to a freelancer (based on wallet address)"""
+@router.get("/freelancer/{freelancer_address}", response_model=JobListResponse)
+async def get_freelancer_jobs(
+    freelancer_address: str,
+    limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Include an approximate total"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all jobs assigned to a freelancer (based on wallet address), latest first, one page at a time"""
     try:
-        jobs = db.query(Job).filter(Job.freelancer_address == freelancer_address.lower()).all()
-        
-        job_list = []
-        for job in jobs:
-            job_list.append(JobResponse(
-                id=job.id,
-                client_address=job.client_address,
-                freelancer_address=job.freelancer_address,
-                title=job.title,
-                description=job.description,
-                category=job.category,
-                skills_required=job.skills_required or [],
-                tags=job.tags or [],
-                budget=job.budget,
-                deadline=job.deadline,
-                status=JobStatus(job.status),
-                ipfs_hash=job.ipfs_hash,
-                blockchain_job_id=job.blockchain_job_id,
-                deliverable_url=job.deliverable_url,
-                client_confirmed_completion=job.client_confirmed_completion,
-                freelancer_confirmed_completion=job.freelancer_confirmed_completion,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-                proposal_count=job.proposal_count or 0,
-            ))
-        
-        return job_list
+        filters = {"freelancer_address": freelancer_address.lower()}
+        jobs, next_cursor = await job_listing_service.page(db, filters, limit, cursor)
+        
+        return render_job_page(
+            jobs,
+            next_cursor,
+            await job_listing_service.approximate_total(db, filters) if include_total else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error getting freelancer jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/freelancer/{freelancer_address}/blockchain", response_model=List[int])
-async def get_freelancer_blockchain_jobs(freelancer_address: str):
+def get_freelancer_blockchain_jobs(freelancer_address: str):
     """Get all blockchain job IDs for a freelancer"""
     try:
         job_ids = blockchain_service.get_freelancer_jobs(freelancer_address)
@@ -856,7 +765,7 @@ async def get_freelancer_blockchain_jobs(freelancer_address: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{job_id}", response_model=JobResponse)
-async def update_job(
+def update_job(
     job_id: str,
     job_update: JobUpdate,
     client_address: str = Query(...),
@@ -893,29 +802,11 @@ async def update_job(
         
         job.updated_at = datetime.utcnow()
         db.commit()
+        search_service.sync_job(job)
+        recommendation_service.sync_job(job)
         db.refresh(job)
         
-        return JobResponse(
-            id=job.id,
-            client_address=job.client_address,
-            freelancer_address=job.freelancer_address,
-            title=job.title,
-            description=job.description,
-            category=job.category,
-            skills_required=job.skills_required or [],
-            tags=job.tags or [],
-            budget=job.budget,
-            deadline=job.deadline,
-            status=JobStatus(job.status),
-            ipfs_hash=job.ipfs_hash,
-            blockchain_job_id=job.blockchain_job_id,
-            deliverable_url=job.deliverable_url,
-            client_confirmed_completion=bool(job.client_confirmed_completion) if job.client_confirmed_completion is not None else False,
-            freelancer_confirmed_completion=bool(job.freelancer_confirmed_completion) if job.freelancer_confirmed_completion is not None else False,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            proposal_count=job.proposal_count or 0,
-        )
+        return JobResponse.model_validate(job)
     
     except HTTPException:
         raise
@@ -925,7 +816,7 @@ async def update_job(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{job_id}")
-async def delete_job(
+def delete_job(
     job_id: str,
     client_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -950,6 +841,8 @@ async def delete_job(
         
         db.delete(job)
         db.commit()
+        search_service.delete_job(job_id)
+        recommendation_service.remove_job(job_id)
         
         return {"message": "Job deleted successfully"}
     
@@ -961,7 +854,7 @@ async def delete_job(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/confirm-completion/client")
-async def client_confirm_completion(
+def client_confirm_completion(
     job_id: str,
     client_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -1057,6 +950,8 @@ async def client_confirm_completion(
                                     # Return submit transaction for freelancer to sign
                                     # Note: Deliverables are optional - can be shared via chat (git link, etc.)
                                     db.commit()
+                                    search_service.sync_job(job)
+                                    recommendation_service.sync_job(job)
                                     return {
                                         "message": "Both parties confirmed! Please sign the submit transaction to finalize on blockchain. (Deliverables are optional - can be shared via chat)",
                                         "both_confirmed": True,
@@ -1110,6 +1005,8 @@ async def client_confirm_completion(
                                     accept_transaction['gas'] = int(estimated_gas * 1.2)
                                     
                                     db.commit()
+                                    search_service.sync_job(job)
+                                    recommendation_service.sync_job(job)
                                     return {
                                         "message": "Job needs to be accepted on blockchain first, then submitted, then payment can be released.",
                                         "both_confirmed": True,
@@ -1142,6 +1039,8 @@ async def client_confirm_completion(
                     if blockchain_job.get('fundsReleased', False):
                         logger.warning(f"Funds already released for job {job.blockchain_job_id}")
                         db.commit()
+                        search_service.sync_job(job)
+                        recommendation_service.sync_job(job)
                         return {
                             "message": "Payment already released for this job.",
                             "both_confirmed": True,
@@ -1176,6 +1075,8 @@ async def client_confirm_completion(
                     
                     # Return transaction for frontend to sign
                     db.commit()
+                    search_service.sync_job(job)
+                    recommendation_service.sync_job(job)
                     return {
                         "message": "Both parties confirmed! Please sign the transaction to release payment.",
                         "both_confirmed": True,
@@ -1190,6 +1091,8 @@ async def client_confirm_completion(
                     logger.error(f"Error building blockchain transaction: {e}", exc_info=True)
                     # Continue without blockchain - job is still marked as completed
                     db.commit()
+                    search_service.sync_job(job)
+                    recommendation_service.sync_job(job)
                     return {
                         "message": f"Both parties confirmed, but blockchain transaction failed: {str(e)}. Job marked as completed in database.",
                         "both_confirmed": True,
@@ -1198,6 +1101,8 @@ async def client_confirm_completion(
                     }
         
         db.commit()
+        search_service.sync_job(job)
+        recommendation_service.sync_job(job)
         
         return {
             "message": "Completion confirmed. Waiting for freelancer confirmation.",
@@ -1214,7 +1119,7 @@ async def client_confirm_completion(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/confirm-completion/freelancer")
-async def freelancer_confirm_completion(
+def freelancer_confirm_completion(
     job_id: str,
     freelancer_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -1296,6 +1201,8 @@ async def freelancer_confirm_completion(
                                     
                                     # Return submit transaction for freelancer to sign first
                                     db.commit()
+                                    search_service.sync_job(job)
+                                    recommendation_service.sync_job(job)
                                     return {
                                         "message": "Work needs to be submitted on blockchain first. Please sign the submit transaction, then payment can be released.",
                                         "both_confirmed": True,
@@ -1310,6 +1217,8 @@ async def freelancer_confirm_completion(
                                 except Exception as submit_error:
                                     logger.error(f"Failed to build submit transaction: {submit_error}")
                                     db.commit()
+                                    search_service.sync_job(job)
+                                    recommendation_service.sync_job(job)
                                     return {
                                         "message": "Job needs to be submitted on blockchain first. Please submit work before confirming completion.",
                                         "both_confirmed": True,
@@ -1321,6 +1230,8 @@ async def freelancer_confirm_completion(
                             else:
                                 logger.warning(f"Job {job.blockchain_job_id} is in InProgress, needs to be submitted first")
                                 db.commit()
+                                search_service.sync_job(job)
+                                recommendation_service.sync_job(job)
                                 return {
                                     "message": "Job needs to be submitted on blockchain first. Please submit work before confirming completion.",
                                     "both_confirmed": True,
@@ -1349,6 +1260,8 @@ async def freelancer_confirm_completion(
                                     accept_transaction['gas'] = int(estimated_gas * 1.2)
                                     
                                     db.commit()
+                                    search_service.sync_job(job)
+                                    recommendation_service.sync_job(job)
                                     return {
                                         "message": "Job needs to be accepted on blockchain first, then submitted, then payment can be released.",
                                         "both_confirmed": True,
@@ -1364,6 +1277,8 @@ async def freelancer_confirm_completion(
                                 except Exception as accept_error:
                                     logger.error(f"Failed to build accept transaction: {accept_error}")
                                     db.commit()
+                                    search_service.sync_job(job)
+                                    recommendation_service.sync_job(job)
                                     return {
                                         "message": f"Job is in '{blockchain_status}' status on blockchain. Freelancer must accept the job first, then submit work, before payment can be released.",
                                         "both_confirmed": True,
@@ -1382,6 +1297,8 @@ async def freelancer_confirm_completion(
                     if blockchain_job.get('fundsReleased', False):
                         logger.warning(f"Funds already released for job {job.blockchain_job_id}")
                         db.commit()
+                        search_service.sync_job(job)
+                        recommendation_service.sync_job(job)
                         return {
                             "message": "Payment already released for this job.",
                             "both_confirmed": True,
@@ -1416,6 +1333,8 @@ async def freelancer_confirm_completion(
                     
                     # Return transaction for frontend to sign
                     db.commit()
+                    search_service.sync_job(job)
+                    recommendation_service.sync_job(job)
                     return {
                         "message": "Both parties confirmed! Client needs to sign transaction to release payment.",
                         "both_confirmed": True,
@@ -1430,6 +1349,8 @@ async def freelancer_confirm_completion(
                     logger.error(f"Error building blockchain transaction: {e}", exc_info=True)
                     # Continue without blockchain - job is still marked as completed
                     db.commit()
+                    search_service.sync_job(job)
+                    recommendation_service.sync_job(job)
                     return {
                         "message": f"Both parties confirmed, but blockchain transaction failed: {str(e)}. Job marked as completed in database.",
                         "both_confirmed": True,
@@ -1438,6 +1359,8 @@ async def freelancer_confirm_completion(
                     }
         
         db.commit()
+        search_service.sync_job(job)
+        recommendation_service.sync_job(job)
         
         return {
             "message": "Completion confirmed. Waiting for client confirmation.",
@@ -1454,7 +1377,7 @@ async def freelancer_confirm_completion(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/escrow/pending")
-async def get_escrow_pending_jobs(
+def get_escrow_pending_jobs(
     escrow_address: str = Query(...),
     db: Session = Depends(get_db)
 ):
@@ -1537,7 +1460,7 @@ async def get_escrow_pending_jobs(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/escrow/release")
-async def escrow_release_payment(
+def escrow_release_payment(
     job_id: str,
     escrow_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -1641,7 +1564,7 @@ async def escrow_release_payment(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/escrow/revert")
-async def escrow_revert_payment(
+def escrow_revert_payment(
     job_id: str,
     escrow_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -1710,6 +1633,8 @@ async def escrow_revert_payment(
             # Update job status in database
             job.status = "refunded"
             db.commit()
+            search_service.sync_job(job)
+            recommendation_service.sync_job(job)
             
             logger.info(f"✅ Built cancelJob transaction for escrow revert on job {job.blockchain_job_id}")
             
@@ -1739,7 +1664,7 @@ async def escrow_revert_payment(
 @router.get("/escrow/check")
 async def check_is_escrow(
     escrow_address: str = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Check if an address is the designated escrow address.
@@ -1754,7 +1679,9 @@ async def check_is_escrow(
         is_designated_escrow = escrow_address_lower == designated_escrow
         
         # Also get job count for info purposes
-        count = db.query(Job).filter(Job.escrow_address == escrow_address_lower).count()
+        count = (await db.execute(
+            select(func.count()).select_from(Job).where(Job.escrow_address == escrow_address_lower)
+        )).scalar_one()
         
         return {
             "is_escrow": is_designated_escrow,
@@ -1768,7 +1695,7 @@ async def check_is_escrow(
 @router.get("/saved/{user_address}", response_model=List[JobResponse])
 async def get_saved_jobs(
     user_address: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get all saved jobs for a user
@@ -1776,47 +1703,20 @@ async def get_saved_jobs(
     try:
         user_address_lower = user_address.lower()
         
-        # Get all saved jobs for this user
-        saved_jobs = db.query(SavedJob).filter(
-            SavedJob.user_address == user_address_lower
-        ).all()
-        
-        # Get the actual job details
-        job_ids = [saved_job.job_id for saved_job in saved_jobs]
-        jobs = db.query(Job).filter(Job.id.in_(job_ids)).all()
-        
-        return [
-            JobResponse(
-                id=job.id,
-                client_address=job.client_address,
-                freelancer_address=job.freelancer_address,
-                title=job.title,
-                description=job.description,
-                category=job.category,
-                skills_required=job.skills_required or [],
-                tags=job.tags or [],
-                budget=job.budget,
-                deadline=job.deadline,
-                status=JobStatus(job.status),
-                ipfs_hash=job.ipfs_hash,
-                blockchain_job_id=job.blockchain_job_id,
-                deliverable_url=job.deliverable_url,
-                client_confirmed_completion=bool(job.client_confirmed_completion) if job.client_confirmed_completion is not None else False,
-                freelancer_confirmed_completion=bool(job.freelancer_confirmed_completion) if job.freelancer_confirmed_completion is not None else False,
-                escrow_address=job.escrow_address,
-                allow_escrow_revert=bool(job.allow_escrow_revert) if job.allow_escrow_revert is not None else False,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-                proposal_count=job.proposal_count or 0,
+        # Get the job details of every job this user saved
+        jobs = (await db.execute(
+            select(*JOB_RESPONSE_COLUMNS).where(
+                Job.id.in_(select(SavedJob.job_id).where(SavedJob.user_address == user_address_lower))
             )
-            for job in jobs
-        ]
+        )).all()
+        
+        return render_jobs(jobs)
     except Exception as e:
         logger.error(f"Error getting saved jobs: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/{job_id}/repair-freelancer", response_model=JobResponse)
-async def repair_job_freelancer(
+def repair_job_freelancer(
     job_id: str,
     db: Session = Depends(get_db)
 ):
@@ -1856,28 +1756,10 @@ async def repair_job_freelancer(
             if status_changed:
                 job.updated_at = datetime.utcnow()
                 db.commit()
+                search_service.sync_job(job)
+                recommendation_service.sync_job(job)
                 db.refresh(job)
-            return JobResponse(
-                id=job.id,
-                client_address=job.client_address,
-                freelancer_address=job.freelancer_address,
-                title=job.title,
-                description=job.description,
-                category=job.category,
-                skills_required=job.skills_required or [],
-                tags=job.tags or [],
-                budget=job.budget,
-                deadline=job.deadline,
-                status=JobStatus(job.status),
-                ipfs_hash=job.ipfs_hash,
-                blockchain_job_id=job.blockchain_job_id,
-                deliverable_url=job.deliverable_url,
-                client_confirmed_completion=bool(job.client_confirmed_completion) if job.client_confirmed_completion is not None else False,
-                freelancer_confirmed_completion=bool(job.freelancer_confirmed_completion) if job.freelancer_confirmed_completion is not None else False,
-                created_at=job.created_at,
-                updated_at=job.updated_at,
-                proposal_count=job.proposal_count or 0,
-            )
+            return JobResponse.model_validate(job)
         
         # Find accepted proposal for this job
         proposals = db.query(Proposal).filter(
@@ -1914,31 +1796,13 @@ async def repair_job_freelancer(
         job.updated_at = datetime.utcnow()
         
         db.commit()
+        search_service.sync_job(job)
+        recommendation_service.sync_job(job)
         db.refresh(job)
         
         logger.info(f"✅ Repaired job {job_id}: assigned freelancer {freelancer_address_lower}, status: {job.status}")
         
-        return JobResponse(
-            id=job.id,
-            client_address=job.client_address,
-            freelancer_address=job.freelancer_address,
-            title=job.title,
-            description=job.description,
-            category=job.category,
-            skills_required=job.skills_required or [],
-            tags=job.tags or [],
-            budget=job.budget,
-            deadline=job.deadline,
-            status=JobStatus(job.status),
-            ipfs_hash=job.ipfs_hash,
-            blockchain_job_id=job.blockchain_job_id,
-            deliverable_url=job.deliverable_url,
-            client_confirmed_completion=bool(job.client_confirmed_completion) if job.client_confirmed_completion is not None else False,
-            freelancer_confirmed_completion=bool(job.freelancer_confirmed_completion) if job.freelancer_confirmed_completion is not None else False,
-            created_at=job.created_at,
-            updated_at=job.updated_at,
-            proposal_count=job.proposal_count or 0,
-        )
+        return JobResponse.model_validate(job)
     
     except HTTPException:
         raise
@@ -1951,26 +1815,28 @@ async def repair_job_freelancer(
 async def save_job(
     job_id: str,
     user_address: str = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Save a job for a user
     """
     try:
         # Check if job exists
-        job = db.query(Job).filter(Job.id == job_id).first()
+        job = await db.get(Job, job_id)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
         user_address_lower = user_address.lower()
         
         # Check if already saved
-        existing = db.query(SavedJob).filter(
-            and_(
-                SavedJob.user_address == user_address_lower,
-                SavedJob.job_id == job_id
+        existing = (await db.execute(
+            select(SavedJob).where(
+                and_(
+                    SavedJob.user_address == user_address_lower,
+                    SavedJob.job_id == job_id
+                )
             )
-        ).first()
+        )).scalars().first()
         
         if existing:
             raise HTTPException(status_code=400, detail="Job is already saved")
@@ -1983,21 +1849,21 @@ async def save_job(
         )
         
         db.add(saved_job)
-        db.commit()
+        await db.commit()
         
         return {"message": "Job saved successfully", "job_id": job_id}
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error saving job: {e}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{job_id}/save")
 async def unsave_job(
     job_id: str,
     user_address: str = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Unsave a job for a user
@@ -2006,23 +1872,25 @@ async def unsave_job(
         user_address_lower = user_address.lower()
         
         # Find and delete saved job entry
-        saved_job = db.query(SavedJob).filter(
-            and_(
-                SavedJob.user_address == user_address_lower,
-                SavedJob.job_id == job_id
+        saved_job = (await db.execute(
+            select(SavedJob).where(
+                and_(
+                    SavedJob.user_address == user_address_lower,
+                    SavedJob.job_id == job_id
+                )
             )
-        ).first()
+        )).scalars().first()
         
         if not saved_job:
             raise HTTPException(status_code=404, detail="Job is not saved")
         
-        db.delete(saved_job)
-        db.commit()
+        await db.delete(saved_job)
+        await db.commit()
         
         return {"message": "Job removed from saved", "job_id": job_id}
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error unsaving job: {e}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
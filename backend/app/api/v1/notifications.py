@@ -4,12 +4,12 @@ Notification endpoints
 
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, func, select, update
 import logging
 
 from app.models import NotificationResponse, NotificationCountResponse
-from app.database import get_db, Notification
+from app.database import get_async_db, Notification
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -19,18 +19,19 @@ async def get_notifications(
     user_address: str = Query(...),
     unread_only: bool = Query(False, description="Filter to unread notifications only"),
     limit: int = Query(50, le=100, description="Maximum number of notifications"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get notifications for a user"""
     try:
-        query = db.query(Notification).filter(
+        query = select(Notification).where(
             Notification.user_address == user_address.lower()
         )
         
         if unread_only:
-            query = query.filter(Notification.is_read == False)
+            query = query.where(Notification.is_read == False)
         
-        notifications = query.order_by(desc(Notification.created_at)).limit(limit).all()
+        result = await db.execute(query.order_by(desc(Notification.created_at)).limit(limit))
+        notifications = result.scalars().all()
         
         return [
             NotificationResponse(
@@ -53,18 +54,17 @@ async def get_notifications(
 @router.get("/count", response_model=NotificationCountResponse)
 async def get_notification_count(
     user_address: str = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get notification count for a user"""
     try:
-        total_count = db.query(Notification).filter(
-            Notification.user_address == user_address.lower()
-        ).count()
-        
-        unread_count = db.query(Notification).filter(
-            Notification.user_address == user_address.lower(),
-            Notification.is_read == False
-        ).count()
+        result = await db.execute(
+            select(
+                func.count(),
+                func.count().filter(Notification.is_read == False)
+            ).where(Notification.user_address == user_address.lower())
+        )
+        total_count, unread_count = result.one()
         
         return NotificationCountResponse(
             unread_count=unread_count,
@@ -78,46 +78,51 @@ async def get_notification_count(
 async def mark_notification_read(
     notification_id: str,
     user_address: str = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Mark a notification as read"""
     try:
-        notification = db.query(Notification).filter(
-            Notification.id == notification_id,
-            Notification.user_address == user_address.lower()
-        ).first()
+        result = await db.execute(
+            select(Notification).where(
+                Notification.id == notification_id,
+                Notification.user_address == user_address.lower()
+            )
+        )
+        notification = result.scalars().first()
         
         if not notification:
             raise HTTPException(status_code=404, detail="Notification not found")
         
         notification.is_read = True
-        db.commit()
+        await db.commit()
         
         return {"message": "Notification marked as read", "notification_id": notification_id}
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Error marking notification as read: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/read-all")
 async def mark_all_notifications_read(
     user_address: str = Query(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Mark all notifications as read for a user"""
     try:
-        db.query(Notification).filter(
-            Notification.user_address == user_address.lower(),
-            Notification.is_read == False
-        ).update({"is_read": True})
+        await db.execute(
+            update(Notification).where(
+                Notification.user_address == user_address.lower(),
+                Notification.is_read == False
+            ).values(is_read=True)
+        )
         
-        db.commit()
+        await db.commit()
         
         return {"message": "All notifications marked as read"}
     except Exception as e:
         logger.error(f"Error marking all notifications as read: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -5,21 +5,25 @@ Proposal endpoints with PostgreSQL
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from datetime import datetime
 import uuid
 import logging
 
 from app.models import ProposalCreate, ProposalResponse, ProposalStatus
-from app.database import get_db, Proposal, Job, User
+from app.database import get_db, get_async_db, Proposal, Job, User
 from app.services.notification import notification_service
 from app.services.blockchain import blockchain_service
+from app.services.search import search_service
+from app.services.recommendation import recommendation_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.post("/", response_model=ProposalResponse)
-async def create_proposal(
+def create_proposal(
     proposal: ProposalCreate,
     freelancer_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -67,6 +71,7 @@ async def create_proposal(
         
         db.commit()
         db.refresh(db_proposal)
+        search_service.sync_job(job)
         
         # Notify job owner about new proposal
         try:
@@ -99,10 +104,12 @@ async def create_proposal(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/job/{job_id}", response_model=List[ProposalResponse])
-async def get_job_proposals(job_id: str, db: Session = Depends(get_db)):
+async def get_job_proposals(job_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get all proposals for a job"""
     try:
-        proposals = db.query(Proposal).filter(Proposal.job_id == job_id).all()
+        proposals = (await db.execute(
+            select(Proposal).where(Proposal.job_id == job_id)
+        )).scalars().all()
         
         proposal_list = []
         for proposal in proposals:
@@ -125,12 +132,14 @@ async def get_job_proposals(job_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/freelancer/{freelancer_address}", response_model=List[ProposalResponse])
-async def get_freelancer_proposals(freelancer_address: str, db: Session = Depends(get_db)):
+async def get_freelancer_proposals(freelancer_address: str, db: AsyncSession = Depends(get_async_db)):
     """Get all proposals submitted by a freelancer"""
     try:
-        proposals = db.query(Proposal).filter(
-            Proposal.freelancer_address == freelancer_address.lower()
-        ).all()
+        proposals = (await db.execute(
+            select(Proposal).where(
+                Proposal.freelancer_address == freelancer_address.lower()
+            )
+        )).scalars().all()
         
         proposal_list = []
         for proposal in proposals:
@@ -153,10 +162,10 @@ async def get_freelancer_proposals(freelancer_address: str, db: Session = Depend
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{proposal_id}", response_model=ProposalResponse)
-async def get_proposal(proposal_id: str, db: Session = Depends(get_db)):
+async def get_proposal(proposal_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get a single proposal by ID"""
     try:
-        proposal = db.query(Proposal).filter(Proposal.id == proposal_id).first()
+        proposal = await db.get(Proposal, proposal_id)
         
         if not proposal:
             raise HTTPException(status_code=404, detail="Proposal not found")
@@ -180,7 +189,7 @@ async def get_proposal(proposal_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{proposal_id}/accept")
-async def accept_proposal(
+def accept_proposal(
     proposal_id: str, 
     client_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -223,17 +232,35 @@ async def accept_proposal(
         
         db.commit()
         db.refresh(job)  # Refresh to ensure changes are visible
+        search_service.sync_job(job)
+        recommendation_service.sync_job(job)
+        
+        blockchain_job_id = job.blockchain_job_id
+        freelancer_address = proposal.freelancer_address
+        
+        # Notify freelancer about accepted proposal
+        try:
+            notification_service.notify_proposal_accepted(
+                db=db,
+                proposal_id=proposal_id,
+                job_id=proposal.job_id
+            )
+        except Exception as e:
+            logger.warning(f"Failed to send acceptance notification: {e}")
+        
+        # Hand the connection back before the RPC round trips below
+        db.close()
         
         # Build blockchain transaction if job has blockchain_job_id
         blockchain_tx = None
-        if job.blockchain_job_id and blockchain_service.contract:
+        if blockchain_job_id and blockchain_service.contract:
             try:
                 contract = blockchain_service.contract
-                function_call = contract.functions.acceptJob(job.blockchain_job_id)
+                function_call = contract.functions.acceptJob(blockchain_job_id)
                 
                 transaction = function_call.build_transaction({
-                    'from': proposal.freelancer_address,
-                    'nonce': blockchain_service.w3.eth.get_transaction_count(proposal.freelancer_address),
+                    'from': freelancer_address,
+                    'nonce': blockchain_service.w3.eth.get_transaction_count(freelancer_address),
                     'gasPrice': blockchain_service.w3.eth.gas_price,
                     'chainId': blockchain_service.w3.eth.chain_id,
                 })
@@ -247,20 +274,10 @@ async def accept_proposal(
                     "chain_id": blockchain_service.w3.eth.chain_id,
                     "contract_address": blockchain_service.contract_address
                 }
-                logger.info(f"✅ Built blockchain acceptJob transaction for job {job.blockchain_job_id}")
+                logger.info(f"✅ Built blockchain acceptJob transaction for job {blockchain_job_id}")
             except Exception as e:
                 logger.warning(f"Could not build blockchain transaction: {e}")
         
-        # Notify freelancer about accepted proposal
-        try:
-            notification_service.notify_proposal_accepted(
-                db=db,
-                proposal_id=proposal_id,
-                job_id=proposal.job_id
-            )
-        except Exception as e:
-            logger.warning(f"Failed to send acceptance notification: {e}")
-        
         return {
             "message": "Proposal accepted", 
             "proposal_id": proposal_id,
@@ -275,7 +292,7 @@ async def accept_proposal(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{proposal_id}/reject")
-async def reject_proposal(proposal_id: str, db: Session = Depends(get_db)):
+def reject_proposal(proposal_id: str, db: Session = Depends(get_db)):
     """Reject a proposal"""
     try:
         proposal = db.query(Proposal).filter(Proposal.id == proposal_id).first()
@@ -306,7 +323,7 @@ async def reject_proposal(proposal_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/{proposal_id}/withdraw")
-async def withdraw_proposal(
+def withdraw_proposal(
     proposal_id: str,
     freelancer_address: str = Query(...),
     db: Session = Depends(get_db)
@@ -337,6 +354,8 @@ async def withdraw_proposal(
         # Delete the proposal
         db.delete(proposal)
         db.commit()
+        if job:
+            search_service.sync_job(job)
         
         return {"message": "Proposal withdrawn successfully", "proposal_id": proposal_id}
     
@@ -0,0 +1,83 @@
+"""
+Saved search endpoints
+"""
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import List
+from sqlalchemy.orm import Session
+from sqlalchemy import desc
+import logging
+
+from app.models import SavedSearchCreate, SavedSearchResponse
+from app.database import get_db, SavedSearch
+from app.services.saved_search import saved_search_service
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.post("/", response_model=SavedSearchResponse)
+def create_saved_search(
+    saved_search: SavedSearchCreate,
+    user_address: str = Query(...),
+    db: Session = Depends(get_db)
+):
+    """Save a search to be notified when new jobs match it"""
+    try:
+        db_saved_search = saved_search_service.create_saved_search(
+            db,
+            user_address=user_address,
+            name=saved_search.name,
+            query=saved_search.query,
+            tags=saved_search.tags,
+            category=saved_search.category
+        )
+        return SavedSearchResponse.model_validate(db_saved_search)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error creating saved search: {e}")
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/", response_model=List[SavedSearchResponse])
+def get_saved_searches(
+    user_address: str = Query(...),
+    db: Session = Depends(get_db)
+):
+    """Get a user's saved searches"""
+    try:
+        saved_searches = db.query(SavedSearch).filter(
+            SavedSearch.user_address == user_address.lower()
+        ).order_by(desc(SavedSearch.created_at)).all()
+        
+        return [SavedSearchResponse.model_validate(s) for s in saved_searches]
+    except Exception as e:
+        logger.error(f"Error getting saved searches: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.delete("/{saved_search_id}")
+def delete_saved_search(
+    saved_search_id: str,
+    user_address: str = Query(...),
+    db: Session = Depends(get_db)
+):
+    """Delete a saved search"""
+    try:
+        saved_search = db.query(SavedSearch).filter(
+            SavedSearch.id == saved_search_id,
+            SavedSearch.user_address == user_address.lower()
+        ).first()
+        
+        if not saved_search:
+            raise HTTPException(status_code=404, detail="Saved search not found")
+        
+        db.delete(saved_search)
+        db.commit()
+        
+        return {"message": "Saved search deleted"}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error deleting saved search: {e}")
+        db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
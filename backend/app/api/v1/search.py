@@ -4,79 +4,135 @@ Search endpoints using Redis
 
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
+from datetime import datetime, timedelta, timezone
 import logging
 
 from app.models import JobResponse
-from app.database import SessionLocal, Job
+from app.database import SessionLocal
 from app.services.search import search_service
+from app.services.search_postgres import get_search_backend
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.get("/jobs")
-async def search_jobs(
+def search_jobs(
     q: Optional[str] = Query(None, description="Search query"),
     tags: Optional[List[str]] = Query(None, description="Filter by tags"),
     category: Optional[str] = Query(None, description="Filter by category"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    limit: int = Query(50, le=100, description="Maximum number of results")
+    limit: int = Query(50, le=100, description="Maximum number of results"),
+    sort: Optional[str] = Query(
+        None,
+        pattern="^(relevance|budget_asc|budget_desc|deadline_asc|deadline_desc)$",
+        description="Sort order (relevance, budget_asc, budget_desc, deadline_asc, deadline_desc)"
+    ),
+    offset: int = Query(0, ge=0, description="Number of ranked results to skip"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    fuzzy: bool = Query(True, description="Correct misspelled search terms"),
+    min_budget: Optional[float] = Query(None, ge=0, description="Minimum budget"),
+    max_budget: Optional[float] = Query(None, ge=0, description="Maximum budget"),
+    deadline_within_days: Optional[int] = Query(None, ge=0, description="Only jobs due within this many days")
 ):
     """
-    Search for jobs using Redis
+    Search for jobs using the configured search backend (Redis or PostgreSQL)
     """
+    deadline_after = deadline_before = None
+    if deadline_within_days is not None:
+        # Whole minutes, so the pages of one listing share the same window
+        deadline_after = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        deadline_before = deadline_after + timedelta(days=deadline_within_days)
+    
     try:
-        # Search using Redis
-        job_ids = search_service.search_jobs(
+        page = get_search_backend().search_jobs_page(
             query=q,
             tags=tags,
             category=category,
             status=status,
-            limit=limit
+            limit=limit,
+            sort=sort,
+            offset=offset,
+            cursor=cursor,
+            fuzzy=fuzzy,
+            min_budget=min_budget,
+            max_budget=max_budget,
+            deadline_after=deadline_after,
+            deadline_before=deadline_before
         )
+        job_ids = page["job_ids"]
+        
+        # Hydrate from the Redis job cache, PostgreSQL only for misses
+        documents = search_service.hydrate_jobs(job_ids, SessionLocal)
+        job_list = [JobResponse(**document) for document in documents]
         
-        # Fetch full job data from PostgreSQL
-        db = SessionLocal()
-        try:
-            jobs = db.query(Job).filter(Job.id.in_(job_ids)).all()
-            
-            job_list = []
-            for job in jobs:
-                job_data = {
-                    "id": job.id,
-                    "client_address": job.client_address,
-                    "freelancer_address": job.freelancer_address,
-                    "title": job.title,
-                    "description": job.description,
-                    "category": job.category,
-                    "skills_required": job.skills_required or [],
-                    "tags": job.tags or [],
-                    "budget": job.budget,
-                    "deadline": job.deadline,
-                    "status": job.status,
-                    "ipfs_hash": job.ipfs_hash,
-                    "blockchain_job_id": job.blockchain_job_id,
-                    "deliverable_url": job.deliverable_url,
-                    "created_at": job.created_at,
-                    "updated_at": job.updated_at,
-                    "proposal_count": job.proposal_count or 0,
-                }
-                job_list.append(JobResponse(**job_data))
-            
-            return {"jobs": job_list, "count": len(job_list)}
-        finally:
-            db.close()
+        return {
+            "jobs": job_list,
+            "count": len(job_list),
+            "next_cursor": page["next_cursor"],
+            "corrections": page["corrections"],
+        }
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error searching jobs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/facets")
+def get_facets(
+    q: Optional[str] = Query(None, description="Search query"),
+    tags: Optional[List[str]] = Query(None, description="Filter by tags"),
+    category: Optional[str] = Query(None, description="Filter by category"),
+    status: Optional[str] = Query(None, description="Filter by status"),
+    tag_limit: int = Query(50, ge=1, le=500, description="Maximum number of tag counts")
+):
+    """
+    Count matching jobs per tag, category and status for a search
+    """
+    try:
+        return get_search_backend().facets(query=q, tags=tags, category=category, status=status, tag_limit=tag_limit)
+    except Exception as e:
+        logger.error(f"Error getting facets: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/suggest")
+def suggest(
+    q: str = Query(..., min_length=1, description="Text typed so far"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions")
+):
+    """Autocomplete titles, skills and tags, most popular first"""
+    try:
+        return {"suggestions": get_search_backend().suggest(q, limit)}
+    except Exception as e:
+        logger.error(f"Error getting suggestions: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/cache/metrics")
+def get_cache_metrics():
+    """Search result cache hit/miss counts and ratios"""
+    try:
+        return search_service.cache_metrics()
+    except Exception as e:
+        logger.error(f"Error getting search cache metrics: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/tags")
-async def get_tags():
-    """Get all available tags"""
+def get_tags(
+    prefix: Optional[str] = Query(None, description="Only tags starting with this text"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of tags"),
+    offset: int = Query(0, ge=0, description="Number of tags to skip")
+):
+    """Get available tags, most used first, with the number of jobs carrying each"""
     try:
-        tags = search_service.get_all_tags()
-        return {"tags": tags}
+        page = get_search_backend().popular_tags(prefix=prefix, offset=offset, limit=limit)
+        next_offset = offset + limit if offset + limit < page["total"] else None
+        return {
+            "tags": [entry["tag"] for entry in page["tags"]],
+            "counts": {entry["tag"]: entry["count"] for entry in page["tags"]},
+            "total": page["total"],
+            "next_offset": next_offset,
+        }
     except Exception as e:
         logger.error(f"Error getting tags: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2,20 +2,24 @@
 User endpoints with PostgreSQL
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, or_, select
+import asyncio
 import logging
 import traceback
 
-from app.models import UserCreate, UserProfile, UserRole
-from app.database import get_db, User, Job
+from app.models import UserCreate, UserProfile, UserRole, JobResponse, JobStatus
+from app.database import get_async_db, User, Job, SessionLocal
+from app.services.recommendation import recommendation_service
+from app.services.search import search_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.post("/", response_model=UserProfile)
-async def create_user(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
     """
     Create new user profile
     Uses wallet_address as primary key
@@ -25,7 +29,7 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
         wallet_address = user.wallet_address.lower()
         
         # Check if user exists
-        existing_user = db.query(User).filter(User.wallet_address == wallet_address).first()
+        existing_user = await db.get(User, wallet_address)
         if existing_user:
             # Return existing user instead of error
             return UserProfile(
@@ -65,8 +69,8 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
         )
         
         db.add(db_user)
-        db.commit()
-        db.refresh(db_user)
+        await db.commit()
+        await db.refresh(db_user)
         
         return UserProfile(
             wallet_address=db_user.wallet_address,
@@ -86,18 +90,18 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Error creating user: {e}\n{traceback.format_exc()}")
         raise HTTPException(status_code=500, detail=f"Failed to create user: {str(e)}")
 
 @router.get("/{wallet_address}", response_model=UserProfile)
-async def get_user(wallet_address: str, db: Session = Depends(get_db)):
+async def get_user(wallet_address: str, db: AsyncSession = Depends(get_async_db)):
     """
     Get user profile by wallet address
     Wallet address is the primary key
     """
     try:
-        user = db.query(User).filter(User.wallet_address == wallet_address.lower()).first()
+        user = await db.get(User, wallet_address.lower())
         
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
@@ -126,11 +130,11 @@ async def get_user(wallet_address: str, db: Session = Depends(get_db)):
 async def update_user(
     wallet_address: str,
     updates: dict,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update user profile"""
     try:
-        user = db.query(User).filter(User.wallet_address == wallet_address.lower()).first()
+        user = await db.get(User, wallet_address.lower())
         
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
@@ -145,8 +149,11 @@ async def update_user(
                 else:
                     setattr(user, key, value)
         
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
+        
+        # Recommendations depend on the profile's skills
+        recommendation_service.invalidate_user(user.wallet_address)
         
         return UserProfile(
             wallet_address=user.wallet_address,
@@ -166,24 +173,75 @@ async def update_user(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{wallet_address}/stats")
-async def get_user_stats(wallet_address: str, db: Session = Depends(get_db)):
+async def get_user_stats(wallet_address: str, db: AsyncSession = Depends(get_async_db)):
     """Get user statistics based on wallet address"""
     try:
-        # Get jobs as client
-        client_jobs = db.query(Job).filter(Job.client_address == wallet_address.lower()).all()
+        wallet_address = wallet_address.lower()
         
-        # Get jobs as freelancer
-        freelancer_jobs = db.query(Job).filter(Job.freelancer_address == wallet_address.lower()).all()
+        # Jobs as client, jobs as freelancer and completed freelancer jobs in one pass
+        result = await db.execute(
+            select(
+                func.count().filter(Job.client_address == wallet_address),
+                func.count().filter(Job.freelancer_address == wallet_address),
+                func.count().filter(Job.freelancer_address == wallet_address, Job.status == "completed")
+            ).where(
+                or_(Job.client_address == wallet_address, Job.freelancer_address == wallet_address)
+            )
+        )
+        client_jobs, freelancer_jobs, completed_jobs = result.one()
         
         return {
-            "jobs_posted": len(client_jobs),
-            "jobs_completed": len([j for j in freelancer_jobs if j.status == "completed"]),
-            "total_jobs": len(client_jobs) + len(freelancer_jobs)
+            "jobs_posted": client_jobs,
+            "jobs_completed": completed_jobs,
+            "total_jobs": client_jobs + freelancer_jobs
         }
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/{wallet_address}/recommendations")
+async def get_recommendations(
+    wallet_address: str,
+    limit: int = Query(20, ge=1, le=50, description="Maximum number of jobs"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Open jobs ranked by how well their required skills match the user's skills"""
+    try:
+        user = await db.get(User, wallet_address.lower())
+        
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        
+        # Scoring and hydration are synchronous (Redis, matrix rebuilds), so run off the event loop
+        recommendations = await asyncio.to_thread(
+            recommendation_service.recommend, user.wallet_address, user.skills or [], SessionLocal
+        )
+        scores = dict(recommendations)
+        candidates = list(scores)
+        
+        # Cached lists can hold jobs that were assigned since, so filter on fresh
+        # documents, hydrating further candidates until the page is full
+        jobs = []
+        chunk = limit * 2
+        for start in range(0, len(candidates), chunk):
+            documents = await asyncio.to_thread(search_service.hydrate_jobs, candidates[start:start + chunk], SessionLocal)
+            jobs.extend(
+                {"job": JobResponse(**document), "score": round(scores[document['id']], 4)}
+                for document in documents
+                if document['status'] == JobStatus.OPEN.value and document['client_address'] != user.wallet_address
+            )
+            if len(jobs) >= limit:
+                break
+        jobs = jobs[:limit]
+        
+        return {"recommendations": jobs, "count": len(jobs)}
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting recommendations: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -35,11 +35,42 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str = "deskryptow"
     
+    # Connection pool, per engine and per worker process (the API runs a sync
+    # and an async engine). Connections are replaced after DB_POOL_RECYCLE
+    # seconds; a checkout waits up to DB_POOL_TIMEOUT seconds for a free one
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    
+    # Threads running the sync route handlers (writes, blockchain and IPFS calls)
+    # and their sync dependencies, per worker process. The sync engine lets up to
+    # this many connections be open at once (DB_POOL_SIZE plus enough overflow),
+    # so a handler thread never waits for a connection. Peak connections per
+    # worker: max(THREADPOOL_SIZE, DB_POOL_SIZE + DB_MAX_OVERFLOW) for the sync
+    # engine plus DB_POOL_SIZE + DB_MAX_OVERFLOW for the async one
+    THREADPOOL_SIZE: int = 40
+    
+    # Connect through PgBouncer in transaction pooling mode: no application-side
+    # pool (PgBouncer does the pooling) and no named prepared statement reuse
+    DB_PGBOUNCER: bool = False
+    
+    # Log every SQL statement (independent of DEBUG, it is very verbose)
+    SQL_ECHO: bool = False
+    
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     
+    # Search index compaction interval in seconds (0 disables)
+    SEARCH_COMPACTION_INTERVAL: int = 3600
+    
+    # Search engine: "redis" (inverted index), "postgres" (full-text search) or
+    # "memory" (in-process index, single worker only). PostgreSQL is also used
+    # whenever the Redis engine is selected but Redis is not connected
+    SEARCH_BACKEND: str = "redis"
+    
     # Blockchain - Polygon Amoy Testnet
     POLYGON_RPC_URL: str = "https://rpc-amoy.polygon.technology"
     CHAIN_ID: int = 80002
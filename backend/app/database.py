@@ -2,21 +2,73 @@
 Database connections: PostgreSQL and Redis
 """
 
-from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Boolean, Text, ARRAY, ForeignKey, UniqueConstraint
+from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Boolean, Text, ARRAY, ForeignKey, UniqueConstraint, Computed, Index, DDL, event
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, deferred
+from sqlalchemy.pool import Pool, QueuePool, AsyncAdaptedQueuePool, NullPool
 from sqlalchemy.sql import func
 from datetime import datetime
 import redis
-from typing import Optional
+from typing import Optional, Type
+import uuid
 
 from app.config import settings
+from app.services.pool_metrics import pool_metrics
 
 # PostgreSQL Setup
 DATABASE_URL = f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, echo=settings.DEBUG)
+def pool_options(pool_class: Type[Pool], name: str, min_connections: int = 0) -> dict:
+    """
+    Engine keyword arguments for the configured pooling mode
+    
+    Overflow is raised when needed so that min_connections can be checked
+    out at once.
+    """
+    if settings.DB_PGBOUNCER:
+        # PgBouncer owns the pool: open a (cheap, local) connection per checkout
+        return {"poolclass": pool_metrics.pool_class(NullPool, name)}
+    return {
+        "poolclass": pool_metrics.pool_class(pool_class, name),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": max(settings.DB_MAX_OVERFLOW, min_connections - settings.DB_POOL_SIZE),
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+# Used by the sync handlers, one session per threadpool thread at most
+engine = create_engine(
+    DATABASE_URL, echo=settings.SQL_ECHO, **pool_options(QueuePool, "sync", settings.THREADPOOL_SIZE)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async engine (asyncpg) for the request handlers that run on the event loop.
+# Objects stay loaded after commit so handlers can build responses without
+# another round trip; lazy relationship loads are not available on it.
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+# In transaction pooling mode consecutive statements can run on different
+# server connections, so asyncpg must not cache prepared statements and
+# must give each one a unique name
+ASYNC_CONNECT_ARGS = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+} if settings.DB_PGBOUNCER else {}
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    connect_args=ASYNC_CONNECT_ARGS,
+    **pool_options(AsyncAdaptedQueuePool, "async")
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+pool_metrics.register_engine("sync", engine)
+pool_metrics.register_engine("async", async_engine.sync_engine)
 Base = declarative_base()
 
 # Redis Setup
@@ -43,6 +95,21 @@ def get_redis() -> Optional[redis.Redis]:
     """Get Redis client"""
     return redis_client
 
+# Full-text search: text arrays are joined by an IMMUTABLE helper so they can
+# feed the generated search_vector column on jobs
+JOB_SEARCH_TEXT_FUNCTION = """
+CREATE OR REPLACE FUNCTION job_search_text(text[]) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE
+AS $$ SELECT coalesce(array_to_string($1, ' '), '') $$
+"""
+JOB_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', job_search_text(skills_required)), 'B') || "
+    "setweight(to_tsvector('english', job_search_text(tags)), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C') || "
+    "setweight(to_tsvector('english', coalesce(category, '')), 'D')"
+)
+
 # Database Models
 class User(Base):
     __tablename__ = "users"
@@ -69,16 +136,16 @@ class Job(Base):
     __tablename__ = "jobs"
     
     id = Column(String(36), primary_key=True, index=True)  # UUID
-    client_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=False, index=True)
-    freelancer_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=True, index=True)
+    client_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=False)
+    freelancer_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=True)
     title = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=False)
-    category = Column(String(100), nullable=False, index=True)
+    category = Column(String(100), nullable=False)
     skills_required = Column(ARRAY(String), default=[])
     tags = Column(ARRAY(String), default=[])  # New tags field
     budget = Column(Float, nullable=False)
     deadline = Column(DateTime(timezone=True), nullable=False)
-    status = Column(String(20), default="open", index=True)  # open, in_progress, submitted, completed, disputed, cancelled, refunded
+    status = Column(String(20), default="open")  # open, in_progress, submitted, completed, disputed, cancelled, refunded
     ipfs_hash = Column(String(255), nullable=True)
     blockchain_job_id = Column(Integer, nullable=True, index=True)
     deliverable_url = Column(String(500), nullable=True)
@@ -89,11 +156,42 @@ class Job(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     proposal_count = Column(Integer, default=0)
+    # Full-text search document (PostgreSQL search backend), weighted like the Redis index.
+    # Deferred so regular job queries do not load it
+    search_vector = deferred(Column(TSVECTOR, Computed(JOB_SEARCH_VECTOR, persisted=True)))
     
     # Relationships
     client = relationship("User", foreign_keys=[client_address], back_populates="jobs_posted")
     freelancer = relationship("User", foreign_keys=[freelancer_address], back_populates="jobs_accepted")
     proposals = relationship("Proposal", back_populates="job", cascade="all, delete-orphan")
+    
+    # Composite and partial indexes follow the hot query shapes, so listings are
+    # read in created_at order straight from the index (checked by
+    # scripts/check_query_plans.py). Leading columns also serve the equality lookups
+    __table_args__ = (
+        Index("ix_jobs_search_vector", "search_vector", postgresql_using="gin"),
+        # Listings page on (created_at, id), newest first (id breaks created_at ties)
+        Index("ix_jobs_created_at_id", created_at.desc(), id.desc()),
+        Index("ix_jobs_client_address_created_at_id", client_address, created_at.desc(), id.desc()),
+        Index("ix_jobs_freelancer_address_created_at_id", freelancer_address, created_at.desc(), id.desc()),
+        Index("ix_jobs_category_created_at_id", category, created_at.desc(), id.desc()),
+        Index("ix_jobs_status_created_at_id", status, created_at.desc(), id.desc()),
+        Index("ix_jobs_status_category_created_at_id", status, category, created_at.desc(), id.desc()),
+        # Escrow dashboard: jobs awaiting release, and open jobs the escrow may revert
+        Index(
+            "ix_jobs_escrow_confirmed",
+            escrow_address,
+            postgresql_where=(client_confirmed_completion == True) & (freelancer_confirmed_completion == True)
+        ),
+        Index(
+            "ix_jobs_escrow_revertable",
+            escrow_address,
+            postgresql_where=(allow_escrow_revert == True) & freelancer_address.is_(None)
+        ),
+    )
+
+# array_to_string is only STABLE, generated columns need an IMMUTABLE expression
+event.listen(Job.__table__, "before_create", DDL(JOB_SEARCH_TEXT_FUNCTION))
 
 class Proposal(Base):
     __tablename__ = "proposals"
@@ -116,19 +214,30 @@ class Notification(Base):
     __tablename__ = "notifications"
     
     id = Column(String(36), primary_key=True, index=True)  # UUID
-    user_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=False, index=True)
+    user_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=False)
     type = Column(String(50), nullable=False, index=True)  # proposal_received, proposal_accepted, proposal_rejected, job_accepted, etc.
     title = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
     related_job_id = Column(String(36), ForeignKey("jobs.id"), nullable=True)
     related_proposal_id = Column(String(36), ForeignKey("proposals.id"), nullable=True)
-    is_read = Column(Boolean, default=False, index=True)
+    is_read = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     # Relationships
     user = relationship("User", foreign_keys=[user_address])
     job = relationship("Job", foreign_keys=[related_job_id])
     proposal = relationship("Proposal", foreign_keys=[related_proposal_id])
+    
+    # A user's notifications newest first; the partial index holds only unread ones
+    __table_args__ = (
+        Index("ix_notifications_user_address_created_at", user_address, created_at.desc()),
+        Index(
+            "ix_notifications_unread",
+            user_address,
+            created_at.desc(),
+            postgresql_where=(is_read == False)
+        ),
+    )
 
 class SavedJob(Base):
     __tablename__ = "saved_jobs"
@@ -147,6 +256,27 @@ class SavedJob(Base):
         UniqueConstraint('user_address', 'job_id', name='unique_user_saved_job'),
     )
 
+class SavedSearch(Base):
+    __tablename__ = "saved_searches"
+    
+    id = Column(String(36), primary_key=True, index=True)  # UUID
+    user_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    query = Column(Text, nullable=True)
+    terms = Column(ARRAY(String), default=[])  # Tokenized query, every term must match
+    tags = Column(ARRAY(String), default=[])  # Any tag must match
+    category = Column(String(100), nullable=True)
+    # Reverse index: a new job is only checked against saved searches sharing one of its keys
+    match_keys = Column(ARRAY(String), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Relationships
+    user = relationship("User", foreign_keys=[user_address])
+    
+    __table_args__ = (
+        Index('ix_saved_searches_match_keys', 'match_keys', postgresql_using='gin'),
+    )
+
 class Conversation(Base):
     __tablename__ = "conversations"
     
@@ -173,17 +303,23 @@ class Message(Base):
     __tablename__ = "messages"
     
     id = Column(String(36), primary_key=True, index=True)  # UUID
-    conversation_id = Column(String(36), ForeignKey("conversations.id"), nullable=False, index=True)
+    conversation_id = Column(String(36), ForeignKey("conversations.id"), nullable=False)
     sender_address = Column(String(42), ForeignKey("users.wallet_address"), nullable=False, index=True)
     content = Column(Text, nullable=True)  # Nullable if it's a file-only message
     message_type = Column(String(20), default="text", index=True)  # text, image, file
-    is_read = Column(Boolean, default=False, index=True)
+    is_read = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
     sender = relationship("User", foreign_keys=[sender_address])
     attachments = relationship("MessageAttachment", back_populates="message", cascade="all, delete-orphan")
+    
+    # A conversation's messages newest first; the partial index holds only unread ones
+    __table_args__ = (
+        Index("ix_messages_conversation_id_created_at", conversation_id, created_at.desc()),
+        Index("ix_messages_unread", conversation_id, postgresql_where=(is_read == False)),
+    )
 
 class MessageAttachment(Base):
     __tablename__ = "message_attachments"
@@ -208,6 +344,11 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """Get async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # Initialize database
 def init_db():
     """Initialize database tables"""
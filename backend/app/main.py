@@ -2,13 +2,17 @@
 FastAPI Backend for Freelance Escrow Platform
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
+import anyio
 
 from app.config import settings
-from app.api.v1 import jobs, users, proposals, auth, search, notifications, chat
-from app.database import init_db, init_redis
+from app.api.v1 import jobs, users, proposals, auth, search, notifications, chat, saved_searches
+from app.database import init_db, init_redis, SessionLocal, async_engine
+from app.services.search import run_index_compaction, search_service
+from app.services.pool_metrics import pool_metrics, current_request_scope
 
 # Lifespan context manager
 @asynccontextmanager
@@ -18,6 +22,9 @@ async def lifespan(app: FastAPI):
     print(f"📝 Environment: {settings.ENVIRONMENT}")
     print(f"🔗 Blockchain Network: {settings.CHAIN_NAME}")
     
+    # Sync handlers and dependencies run on this threadpool (sized with the sync DB pool)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    
     # Initialize databases
     try:
         init_db()
@@ -30,9 +37,26 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         print(f"⚠️ Redis initialization failed: {e}")
     
+    # The in-process search engine is built from the jobs table
+    if search_service.name == "memory":
+        try:
+            indexed = await asyncio.to_thread(search_service.load, SessionLocal)
+            usage = search_service.memory_usage()
+            print(f"✅ In-memory search index loaded: {indexed} jobs, {usage['bytes_per_job']:.0f} bytes per job")
+        except Exception as e:
+            print(f"⚠️ In-memory search index load failed: {e}")
+    
+    # Periodically remove dangling job IDs from the search index
+    compaction_task = None
+    if settings.SEARCH_COMPACTION_INTERVAL > 0 and search_service.name == "redis":
+        compaction_task = asyncio.create_task(run_index_compaction(settings.SEARCH_COMPACTION_INTERVAL))
+    
     yield
     # Shutdown
     print("👋 Shutting down API...")
+    if compaction_task:
+        compaction_task.cancel()
+    await async_engine.dispose()
 
 # Create FastAPI app
 app = FastAPI(
@@ -82,6 +106,15 @@ else:
         allow_headers=["*"],
     )
 
+@app.middleware("http")
+async def track_request_scope(request: Request, call_next):
+    """Expose the request to the pool instrumentation, which attributes connection hold time per route"""
+    token = current_request_scope.set(request.scope)
+    try:
+        return await call_next(request)
+    finally:
+        current_request_scope.reset(token)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/v1/users", tags=["Users"])
@@ -89,6 +122,7 @@ app.include_router(jobs.router, prefix="/api/v1/jobs", tags=["Jobs"])
 app.include_router(proposals.router, prefix="/api/v1/proposals", tags=["Proposals"])
 app.include_router(search.router, prefix="/api/v1/search", tags=["Search"])
 app.include_router(notifications.router, prefix="/api/v1/notifications", tags=["Notifications"])
+app.include_router(saved_searches.router, prefix="/api/v1/saved-searches", tags=["Saved Searches"])
 app.include_router(chat.router, prefix="/api/v1/chat", tags=["Chat"])
 
 @app.get("/")
@@ -108,3 +142,8 @@ async def health():
         "status": "healthy",
         "environment": settings.ENVIRONMENT
     }
+
+@app.get("/metrics/db-pool")
+async def db_pool_metrics():
+    """Connection pool state, checkout wait times and connection hold time per route"""
+    return pool_metrics.snapshot()
@@ -2,7 +2,7 @@
 Pydantic models for request/response
 """
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import Optional, List, Union
 from datetime import datetime
 from enum import Enum
@@ -104,6 +104,27 @@ class JobResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    # Nullable columns of a Job row, so JobResponse.model_validate(job) works on any row
+    @field_validator("skills_required", "tags", mode="before")
+    @classmethod
+    def none_as_empty_list(cls, value):
+        return value or []
+
+    @field_validator("client_confirmed_completion", "freelancer_confirmed_completion", "allow_escrow_revert", mode="before")
+    @classmethod
+    def none_as_false(cls, value):
+        return bool(value)
+
+    @field_validator("proposal_count", mode="before")
+    @classmethod
+    def none_as_zero(cls, value):
+        return value or 0
+
+class JobListResponse(BaseModel):
+    jobs: List[JobResponse]
+    next_cursor: Optional[str] = None  # Pass as cursor to get the next page, None on the last page
+    total: Optional[int] = None  # Approximate, only when include_total is set
+
 # Proposal Models
 class ProposalCreate(BaseModel):
     job_id: str
@@ -189,3 +210,21 @@ class NotificationResponse(BaseModel):
 class NotificationCountResponse(BaseModel):
     unread_count: int
     total_count: int
+
+# Saved Search Models
+class SavedSearchCreate(BaseModel):
+    name: str
+    query: Optional[str] = None
+    tags: List[str] = []
+    category: Optional[str] = None
+
+class SavedSearchResponse(BaseModel):
+    id: str
+    user_address: str
+    name: str
+    query: Optional[str] = None
+    tags: List[str] = []
+    category: Optional[str] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,171 @@
+"""
+Keyset-paginated job listings with approximate totals, and their fast JSON rendering
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+
+import orjson
+from fastapi import Response
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_redis, Job
+from app.models import JobResponse
+from app.services.search_base import encode_cursor, decode_cursor
+
+logger = logging.getLogger(__name__)
+
+# Filtered totals are counted at most once per this many seconds per filter
+JOB_COUNT_CACHE_TTL = 60
+
+# The columns of a JobResponse; listings select these rather than Job objects
+JOB_RESPONSE_COLUMNS = tuple(getattr(Job, field) for field in JobResponse.model_fields)
+
+# Nullable columns and the value JobResponse gives them when NULL
+JOB_NULL_DEFAULTS = {
+    "skills_required": [],
+    "tags": [],
+    "client_confirmed_completion": False,
+    "freelancer_confirmed_completion": False,
+    "allow_escrow_revert": False,
+    "proposal_count": 0,
+}
+
+
+def job_row_to_dict(row: Row) -> Dict[str, Any]:
+    """JobResponse-shaped dict of a JOB_RESPONSE_COLUMNS row (no validation, the row is already typed)"""
+    job = dict(row._mapping)
+    for field, default in JOB_NULL_DEFAULTS.items():
+        if job[field] is None:
+            job[field] = default
+    return job
+
+
+def _json_response(content: Any) -> Response:
+    # OPT_UTC_Z writes UTC datetimes the way pydantic does ("...Z")
+    return Response(orjson.dumps(content, option=orjson.OPT_UTC_Z), media_type="application/json")
+
+
+def render_jobs(rows: List[Row]) -> Response:
+    """
+    JSON response with a list of jobs, from JOB_RESPONSE_COLUMNS rows
+    
+    Serializes straight to bytes with orjson, rather than building a
+    JobResponse per row that FastAPI then dumps, re-validates against the
+    response_model and dumps again. The body is the same as the
+    List[JobResponse] one.
+    """
+    return _json_response([job_row_to_dict(row) for row in rows])
+
+
+def render_job_page(rows: List[Row], next_cursor: Optional[str], total: Optional[int] = None) -> Response:
+    """JSON response with a JobListResponse body, from JOB_RESPONSE_COLUMNS rows (see render_jobs)"""
+    return _json_response({
+        "jobs": [job_row_to_dict(row) for row in rows],
+        "next_cursor": next_cursor,
+        "total": total,
+    })
+
+
+class JobListingService:
+    """
+    Pages through jobs newest first, on (created_at, id)
+    
+    A page is read from the composite (filter columns, created_at, id) indexes
+    starting after the cursor position, so every page costs the same however
+    deep it is, and pages stay consistent while jobs are being created (no
+    row is skipped or repeated, unlike OFFSET).
+    """
+    
+    def __init__(self, cache_prefix: str = "jobs:count:"):
+        self.cache_prefix = cache_prefix
+    
+    @property
+    def redis(self):
+        """Redis client (resolved lazily, the connection is opened in the app lifespan)"""
+        return get_redis()
+    
+    @staticmethod
+    def _criteria(filters: Dict[str, Any]) -> list:
+        """Equality filters on Job columns"""
+        return [getattr(Job, column) == value for column, value in sorted(filters.items())]
+    
+    async def page(
+        self,
+        db: AsyncSession,
+        filters: Dict[str, Any],
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        One page of jobs (JOB_RESPONSE_COLUMNS rows), newest first
+        
+        Args:
+            db: Database session
+            filters: Job column name -> required value
+            limit: Page size
+            cursor: Token from a previous page's next_cursor
+        
+        Returns:
+            (jobs, next_cursor), next_cursor is None on the last page
+        
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        query = select(*JOB_RESPONSE_COLUMNS).where(*self._criteria(filters)).order_by(Job.created_at.desc(), Job.id.desc())
+        if cursor:
+            created_at, job_id = decode_cursor(cursor)
+            query = query.where(
+                tuple_(Job.created_at, Job.id) < tuple_(datetime.fromtimestamp(created_at, timezone.utc), job_id)
+            )
+        
+        jobs = (await db.execute(query.limit(limit + 1))).all()
+        
+        next_cursor = None
+        if len(jobs) > limit:
+            last = jobs[limit - 1]
+            next_cursor = encode_cursor(last.created_at.timestamp(), last.id)
+        return list(jobs[:limit]), next_cursor
+    
+    async def approximate_total(self, db: AsyncSession, filters: Dict[str, Any]) -> int:
+        """
+        Approximate number of jobs matching the filters
+        
+        The unfiltered total is the planner's row estimate (pg_class.reltuples,
+        kept current by autovacuum). Filtered totals are exact counts cached in
+        Redis for JOB_COUNT_CACHE_TTL seconds, so they can lag recent changes.
+        """
+        if not filters:
+            estimate = (await db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'jobs'::regclass")
+            )).scalar()
+            # -1 (or 0 before PostgreSQL 14) until the table is first analyzed
+            if estimate and estimate > 0:
+                return estimate
+        
+        cache_key = f"{self.cache_prefix}{json.dumps(filters, sort_keys=True)}"
+        if self.redis:
+            try:
+                cached = self.redis.get(cache_key)
+                if cached is not None:
+                    return int(cached)
+            except Exception as e:
+                logger.warning(f"Job count cache read failed: {e}")
+        
+        total = (await db.execute(
+            select(func.count()).select_from(Job).where(*self._criteria(filters))
+        )).scalar_one()
+        
+        if self.redis:
+            try:
+                self.redis.setex(cache_key, JOB_COUNT_CACHE_TTL, total)
+            except Exception as e:
+                logger.warning(f"Job count cache write failed: {e}")
+        return total
+
+# Singleton instance
+job_listing_service = JobListingService()
@@ -2,9 +2,10 @@
 Notification service for creating and managing notifications
 """
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.database import Notification, Job, Proposal, User
-from typing import Optional
+from typing import Optional, List, Dict, Any
 import uuid
 import logging
 
@@ -47,6 +48,46 @@ class NotificationService:
             db.rollback()
             raise
     
+    @staticmethod
+    def create_notifications(db: Session, notifications: List[Dict[str, Any]]) -> int:
+        """
+        Create many notifications with a single multi-row INSERT
+        
+        Args:
+            db: Database session
+            notifications: Dicts with user_address, type, title, message and
+                optionally related_job_id / related_proposal_id
+        
+        Returns:
+            Number of notifications created
+        """
+        if not notifications:
+            return 0
+        
+        rows = [
+            {
+                'id': str(uuid.uuid4()),
+                'user_address': notification['user_address'].lower(),
+                'type': notification['type'],
+                'title': notification['title'],
+                'message': notification['message'],
+                'related_job_id': notification.get('related_job_id'),
+                'related_proposal_id': notification.get('related_proposal_id'),
+                'is_read': False,
+            }
+            for notification in notifications
+        ]
+        try:
+            db.execute(insert(Notification), rows)
+            db.commit()
+            
+            logger.info(f"{len(rows)} notifications created")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Error creating notifications: {e}")
+            db.rollback()
+            raise
+    
     @staticmethod
     def notify_proposal_received(
         db: Session,
@@ -0,0 +1,173 @@
+"""
+Database connection pool instrumentation: checkouts, wait times and per-route hold times
+"""
+
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Type
+import bisect
+import logging
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the histogram buckets; a last bucket holds everything slower
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# ASGI scope of the request being handled, set by the app middleware. Connections
+# checked out outside a request (startup, background tasks) count as "background"
+current_request_scope: ContextVar[Optional[Dict[str, Any]]] = ContextVar("current_request_scope", default=None)
+
+
+def route_label(scope: Optional[Dict[str, Any]]) -> str:
+    """Method and route template of a request, e.g. "GET /api/v1/jobs/{job_id}" """
+    if scope is None:
+        return "background"
+    route = scope.get("route")
+    path = getattr(route, "path", None) or "unmatched"
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+class Histogram:
+    """Fixed-bucket duration histogram (callers serialize access)"""
+    
+    def __init__(self):
+        self.counts = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def observe(self, ms: float):
+        self.counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        buckets = {f"le_{bound}ms": count for bound, count in zip(HISTOGRAM_BUCKETS_MS, self.counts)}
+        buckets[f"gt_{HISTOGRAM_BUCKETS_MS[-1]}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": buckets,
+        }
+
+
+class PoolMetrics:
+    """
+    Collects connection pool statistics for one or more engines
+    
+    Wait time (how long a checkout waited for a free connection, or to open
+    one) is measured by the pool classes built with pool_class. Checkouts,
+    connections in use and hold time (checkout to checkin, attributed to the
+    route that checked the connection out) come from the pool events
+    registered by register_engine. Counters are per process.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: Dict[str, Engine] = {}
+        self._waits: Dict[str, Histogram] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._checkouts: Dict[str, int] = {}
+        self._in_use: Dict[str, int] = {}
+        self._peak_in_use: Dict[str, int] = {}
+        self._holds: Dict[str, Histogram] = {}
+    
+    def pool_class(self, base: Type[Pool], name: str) -> Type[Pool]:
+        """
+        Subclass of a pool class that records checkout wait times under name
+        
+        Engines recreate their pool from its class on dispose(), so the
+        instrumentation carries over.
+        """
+        metrics = self
+
+        class InstrumentedPool(base):
+            def _do_get(self):
+                started = time.perf_counter()
+                try:
+                    connection = super()._do_get()
+                except exc.TimeoutError:
+                    metrics._record_wait(name, time.perf_counter() - started, timed_out=True)
+                    raise
+                metrics._record_wait(name, time.perf_counter() - started)
+                return connection
+        
+        InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+        return InstrumentedPool
+    
+    def register_engine(self, name: str, engine: Engine):
+        """Track checkouts and hold times of an engine's pool (use async_engine.sync_engine for async engines)"""
+        with self._lock:
+            self._engines[name] = engine
+        
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            connection_record.info["pool_metrics_checkout"] = (time.perf_counter(), current_request_scope.get())
+            with self._lock:
+                self._checkouts[name] = self._checkouts.get(name, 0) + 1
+                in_use = self._in_use[name] = self._in_use.get(name, 0) + 1
+                self._peak_in_use[name] = max(self._peak_in_use.get(name, 0), in_use)
+        
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            checkout = connection_record.info.pop("pool_metrics_checkout", None)
+            if checkout is None:
+                return
+            checked_out_at, scope = checkout
+            held_ms = (time.perf_counter() - checked_out_at) * 1000
+            label = route_label(scope)
+            with self._lock:
+                self._in_use[name] = max(0, self._in_use.get(name, 0) - 1)
+                self._holds.setdefault(label, Histogram()).observe(held_ms)
+    
+    def _record_wait(self, name: str, seconds: float, timed_out: bool = False):
+        with self._lock:
+            self._waits.setdefault(name, Histogram()).observe(seconds * 1000)
+            if timed_out:
+                self._timeouts[name] = self._timeouts.get(name, 0) + 1
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current pool state and the statistics collected since startup
+        
+        Returns:
+            Dict with "pools" (per engine: configured size, connections in use,
+            overflow, checkouts, timeouts and the wait time histogram) and
+            "routes" (hold time histogram per route, longest total hold first)
+        """
+        with self._lock:
+            pools = {}
+            for name, engine in self._engines.items():
+                pool = engine.pool
+                state = {
+                    "pool_class": type(pool).__name__,
+                    "checked_out": self._in_use.get(name, 0),
+                    "peak_checked_out": self._peak_in_use.get(name, 0),
+                    "checkouts": self._checkouts.get(name, 0),
+                    "timeouts": self._timeouts.get(name, 0),
+                    "wait": self._waits.get(name, Histogram()).snapshot(),
+                }
+                # Queue pools report their size; NullPool (PgBouncer mode) has none
+                if hasattr(pool, "checkedin"):
+                    state.update({
+                        "size": pool.size(),
+                        "idle": pool.checkedin(),
+                        "overflow": pool.overflow(),
+                    })
+                pools[name] = state
+            
+            routes = {
+                label: histogram.snapshot()
+                for label, histogram in sorted(self._holds.items(), key=lambda item: -item[1].total_ms)
+            }
+        return {"pools": pools, "routes": routes}
+
+# Singleton instance
+pool_metrics = PoolMetrics()
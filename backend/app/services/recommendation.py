@@ -0,0 +1,258 @@
+"""
+Skill-based job recommendations for freelancers
+"""
+
+from typing import List, Dict, Optional, Iterable, Tuple, Callable
+import json
+import logging
+import threading
+import time
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy.orm import Session
+
+from app.database import get_redis, Job
+from app.models import JobStatus
+
+logger = logging.getLogger(__name__)
+
+# Top-N lists are cached per user; profile updates delete the entry. Lists
+# hold twice the largest page, so pages stay full when cached jobs close
+RECOMMENDATION_CACHE_TTL = 300
+RECOMMENDATION_CACHE_SIZE = 100
+
+# Each process rebuilds its matrix from the database after this many seconds,
+# picking up jobs created, closed or deleted through other workers (this
+# worker's own changes are applied as they happen)
+MATRIX_REBUILD_INTERVAL = 600
+
+
+def normalize_skill(skill: str) -> str:
+    """Skills are matched case-insensitively"""
+    return ' '.join(skill.lower().split())
+
+
+class RecommendationService:
+    """
+    Scores open jobs against a freelancer's skills
+    
+    Each open job is a row of a sparse CSR matrix over the skill vocabulary,
+    L2-normalized so a single sparse matrix-vector product with the user's
+    (normalized) skill vector gives the cosine similarity with every job.
+    Jobs created after the matrix was built are appended as pending rows and
+    stacked onto the matrix at the next query, so creating a job never
+    rebuilds it. Jobs that close or are deleted have their row zeroed.
+    """
+    
+    def __init__(self, cache_prefix: str = "recommend:user:"):
+        self.cache_prefix = cache_prefix
+        self._lock = threading.RLock()
+        self._vocabulary: Dict[str, int] = {}
+        self._job_ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[sparse.csr_matrix] = None
+        self._pending: List[List[int]] = []
+        self._built_at = 0.0
+    
+    @property
+    def redis(self):
+        """Redis client (resolved lazily, the connection is opened in the app lifespan)"""
+        return get_redis()
+    
+    def _skill_columns(self, skills: Iterable[str], grow: bool) -> List[int]:
+        """Vocabulary columns of a skill list, adding unseen skills when grow"""
+        columns = set()
+        for skill in skills or []:
+            skill = normalize_skill(skill)
+            if not skill:
+                continue
+            column = self._vocabulary.get(skill)
+            if column is None and grow:
+                column = self._vocabulary[skill] = len(self._vocabulary)
+            if column is not None:
+                columns.add(column)
+        return sorted(columns)
+    
+    def _rows_to_matrix(self, rows: List[List[int]]) -> sparse.csr_matrix:
+        """Build L2-normalized binary skill vectors, one row per job"""
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(columns) for columns in rows])
+        indices = np.fromiter((column for columns in rows for column in columns), dtype=np.int32, count=indptr[-1])
+        data = np.repeat(
+            np.array([1.0 / np.sqrt(len(columns)) if columns else 0.0 for columns in rows], dtype=np.float32),
+            np.diff(indptr)
+        )
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(rows), len(self._vocabulary)))
+    
+    def build(self, db: Session, chunk_size: int = 1000) -> int:
+        """
+        Rebuild the job matrix from the open jobs in the database
+        
+        Args:
+            db: Database session
+            chunk_size: Rows fetched per round trip
+        
+        Returns:
+            Number of jobs in the matrix
+        """
+        rows = db.query(Job.id, Job.skills_required).filter(
+            Job.status == JobStatus.OPEN.value
+        ).yield_per(chunk_size)
+        
+        with self._lock:
+            self._vocabulary = {}
+            job_ids = []
+            job_rows = []
+            for job_id, skills in rows:
+                columns = self._skill_columns(skills, grow=True)
+                if columns:
+                    job_ids.append(job_id)
+                    job_rows.append(columns)
+            
+            self._job_ids = job_ids
+            self._rows = {job_id: row for row, job_id in enumerate(job_ids)}
+            self._matrix = self._rows_to_matrix(job_rows)
+            self._pending = []
+            self._built_at = time.monotonic()
+        
+        logger.info(f"Recommendation matrix built: {len(job_ids)} jobs, {len(self._vocabulary)} skills")
+        return len(job_ids)
+    
+    def add_job(self, job_id: str, skills: Optional[List[str]]):
+        """
+        Add a newly created job to the matrix
+        
+        Does nothing until the matrix has been built (the build will include
+        the job).
+        """
+        with self._lock:
+            if self._matrix is None:
+                return
+            columns = self._skill_columns(skills, grow=True)
+            if columns:
+                self._rows[job_id] = len(self._job_ids)
+                self._job_ids.append(job_id)
+                self._pending.append(columns)
+    
+    def remove_job(self, job_id: str) -> bool:
+        """
+        Stop recommending a job (closed, assigned or deleted)
+        
+        The job's row is zeroed in place, so it scores 0 and is never
+        returned; the next rebuild drops the row.
+        
+        Returns:
+            True if the job was in the matrix
+        """
+        with self._lock:
+            row = self._rows.pop(job_id, None)
+            if row is None or self._matrix is None:
+                return False
+            built = self._matrix.shape[0]
+            if row < built:
+                self._matrix.data[self._matrix.indptr[row]:self._matrix.indptr[row + 1]] = 0
+            else:
+                self._pending[row - built] = []
+            return True
+    
+    def sync_job(self, job: Job) -> bool:
+        """Remove a job from the matrix once it is no longer open (after a commit)"""
+        if job.status == JobStatus.OPEN.value:
+            return False
+        return self.remove_job(job.id)
+    
+    def _current_matrix(self) -> sparse.csr_matrix:
+        """The job matrix with pending rows stacked on, widened to the vocabulary"""
+        matrix = self._matrix
+        if matrix.shape[1] < len(self._vocabulary):
+            matrix.resize((matrix.shape[0], len(self._vocabulary)))
+        if self._pending:
+            matrix = sparse.vstack([matrix, self._rows_to_matrix(self._pending)], format="csr")
+            self._pending = []
+        self._matrix = matrix
+        return matrix
+    
+    def score_jobs(self, skills: List[str], limit: int) -> List[Tuple[str, float]]:
+        """
+        Open jobs most similar to a skill list
+        
+        Args:
+            skills: The freelancer's skills
+            limit: Number of jobs to return
+        
+        Returns:
+            (job_id, cosine similarity) pairs, best first, zero scores excluded
+        """
+        with self._lock:
+            columns = self._skill_columns(skills, grow=False)
+            if not columns or self._matrix is None:
+                return []
+            matrix = self._current_matrix()
+            job_ids = self._job_ids
+            
+            user_vector = np.zeros(matrix.shape[1], dtype=np.float32)
+            user_vector[columns] = 1.0 / np.sqrt(len(columns))
+            scores = matrix @ user_vector
+        
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [(job_ids[row], float(scores[row])) for row in candidates]
+    
+    def recommend(
+        self,
+        user_address: str,
+        skills: List[str],
+        db_factory: Callable[[], Session]
+    ) -> List[Tuple[str, float]]:
+        """
+        Top RECOMMENDATION_CACHE_SIZE jobs for a user, from the Redis cache when present
+        
+        Args:
+            user_address: User wallet address
+            skills: The user's skills
+            db_factory: Callable returning a new database session, used to
+                (re)build the matrix
+        
+        Returns:
+            (job_id, score) pairs, best first
+        """
+        cache_key = f"{self.cache_prefix}{user_address.lower()}"
+        if self.redis:
+            try:
+                cached = self.redis.get(cache_key)
+                if cached:
+                    return [tuple(entry) for entry in json.loads(cached)]
+            except Exception as e:
+                logger.warning(f"Recommendation cache read failed: {e}")
+        
+        if self._matrix is None or time.monotonic() - self._built_at > MATRIX_REBUILD_INTERVAL:
+            db = db_factory()
+            try:
+                self.build(db)
+            finally:
+                db.close()
+        
+        recommendations = self.score_jobs(skills, RECOMMENDATION_CACHE_SIZE)
+        if self.redis:
+            try:
+                self.redis.setex(cache_key, RECOMMENDATION_CACHE_TTL, json.dumps(recommendations))
+            except Exception as e:
+                logger.warning(f"Recommendation cache write failed: {e}")
+        return recommendations
+    
+    def invalidate_user(self, user_address: str) -> bool:
+        """Drop a user's cached recommendations (after their skills changed)"""
+        if not self.redis:
+            return False
+        try:
+            self.redis.delete(f"{self.cache_prefix}{user_address.lower()}")
+            return True
+        except Exception as e:
+            logger.error(f"Error invalidating recommendations for {user_address}: {e}")
+            return False
+
+# Singleton instance
+recommendation_service = RecommendationService()
@@ -0,0 +1,187 @@
+"""
+Saved searches: alert users when a newly created job matches one of their queries
+"""
+
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.orm import Session
+from typing import List, Dict, Any, Optional, Set
+import uuid
+import logging
+
+from app.database import SavedSearch, Job
+from app.services.notification import NotificationService
+from app.services.search_base import PREFIX_LENGTHS, tokenize, job_to_document
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_TYPE = "saved_search_match"
+
+
+def search_match_keys(terms: List[str], tags: List[str], category: Optional[str]) -> List[str]:
+    """
+    Reverse index keys for a saved search
+    
+    A search is filed under a single term, since a job must contain every term:
+    the longest one, which is usually the most selective. Searches without
+    terms are filed under each of their tags (a job needs only one, as in the
+    search endpoint), or their category. An empty search has no keys and
+    never matches.
+    """
+    if terms:
+        return [f"term:{max(terms, key=len)}"]
+    if tags:
+        return [f"tag:{tag}" for tag in tags]
+    if category:
+        return [f"category:{category}"]
+    return []
+
+
+def job_match_keys(terms: Set[str], tags: Set[str], category: str) -> List[str]:
+    """Reverse index keys a job is looked up under: every term, tag and its category"""
+    keys = [f"term:{term}" for term in terms]
+    keys.extend(f"tag:{tag}" for tag in tags)
+    if category:
+        keys.append(f"category:{category}")
+    return keys
+
+
+def job_terms(job_data: Dict[str, Any]) -> Set[str]:
+    """
+    Every query term that matches a job, mirroring the search index
+    
+    A term matches every word it starts: short terms through the prefix
+    sets, longer ones through the vocabulary (see SearchService._expand_terms).
+    """
+    searchable_text = ' '.join([
+        job_data.get('title') or '',
+        job_data.get('description') or '',
+        ' '.join(job_data.get('skills_required') or []),
+        ' '.join(job_data.get('tags') or []),
+        job_data.get('category') or '',
+    ])
+    
+    terms = set()
+    for word in tokenize(searchable_text):
+        for length in range(min(PREFIX_LENGTHS), len(word) + 1):
+            terms.add(word[:length])
+    return terms
+
+
+def matches_saved_search(saved_search: SavedSearch, terms: Set[str], tags: Set[str], category: str) -> bool:
+    """
+    Whether a job matches every criterion of a saved search
+    
+    Same semantics as the search endpoint: every term and the category must
+    match, and multiple tags match any of the tags (the search index unions
+    their posting sets).
+    
+    Args:
+        saved_search: Saved search to check
+        terms: The job's terms (see job_terms)
+        tags: The job's lowercased tags
+        category: The job's lowercased category
+    """
+    if not terms.issuperset(saved_search.terms or []):
+        return False
+    if saved_search.tags and tags.isdisjoint(saved_search.tags):
+        return False
+    if saved_search.category and saved_search.category != category:
+        return False
+    return True
+
+
+class SavedSearchService:
+    """Service for registering saved searches and matching new jobs against them"""
+    
+    @staticmethod
+    def create_saved_search(
+        db: Session,
+        user_address: str,
+        name: str,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None
+    ) -> SavedSearch:
+        """
+        Register a saved search
+        
+        Raises:
+            ValueError: If the search has no query, tags or category
+        """
+        terms = sorted(set(tokenize(query or '')))
+        tags = sorted({tag.lower() for tag in tags or [] if tag})
+        category = category.lower() if category else None
+        
+        match_keys = search_match_keys(terms, tags, category)
+        if not match_keys:
+            raise ValueError("A saved search needs a query, tags or a category")
+        
+        saved_search = SavedSearch(
+            id=str(uuid.uuid4()),
+            user_address=user_address.lower(),
+            name=name,
+            query=query,
+            terms=terms,
+            tags=tags,
+            category=category,
+            match_keys=match_keys
+        )
+        db.add(saved_search)
+        db.commit()
+        db.refresh(saved_search)
+        
+        logger.info(f"Saved search created for {user_address}: {match_keys}")
+        return saved_search
+    
+    @staticmethod
+    def match_new_job(db: Session, job: Job) -> int:
+        """
+        Notify the owners of saved searches that match a new job
+        
+        Candidates are looked up through the GIN-indexed match_keys column, so
+        only searches filed under one of the job's terms, tags or category are
+        loaded, then each candidate is checked against all of its criteria.
+        
+        Args:
+            db: Database session
+            job: Newly created job
+        
+        Returns:
+            Number of notifications created
+        """
+        job_data = job_to_document(job)
+        terms = job_terms(job_data)
+        tags = {tag.lower() for tag in job_data['tags']}
+        category = (job_data.get('category') or '').lower()
+        
+        keys = job_match_keys(terms, tags, category)
+        if not keys:
+            return 0
+        
+        candidates = db.query(SavedSearch).filter(
+            SavedSearch.match_keys.op("&&")(array(keys)),
+            SavedSearch.user_address != job.client_address
+        ).all()
+        
+        # One alert per user, even when several of their searches match
+        matches = {}
+        for saved_search in candidates:
+            if saved_search.user_address in matches:
+                continue
+            if matches_saved_search(saved_search, terms, tags, category):
+                matches[saved_search.user_address] = saved_search
+        
+        notifications = [
+            {
+                'user_address': user_address,
+                'type': NOTIFICATION_TYPE,
+                'title': f'New job matching "{saved_search.name}"',
+                'message': job.title,
+                'related_job_id': job.id,
+            }
+            for user_address, saved_search in matches.items()
+        ]
+        return NotificationService.create_notifications(db, notifications)
+
+# Singleton instance
+saved_search_service = SavedSearchService()
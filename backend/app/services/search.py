@@ -3,23 +3,634 @@ Redis-based search service
 """
 
 import redis
-from typing import List, Dict, Any, Optional
+from redis.client import Pipeline
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Set, Callable
+from collections import defaultdict
+from datetime import datetime
+import asyncio
+import hashlib
 import json
 import logging
+import math
+import uuid
+from contextlib import contextmanager
 
-from app.database import get_redis
+from sqlalchemy.orm import Session
+
+from app.database import get_redis, Job
+from app.models import JobStatus
+from app.services.search_memory import MemorySearchService
+from app.services.search_base import (
+    SearchBackend,
+    PREFIX_LENGTHS,
+    MAX_PREFIX_LENGTH,
+    TERM_EXPANSION_LIMIT,
+    FIELD_WEIGHTS,
+    BM25_K1,
+    BM25_B,
+    SORT_RELEVANCE,
+    SORT_ATTRIBUTES,
+    RANGE_ATTRIBUTES,
+    SUGGEST_FIELDS,
+    FACET_TAG_LIMIT,
+    tokenize,
+    encode_cursor,
+    decode_cursor,
+    attribute_value,
+    range_filters,
+    job_to_document,
+    is_full_document,
+    stream_jobs,
+)
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
-class SearchService:
+# Cached job documents expire after 30 days
+JOB_CACHE_TTL = 86400 * 30
+
+# Safety net for request-scoped temporary keys if a worker dies mid-query
+TEMP_KEY_TTL = 30
+
+# Facet counts are cached per normalized query and index generation; the TTL
+# only expires entries of past generations
+FACET_CACHE_TTL = 60
+
+# Search result pages are cached per index generation, so every index write
+# invalidates them; the TTL only expires entries of past generations
+RESULT_CACHE_TTL = 300
+
+# Result cache lookup in one round trip: reads the index generation, the page
+# cached under it (KEYS[1] generation, KEYS[2] stats, ARGV cache prefix and
+# digest) and counts the lookup as a hit or a miss
+CACHED_PAGE_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+local page = redis.call('GET', ARGV[1] .. generation .. ':' .. ARGV[2])
+redis.call('HINCRBY', KEYS[2], page and 'hits' or 'misses', 1)
+return {generation, page or ''}
+"""
+
+# Fuzzy matching: query terms with no exact match are corrected against a
+# trigram index of the words in job titles and skills
+FUZZY_MIN_LENGTH = 4
+FUZZY_SHORTLIST = 50
+FUZZY_FIELDS = ('title', 'skills_required')
+
+# Autocomplete: one sorted set of entries per prefix of up to SUGGEST_PREFIX_LENGTH
+# characters, most popular first; longer prefixes read the entries starting with
+# them (at most SUGGEST_LEX_LIMIT) from a lexicographically ordered set
+SUGGEST_PREFIX_LENGTH = 4
+SUGGEST_LEX_LIMIT = 1000
+
+# Upper bound of a ZRANGEBYLEX prefix range (sorts after any UTF-8 continuation)
+LEX_RANGE_END = "\U0010ffff"
+
+# Members of a lexicographic set (KEYS[1]) between ARGV[1] and ARGV[2], at most
+# ARGV[3] (-1 for all), with their scores in a companion sorted set (KEYS[2]);
+# members the companion no longer holds are removed in the same call, so a
+# concurrent re-add can't be lost
+LEX_SCORES_SCRIPT = """
+local entries = redis.call('ZRANGEBYLEX', KEYS[1], ARGV[1], ARGV[2], 'LIMIT', 0, tonumber(ARGV[3]))
+local found = {}
+for _, entry in ipairs(entries) do
+    local score = redis.call('ZSCORE', KEYS[2], entry)
+    if score then
+        table.insert(found, entry)
+        table.insert(found, score)
+    else
+        redis.call('ZREM', KEYS[1], entry)
+    end
+end
+return found
+"""
+
+# Words of the vocabulary set (KEYS[1]) between ARGV[1] and ARGV[2], at most ARGV[3],
+# that still have a posting set (key prefix ARGV[4]); words no job contains any more
+# are removed in the same call
+WORD_PREFIX_SCRIPT = """
+local words = redis.call('ZRANGEBYLEX', KEYS[1], ARGV[1], ARGV[2], 'LIMIT', 0, tonumber(ARGV[3]))
+local live = {}
+for _, word in ipairs(words) do
+    if redis.call('EXISTS', ARGV[4] .. word) == 1 then
+        table.insert(live, word)
+    else
+        redis.call('ZREM', KEYS[1], word)
+    end
+end
+return live
+"""
+
+# Sorted searches whose every filter matches more than SELECTIVE_FILTER_SIZE jobs
+# walk the sort index SORTED_WALK_CHUNK jobs at a time, testing filter membership,
+# instead of intersecting the filters; a walk that scans SORTED_WALK_BUDGET jobs
+# without filling the page (filters that rarely match together) intersects after all
+SELECTIVE_FILTER_SIZE = 2000
+SORTED_WALK_CHUNK = 200
+SORTED_WALK_BUDGET = 5000
+
+# Compaction re-checks a batch whose transaction lost a race with an index write
+COMPACTION_RETRIES = 3
+
+# A rebuild marker outlives a crashed reindex by at most this long; running
+# rebuilds refresh it as they go
+REBUILD_MARKER_TTL = 3600
+
+
+def trigrams(word: str) -> Set[str]:
+    """Character trigrams of a word padded with boundary markers"""
+    padded = f"${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def max_edits(term: str) -> int:
+    """Edits tolerated when correcting a term (longer words allow more typos)"""
+    return 1 if len(term) <= 5 else 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus transpositions)
+    
+    Returns limit + 1 as soon as the distance is known to exceed limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous_row = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous_row, row = previous_row, row, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            row[j] = min(previous_row[j] + 1, row[j - 1] + 1, previous_row[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], before[j - 2] + 1)
+        if min(row) > limit:
+            return limit + 1
+    return row[-1]
+
+
+def score_bound(value: float) -> str:
+    """Sorted-set score argument for a range bound (infinite bounds are open)"""
+    if math.isinf(value):
+        return "+inf" if value > 0 else "-inf"
+    return repr(value)
+
+
+class SearchService(SearchBackend):
     """Service for indexing and searching jobs using Redis"""
     
-    def __init__(self):
-        self.redis = get_redis()
-        self.job_index_prefix = "job:"
-        self.search_index_key = "search:jobs"
-        self.tag_index_prefix = "tag:"
+    name = "redis"
+    
+    def __init__(self, namespace: str = ""):
+        # A non-empty namespace builds a shadow index (see swap_in)
+        self.namespace = namespace
+        self.job_index_prefix = f"{namespace}job:"
+        self.search_index_key = f"{namespace}search:jobs"
+        self.tag_index_prefix = f"{namespace}tag:"
+        # Every indexed job, scored by created_at (newest-first listing)
+        self.all_jobs_key = f"{self.search_index_key}:all"
+        # Bumped by every index write; outside search:jobs:* so swap_in never renames it
+        self.generation_key = f"{namespace}search:generation"
+        self.result_cache_prefix = f"{namespace}search:cache:"
+        # Set while a shadow index is being built, and the job IDs written meanwhile
+        self.rebuild_key = f"{namespace}search:rebuild"
+        self.rebuild_writes_key = f"{namespace}search:rebuild:writes"
+        self.cache_stats_key = f"{namespace}search:cache:stats"
+        # Tag vocabulary scored by the number of indexed jobs carrying each tag
+        self.tag_popularity_key = f"{self.search_index_key}:tag_popularity"
+        # The same tags with score 0, in lexicographic order (prefix lookups)
+        self.tag_lex_key = f"{self.search_index_key}:tag_lex"
+        # Every autocomplete entry with score 0, in lexicographic order (long prefixes)
+        self.suggest_lex_key = f"{self.search_index_key}:suggest_lex"
+        # Indexed words longer than MAX_PREFIX_LENGTH with score 0, in lexicographic order
+        self.vocabulary_key = f"{self.search_index_key}:vocabulary"
+        # Numeric attribute indexes, scored by budget and deadline epoch
+        self.attribute_keys = {
+            attribute: f"{self.search_index_key}:{attribute}" for attribute in RANGE_ATTRIBUTES
+        }
+        # Whether the server has SINTERCARD (Redis 7+), checked on first use
+        self._has_sintercard: Optional[bool] = None
+    
+    @property
+    def redis(self) -> Optional[redis.Redis]:
+        """Redis client (resolved lazily, the connection is opened in the app lifespan)"""
+        return get_redis()
+    
+    def _term_key(self, term: str) -> str:
+        """
+        Posting set that answers a single query term
+        
+        Short terms are served from the prefix sets written by index_job, which
+        also contain every whole word of that length. For longer terms this is
+        the set of the whole word; _query_terms expands them to every word
+        they start.
+        """
+        if len(term) <= MAX_PREFIX_LENGTH:
+            return f"{self.search_index_key}:prefix:{term}"
+        return f"{self.search_index_key}:word:{term}"
+    
+    def _rank_key(self, term: str) -> str:
+        """Sorted-set counterpart of _term_key, scored by BM25 term weight"""
+        if len(term) <= MAX_PREFIX_LENGTH:
+            return f"{self.search_index_key}:rank:prefix:{term}"
+        return f"{self.search_index_key}:rank:{term}"
+    
+    def _queue_vocabulary(self, pipe: Pipeline, set_keys: Iterable[str]):
+        """
+        Queue the words of newly written word posting sets into the vocabulary
+        
+        Queue after the SADDs to the word sets: WORD_PREFIX_SCRIPT drops
+        vocabulary words whose set does not exist.
+        """
+        word_prefix = f"{self.search_index_key}:word:"
+        words = {
+            key[len(word_prefix):]: 0 for key in set_keys
+            if key.startswith(word_prefix) and len(key) - len(word_prefix) > MAX_PREFIX_LENGTH
+        }
+        if words:
+            pipe.zadd(self.vocabulary_key, words)
+    
+    def _expand_terms(self, terms: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Indexed words starting with each term longer than MAX_PREFIX_LENGTH
+        
+        One ZRANGEBYLEX over the vocabulary per term (WORD_PREFIX_SCRIPT), in a
+        single round trip; at most TERM_EXPANSION_LIMIT words per term.
+        """
+        long_terms = [term for term in dict.fromkeys(terms) if len(term) > MAX_PREFIX_LENGTH]
+        if not long_terms:
+            return {}
+        lookup = self.redis.register_script(WORD_PREFIX_SCRIPT)
+        pipe = self.redis.pipeline(transaction=False)
+        for term in long_terms:
+            lookup(
+                keys=[self.vocabulary_key],
+                args=[f"[{term}", f"[{term}{LEX_RANGE_END}", TERM_EXPANSION_LIMIT, f"{self.search_index_key}:word:"],
+                client=pipe,
+            )
+        return dict(zip(long_terms, pipe.execute()))
+    
+    def _resolve_terms(
+        self,
+        terms: List[str],
+        expansions: Dict[str, List[str]],
+        temp_key: Callable[[str], str]
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Posting set and rank set answering each query term
+        
+        A long term starting several words is answered by the union of their
+        sets, stored in temporary keys; rank sets are unioned with AGGREGATE
+        MAX, so a job scores by its best matching word.
+        """
+        term_keys: Dict[str, Tuple[str, str]] = {}
+        pipe = self.redis.pipeline(transaction=False)
+        for term in terms:
+            words = expansions.get(term, [])
+            if len(words) <= 1:
+                word = words[0] if words else term
+                term_keys[term] = (self._term_key(word), self._rank_key(word))
+                continue
+            set_key, rank_key = temp_key(f"term:{term}"), temp_key(f"rank:{term}")
+            pipe.sunionstore(set_key, [self._term_key(word) for word in words])
+            pipe.zunionstore(rank_key, [self._rank_key(word) for word in words], aggregate="MAX")
+            pipe.expire(set_key, TEMP_KEY_TTL)
+            pipe.expire(rank_key, TEMP_KEY_TTL)
+            term_keys[term] = (set_key, rank_key)
+        if len(pipe):
+            pipe.execute()
+        return term_keys
+    
+    def _field_text(self, job_data: Dict[str, Any], field: str) -> str:
+        value = job_data.get(field) or ''
+        if isinstance(value, list):
+            return ' '.join(value)
+        return value
+    
+    def _term_frequencies(self, job_data: Dict[str, Any]) -> Tuple[Dict[str, float], int]:
+        """
+        Field-weighted term frequencies for words and word prefixes
+        
+        Returns:
+            (rank key -> weighted frequency, document length in words)
+        """
+        frequencies: Dict[str, float] = {}
+        length = 0
+        for field, weight in FIELD_WEIGHTS.items():
+            words = tokenize(self._field_text(job_data, field))
+            length += len(words)
+            for word in words:
+                keys = {self._rank_key(word[:n]) for n in PREFIX_LENGTHS if len(word) >= n}
+                if len(word) > MAX_PREFIX_LENGTH:
+                    keys.add(self._rank_key(word))
+                for key in keys:
+                    frequencies[key] = frequencies.get(key, 0.0) + weight
+        return frequencies, length
+    
+    def _set_postings(self, job_data: Dict[str, Any]) -> Set[str]:
+        """Keys of every posting set a job belongs to (words, prefixes, tags, category, status)"""
+        # Index by title, description, skills, tags and category (simple word indexing)
+        searchable_text = ' '.join([
+            job_data.get('title', ''),
+            job_data.get('description', ''),
+            ' '.join(job_data.get('skills_required', [])),
+            ' '.join(job_data.get('tags', [])),
+            job_data.get('category', ''),
+        ])
+        
+        keys = set()
+        for word in tokenize(searchable_text):
+            keys.add(f"{self.search_index_key}:word:{word}")
+            # Prefixes for partial matching
+            for n in PREFIX_LENGTHS:
+                if len(word) >= n:
+                    keys.add(f"{self.search_index_key}:prefix:{word[:n]}")
+        
+        for tag in job_data.get('tags', []):
+            keys.add(f"{self.tag_index_prefix}{tag.lower()}")
+        
+        category = job_data.get('category', '').lower()
+        if category:
+            keys.add(f"{self.search_index_key}:category:{category}")
+        
+        status = job_data.get('status', '').lower()
+        if status:
+            keys.add(f"{self.search_index_key}:status:{status}")
+        
+        return keys
+    
+    def _trigram_key(self, trigram: str) -> str:
+        """Set of vocabulary words containing a trigram (fuzzy matching)"""
+        return f"{self.search_index_key}:trigram:{trigram}"
+    
+    def _fuzzy_words(self, job_data: Dict[str, Any]) -> Set[str]:
+        """Words of a job that misspelled query terms can be corrected to"""
+        return {
+            word
+            for field in FUZZY_FIELDS
+            for word in tokenize(self._field_text(job_data, field))
+            if len(word) >= FUZZY_MIN_LENGTH
+        }
+    
+    def _queue_trigrams(self, pipe: Pipeline, words: Iterable[str]):
+        """Add words to the trigram index, one SADD per trigram"""
+        members: Dict[str, List[str]] = defaultdict(list)
+        for word in words:
+            for trigram in trigrams(word):
+                members[self._trigram_key(trigram)].append(word)
+        for key, words_with_trigram in members.items():
+            pipe.sadd(key, *words_with_trigram)
+    
+    def _suggestions(self, job_data: Dict[str, Any]) -> Set[str]:
+        """
+        Autocomplete dictionary entries of a job
+        
+        Entries are "<text>|<kind>", so a word that is also a tag is
+        suggested (and counted) once as each.
+        """
+        entries = {
+            f"{word}|word"
+            for field in SUGGEST_FIELDS
+            for word in tokenize(self._field_text(job_data, field))
+        }
+        entries.update(f"{tag.lower()}|tag" for tag in job_data.get('tags', []))
+        return entries
+    
+    def _suggest_key(self, prefix: str) -> str:
+        """
+        Autocomplete entries starting with a prefix (of up to SUGGEST_PREFIX_LENGTH characters)
+        
+        Entries are scored by minus the number of jobs they occur in, so
+        ZRANGE lists the most popular first and ties in text order.
+        """
+        return f"{self.search_index_key}:suggest:{prefix[:SUGGEST_PREFIX_LENGTH]}"
+    
+    def _suggestion_marker(self, entry: str) -> str:
+        """Reverse posting index member recording that a job counts towards an autocomplete entry"""
+        return f"{self.search_index_key}:suggestion:{entry}"
+    
+    def _suggestions_of(self, posting_keys: Iterable[str]) -> Set[str]:
+        """Autocomplete entries named by the markers in a job's reverse posting index"""
+        prefix = self._suggestion_marker("")
+        return {key[len(prefix):] for key in posting_keys if key.startswith(prefix)}
+    
+    def _queue_suggestion_counts(self, pipe: Pipeline, deltas: Dict[str, int]):
+        """Queue the job count changes of autocomplete entries in every prefix set holding them"""
+        emptied: Set[str] = set()
+        added: Dict[str, int] = {}
+        for entry, delta in deltas.items():
+            if not delta:
+                continue
+            text = entry.rsplit("|", 1)[0]
+            for n in range(1, min(len(text), SUGGEST_PREFIX_LENGTH) + 1):
+                key = self._suggest_key(text[:n])
+                pipe.zincrby(key, -delta, entry)
+                if delta < 0:
+                    emptied.add(key)
+            if delta > 0:
+                added[entry] = 0
+        # Drop entries no job contains any more (count down to 0); the lexicographic
+        # set keeps them until suggest() finds them missing from the prefix set
+        for key in emptied:
+            pipe.zremrangebyscore(key, 0, "+inf")
+        if added:
+            pipe.zadd(self.suggest_lex_key, added)
+    
+    def _correct_terms(
+        self,
+        terms: List[str],
+        expansions: Dict[str, List[str]],
+        temp_key: Callable[[str], str]
+    ) -> Dict[str, str]:
+        """
+        Corrections for query terms that match no job
+        
+        Candidate words come from the trigram index: the trigram sets of the
+        term are summed with ZUNIONSTORE so the server returns only the
+        FUZZY_SHORTLIST words sharing the most trigrams. Edit distance is
+        computed for that shortlist only, and the closest word within
+        max_edits wins (ties go to the word sharing more trigrams). Words no
+        job contains any more (no word posting set) are skipped; compaction
+        prunes them from the trigram index (see _prune_trigrams). A term
+        longer than MAX_PREFIX_LENGTH is only corrected when it starts no
+        indexed word (see _expand_terms).
+        
+        Returns:
+            Mapping of misspelled term to corrected word
+        """
+        eligible = [term for term in terms if len(term) >= FUZZY_MIN_LENGTH]
+        if not eligible:
+            return {}
+        
+        pipe = self.redis.pipeline(transaction=False)
+        short_terms = [term for term in eligible if len(term) <= MAX_PREFIX_LENGTH]
+        for term in short_terms:
+            pipe.exists(self._term_key(term))
+        found = {term for term, exists in zip(short_terms, pipe.execute()) if exists}
+        found.update(term for term in eligible if expansions.get(term))
+        misspelled = [term for term in eligible if term not in found]
+        if not misspelled:
+            return {}
+        
+        pipe = self.redis.pipeline(transaction=False)
+        for term in misspelled:
+            candidates_key = temp_key(f"fuzzy:{term}")
+            pipe.zunionstore(candidates_key, [self._trigram_key(trigram) for trigram in trigrams(term)])
+            pipe.expire(candidates_key, TEMP_KEY_TTL)
+            pipe.zrevrange(candidates_key, 0, FUZZY_SHORTLIST - 1, withscores=True)
+        shortlists = pipe.execute()[2::3]
+        
+        close: Dict[str, List[str]] = {}
+        for term, shortlist in zip(misspelled, shortlists):
+            limit = max_edits(term)
+            ranked = []
+            for word, shared in shortlist:
+                distance = edit_distance(term, word, limit)
+                if distance <= limit:
+                    ranked.append((distance, -shared, word))
+            close[term] = [word for _, _, word in sorted(ranked)]
+        
+        candidates = list({word for words in close.values() for word in words})
+        pipe = self.redis.pipeline(transaction=False)
+        for word in candidates:
+            pipe.exists(f"{self.search_index_key}:word:{word}")
+        live = {word for word, exists in zip(candidates, pipe.execute()) if exists}
+        
+        corrections = {}
+        for term, words in close.items():
+            best = next((word for word in words if word in live), None)
+            if best:
+                corrections[term] = best
+        return corrections
+    
+    def _postings_key(self, job_id: str) -> str:
+        """Reverse index: set of every posting key the job was added to"""
+        return f"{self.search_index_key}:postings:{job_id}"
+    
+    def _sorted_postings(self, job_data: Dict[str, Any]) -> Dict[str, float]:
+        """Sorted sets the job belongs to with its score in each (attribute indexes)"""
+        postings = {self.all_jobs_key: attribute_value(job_data, 'created_at') or 0.0}
+        for attribute, key in self.attribute_keys.items():
+            value = attribute_value(job_data, attribute)
+            if value is not None:
+                postings[key] = value
+        return postings
+    
+    def _is_sorted_key(self, key: str) -> bool:
+        """Whether a posting key is a sorted set (relevance or attribute index)"""
+        return (
+            key.startswith(f"{self.search_index_key}:rank:")
+            or key == self.all_jobs_key
+            or key in self.attribute_keys.values()
+        )
+    
+    def _queue_posting_removal(self, pipe: Pipeline, job_id: str, keys: Iterable[str]):
+        """Queue removal of job_id from posting sets and sorted sets on pipe"""
+        marker_prefix = self._suggestion_marker("")
+        for key in keys:
+            if key.startswith(marker_prefix):
+                continue  # not a key, see _suggestion_marker
+            if self._is_sorted_key(key):
+                pipe.zrem(key, job_id)
+            else:
+                pipe.srem(key, job_id)
+    
+    def _tags_of(self, posting_keys: Iterable[str]) -> Set[str]:
+        """Tags named by the tag posting keys in a job's reverse posting index"""
+        return {key[len(self.tag_index_prefix):] for key in posting_keys if key.startswith(self.tag_index_prefix)}
+    
+    def _queue_tag_popularity(self, pipe: Pipeline, deltas: Dict[str, int]):
+        """
+        Queue ZINCRBY for each changed tag count, dropping tags no job carries any more
+        
+        Dropped tags stay in the lexicographic tag set until popular_tags
+        finds them missing from the popularity set.
+        """
+        deltas = {tag: delta for tag, delta in deltas.items() if delta}
+        for tag, delta in deltas.items():
+            pipe.zincrby(self.tag_popularity_key, delta, tag)
+        if any(delta < 0 for delta in deltas.values()):
+            pipe.zremrangebyscore(self.tag_popularity_key, "-inf", 0)
+        added = {tag: 0 for tag, delta in deltas.items() if delta > 0}
+        if added:
+            pipe.zadd(self.tag_lex_key, added)
+    
+    def _bm25_scores(
+        self,
+        frequencies: Dict[str, float],
+        length: int,
+        avg_length: float
+    ) -> Dict[str, float]:
+        """BM25 term weight of each rank key for a document of the given length"""
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+        return {key: tf * (BM25_K1 + 1) / (tf + norm) for key, tf in frequencies.items()}
+    
+    def _idf(self, docs: int, matches: int) -> float:
+        """BM25 inverse document frequency"""
+        return math.log(1 + (docs - matches + 0.5) / (matches + 0.5))
+    
+    @contextmanager
+    def _temp_keys(self) -> Iterator[Callable[[str], str]]:
+        """
+        Hand out temporary key names unique to one search request
+        
+        Keys live under search:jobs:temp:<uuid4>: so concurrent searches, in
+        this or any other worker process, never read or clobber each other's
+        intermediate results. All keys handed out are deleted when the scope
+        exits; callers also set TEMP_KEY_TTL on them so a crashed worker
+        cannot leak them.
+        """
+        prefix = f"{self.search_index_key}:temp:{uuid.uuid4().hex}:"
+        created: List[str] = []
+        
+        def temp_key(name: str) -> str:
+            key = f"{prefix}{name}"
+            created.append(key)
+            return key
+        
+        try:
+            yield temp_key
+        finally:
+            if created:
+                try:
+                    self.redis.delete(*created)
+                except Exception as e:
+                    logger.warning(f"Error deleting temporary search keys: {e}")
+    
+    def _search_ranked(
+        self,
+        terms: Dict[str, Tuple[str, str]],
+        filter_keys: List[str],
+        offset: int,
+        limit: int,
+        temp_key: Callable[[str], str]
+    ) -> List[str]:
+        """
+        Rank jobs matching every term by BM25 score
+        
+        The term sorted sets are combined with ZINTERSTORE weighted by each
+        term's IDF; filter sets join the intersection with weight 0 so they
+        restrict the result without affecting the score. Only the requested
+        page is read back with ZREVRANGE, in the same round trip.
+        """
+        rank_keys = [rank_key for _, rank_key in terms.values()]
+        
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hget(f"{self.search_index_key}:stats", "docs")
+        for key in rank_keys:
+            pipe.zcard(key)
+        docs, *matches = pipe.execute()
+        
+        weights = {key: self._idf(int(docs or 0), count) for key, count in zip(rank_keys, matches)}
+        for key in filter_keys:
+            weights[key] = 0
+        
+        result_key = temp_key("ranked")
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zinterstore(result_key, weights, aggregate="SUM")
+        pipe.expire(result_key, TEMP_KEY_TTL)
+        pipe.zrevrange(result_key, offset, offset + limit - 1)
+        return pipe.execute()[-1]
     
     def index_job(self, job_id: str, job_data: Dict[str, Any]) -> bool:
         """
@@ -37,65 +648,237 @@ class SearchService:
             return False
         
         try:
-            # Store full job data
-            job_key = f"{self.job_index_prefix}{job_id}"
-            self.redis.setex(
-                job_key,
-                86400 * 30,  # 30 days TTL
-                json.dumps(job_data)
-            )
-            
-            # Index by title, description, and skills_required (simple word indexing)
-            searchable_text = f"{job_data.get('title', '')} {job_data.get('description', '')} {' '.join(job_data.get('skills_required', []))}".lower()
-            words = searchable_text.split()
-            
-            # Add to search index - index words and create n-grams for partial matching
-            for word in words:
-                # Remove punctuation and clean word
-                clean_word = ''.join(c for c in word if c.isalnum())
-                if len(clean_word) >= 2:  # Index words 2+ characters
-                    self.redis.sadd(f"{self.search_index_key}:{clean_word}", job_id)
-                    
-                    # Create n-grams for partial matching (prefixes)
-                    # Index prefixes of 2, 3, 4 characters for partial matching
-                    for n in [2, 3, 4]:
-                        if len(clean_word) >= n:
-                            prefix = clean_word[:n]
-                            self.redis.sadd(f"{self.search_index_key}:prefix:{prefix}", job_id)
-            
-            # Index by tags
-            tags = job_data.get('tags', [])
-            for tag in tags:
-                tag_key = f"{self.tag_index_prefix}{tag.lower()}"
-                self.redis.sadd(tag_key, job_id)
-                self.redis.sadd(f"{self.search_index_key}:tags", tag.lower())
-            
-            # Index by category
-            category = job_data.get('category', '').lower()
-            if category:
-                self.redis.sadd(f"{self.search_index_key}:category:{category}", job_id)
-            
-            # Index by status
-            status = job_data.get('status', '').lower()
-            if status:
-                self.redis.sadd(f"{self.search_index_key}:status:{status}", job_id)
-            
+            self._index_batch({job_id: job_data})
             return True
         
         except Exception as e:
             logger.error(f"Error indexing job {job_id}: {e}")
             return False
     
-    def search_jobs(
+    def index_jobs(
+        self,
+        jobs: Iterable[Tuple[str, Dict[str, Any]]],
+        batch_size: int = 500
+    ) -> int:
+        """
+        Index many jobs, flushing one pipeline per batch
+        
+        Args:
+            jobs: Iterable of (job_id, job_data) pairs, consumed lazily
+            batch_size: Number of jobs written per pipeline flush
+        
+        Returns:
+            Number of jobs indexed
+        """
+        if not self.redis:
+            logger.warning("Redis not available, skipping indexing")
+            return 0
+        
+        indexed = 0
+        batch: Dict[str, Dict[str, Any]] = {}
+        for job_id, job_data in jobs:
+            batch[job_id] = job_data
+            if len(batch) >= batch_size:
+                indexed += self._index_batch_safe(batch)
+                batch = {}
+        if batch:
+            indexed += self._index_batch_safe(batch)
+        return indexed
+    
+    def _index_batch_safe(self, batch: Dict[str, Dict[str, Any]]) -> int:
+        try:
+            self._index_batch(batch)
+            return len(batch)
+        except Exception as e:
+            logger.error(f"Error indexing batch of {len(batch)} jobs: {e}")
+            return 0
+    
+    def _index_batch(self, batch: Dict[str, Dict[str, Any]]):
+        """
+        Write the search index entries for a batch of jobs
+        
+        Costs two round trips whatever the batch size: one pipeline reading
+        the corpus statistics needed for BM25 length normalisation and each
+        job's reverse posting index, and one pipeline with all writes, grouped
+        so each posting key receives a single multi-member SADD/ZADD.
+        Postings a re-indexed job no longer belongs to are removed.
+        
+        The write pipeline is not a transaction, so the jobs are registered in
+        the document length table before any posting is written: compaction
+        (which drops postings of unregistered jobs) never sees a posting of a
+        job that is not registered yet.
+        """
+        doclen_key = f"{self.search_index_key}:doclen"
+        stats_key = f"{self.search_index_key}:stats"
+        job_ids = list(batch)
+        
+        frequencies: Dict[str, Dict[str, float]] = {}
+        lengths: Dict[str, int] = {}
+        for job_id, job_data in batch.items():
+            frequencies[job_id], lengths[job_id] = self._term_frequencies(job_data)
+        
+        # Keep corpus statistics (document count, total length) for length normalisation
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(doclen_key, job_ids)
+        pipe.hgetall(stats_key)
+        for job_id in job_ids:
+            pipe.smembers(self._postings_key(job_id))
+        previous_lengths, stats, *previous_postings = pipe.execute()
+        
+        new_docs = sum(1 for previous in previous_lengths if previous is None)
+        length_delta = sum(
+            lengths[job_id] - int(previous or 0)
+            for job_id, previous in zip(job_ids, previous_lengths)
+        )
+        docs = max(int(stats.get("docs", 0)) + new_docs, 1)
+        avg_length = max(int(stats.get("length", 0)) + length_delta, 1) / docs
+        
+        set_postings: Dict[str, List[str]] = defaultdict(list)
+        rank_postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        tag_deltas: Dict[str, int] = defaultdict(int)
+        category_names: Set[str] = set()
+        fuzzy_words: Set[str] = set()
+        suggestion_deltas: Dict[str, int] = defaultdict(int)
+        
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hset(doclen_key, mapping=lengths)
+        for job_id, old_keys in zip(job_ids, previous_postings):
+            job_data = batch[job_id]
+            # Store full job data
+            pipe.setex(f"{self.job_index_prefix}{job_id}", JOB_CACHE_TTL, json.dumps(job_data))
+            
+            keys = self._set_postings(job_data)
+            for key in keys:
+                set_postings[key].append(job_id)
+            new_tags = {tag.lower() for tag in job_data.get('tags', [])}
+            old_tags = self._tags_of(old_keys or ())
+            for tag in new_tags - old_tags:
+                tag_deltas[tag] += 1
+            for tag in old_tags - new_tags:
+                tag_deltas[tag] -= 1
+            if job_data.get('category'):
+                category_names.add(job_data['category'].lower())
+            fuzzy_words.update(self._fuzzy_words(job_data))
+            new_entries = self._suggestions(job_data)
+            old_entries = self._suggestions_of(old_keys or ())
+            for entry in new_entries - old_entries:
+                suggestion_deltas[entry] += 1
+            for entry in old_entries - new_entries:
+                suggestion_deltas[entry] -= 1
+            
+            # Relevance and attribute postings
+            for key, score in self._bm25_scores(frequencies[job_id], lengths[job_id], avg_length).items():
+                rank_postings[key][job_id] = score
+            for key, score in self._sorted_postings(job_data).items():
+                rank_postings[key][job_id] = score
+                keys.add(key)
+            keys.update(frequencies[job_id])
+            keys.update(self._suggestion_marker(entry) for entry in new_entries)
+            
+            if old_keys:
+                self._queue_posting_removal(pipe, job_id, old_keys - keys)
+                pipe.delete(self._postings_key(job_id))
+            pipe.sadd(self._postings_key(job_id), *keys)
+        
+        for key, members in set_postings.items():
+            pipe.sadd(key, *members)
+        self._queue_vocabulary(pipe, set_postings)
+        for key, scores in rank_postings.items():
+            pipe.zadd(key, scores)
+        self._queue_tag_popularity(pipe, tag_deltas)
+        if category_names:
+            pipe.sadd(f"{self.search_index_key}:categories", *category_names)
+        self._queue_trigrams(pipe, fuzzy_words)
+        self._queue_suggestion_counts(pipe, suggestion_deltas)
+        pipe.hincrby(stats_key, "docs", new_docs)
+        pipe.hincrby(stats_key, "length", length_delta)
+        pipe.incr(self.generation_key)
+        self._execute_write(pipe, job_ids)
+    
+    def _execute_write(self, pipe: Pipeline, job_ids: List[str]):
+        """
+        Execute an index write pipeline, recording the job IDs if a rebuild is running
+        
+        The rebuild marker is read in the same round trip, after the writes.
+        Index writes follow the database commit, so a write that misses the
+        marker was committed before the rebuild started streaming jobs.
+        """
+        pipe.exists(self.rebuild_key)
+        if pipe.execute()[-1]:
+            self.redis.sadd(self.rebuild_writes_key, *job_ids)
+    
+    def _page_by_score(
+        self,
+        key: str,
+        limit: int,
+        after: Optional[Tuple[float, str]] = None,
+        ascending: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Read one page of a sorted set in descending (or ascending) score order
+        
+        Pages are addressed by the (score, member) of the last item returned,
+        so each page is a ZREVRANGEBYSCORE ... LIMIT that starts at the cursor
+        instead of an offset that has to skip all earlier pages. Members with
+        equal scores are ordered by member in the same direction, as Redis
+        orders them.
+        """
+        return self._page_result(self._read_by_score(key, limit + 1, after, ascending), limit)
+    
+    def _read_by_score(
+        self,
+        key: str,
+        count: int,
+        after: Optional[Tuple[float, str]] = None,
+        ascending: bool = False
+    ) -> List[Tuple[str, float]]:
+        """Up to count (member, score) pairs of a sorted set that sort after the cursor"""
+        items: List[Tuple[str, float]] = []
+        start = 0
+        while len(items) < count:
+            if ascending:
+                chunk = self.redis.zrangebyscore(
+                    key, repr(after[0]) if after else "-inf", "+inf",
+                    start=start, num=count, withscores=True
+                )
+            else:
+                chunk = self.redis.zrevrangebyscore(
+                    key, repr(after[0]) if after else "+inf", "-inf",
+                    start=start, num=count, withscores=True
+                )
+            if not chunk:
+                break
+            start += len(chunk)
+            for member, score in chunk:
+                # Skip ties that sort at or before the cursor position
+                if after and score == after[0] and (member <= after[1] if ascending else member >= after[1]):
+                    continue
+                items.append((member, score))
+        return items[:count]
+    
+    def _page_result(self, page: List[Tuple[str, float]], limit: int) -> Dict[str, Any]:
+        """Page of up to limit job IDs with the cursor of the next page, given limit + 1 items"""
+        next_cursor = encode_cursor(page[limit - 1][1], page[limit - 1][0]) if len(page) > limit else None
+        return {"job_ids": [member for member, _ in page[:limit]], "next_cursor": next_cursor}
+    
+    def search_jobs_page(
         self,
         query: Optional[str] = None,
         tags: Optional[List[str]] = None,
         category: Optional[str] = None,
         status: Optional[str] = None,
-        limit: int = 50
-    ) -> List[str]:
+        limit: int = 50,
+        sort: Optional[str] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        fuzzy: bool = True,
+        min_budget: Optional[float] = None,
+        max_budget: Optional[float] = None,
+        deadline_after: Optional[datetime] = None,
+        deadline_before: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
-        Search for jobs
+        Search for jobs, returning one page of results
         
         Args:
             query: Text search query
@@ -103,128 +886,591 @@ class SearchService:
             category: Category filter
             status: Status filter
             limit: Maximum number of results
+            sort: "relevance" to rank text matches by BM25 score, or a
+                SORT_ATTRIBUTES key to order by budget or deadline
+            offset: Number of ranked results to skip (relevance sort only)
+            cursor: Token from a previous page's next_cursor (listings
+                ordered by date, budget or deadline)
+            fuzzy: Correct query terms that match no job (typo tolerance)
+            min_budget: Minimum budget (inclusive)
+            max_budget: Maximum budget (inclusive)
+            deadline_after: Earliest deadline (inclusive)
+            deadline_before: Latest deadline (inclusive)
         
         Returns:
-            List of job IDs
+            Dict with "job_ids", "next_cursor" (None when there are no more
+            pages) and "corrections" (misspelled term -> word searched instead)
+        
+        Raises:
+            ValueError: If cursor is malformed
         """
+        after = decode_cursor(cursor) if cursor else None
+        ranges = range_filters(min_budget, max_budget, deadline_after, deadline_before)
+        
         if not self.redis:
             logger.warning("Redis not available, returning empty results")
+            return {"job_ids": [], "next_cursor": None, "corrections": {}}
+        
+        try:
+            digest = self._result_digest(query, tags, category, status, ranges, limit, sort, offset, cursor, fuzzy)
+            cache_key, page = self._cached_page(digest)
+            if page is not None:
+                return page
+            
+            page = self._search_page(query, tags, category, status, ranges, limit, sort, offset, after, fuzzy)
+            self._cache_page(cache_key, page)
+            return page
+        
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            return {"job_ids": [], "next_cursor": None, "corrections": {}}
+    
+    def _search_page(
+        self,
+        query: Optional[str],
+        tags: Optional[List[str]],
+        category: Optional[str],
+        status: Optional[str],
+        ranges: Dict[str, Tuple[float, float]],
+        limit: int,
+        sort: Optional[str],
+        offset: int,
+        after: Optional[Tuple[float, str]],
+        fuzzy: bool
+    ) -> Dict[str, Any]:
+        """Run a search against the index (see search_jobs_page)"""
+        # Start with all jobs if no filters, newest first
+        if not query and not tags and not category and not status and not ranges and sort not in SORT_ATTRIBUTES:
+            page = self._page_by_score(self.all_jobs_key, limit, after)
+            page["corrections"] = {}
+            return page
+        
+        with self._temp_keys() as temp_key:
+            terms, corrections = self._query_terms(query, fuzzy, temp_key)
+            if sort == SORT_RELEVANCE and terms:
+                filters = self._filter_sets(terms, tags, category, status, temp_key)
+                filter_keys = [key for key in filters.values() if key][len(terms):] + self._range_sets(ranges, temp_key)
+                page = {"job_ids": self._search_ranked(terms, filter_keys, offset, limit, temp_key), "next_cursor": None}
+            else:
+                page = self._search_sorted(terms, tags, category, status, ranges, limit, sort, after, temp_key)
+        
+        page["corrections"] = corrections
+        return page
+    
+    def _result_digest(self, *params: Any) -> str:
+        """
+        Digest of the canonical search parameters
+        
+        Queries are reduced to their distinct terms and tags, categories and
+        statuses are lowercased, so equivalent searches share an entry.
+        """
+        query, tags, category, status, ranges, limit, sort, offset, cursor, fuzzy = params
+        normalized = {
+            "terms": sorted(set(tokenize(query or ''))),
+            "tags": sorted({tag.lower() for tag in tags or []}),
+            "category": (category or '').lower(),
+            "status": (status or '').lower(),
+            "ranges": {attribute: [repr(low), repr(high)] for attribute, (low, high) in ranges.items()},
+            "limit": limit,
+            "sort": sort,
+            "offset": offset,
+            "cursor": cursor,
+            "fuzzy": fuzzy,
+        }
+        return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+    
+    def _cached_page(self, digest: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Result cache key under the current index generation and the page cached there
+        
+        One round trip (CACHED_PAGE_SCRIPT), which also counts the hit or miss.
+        The generation is read before the search runs, so a page computed
+        while the index changes is stored under the old generation and never
+        served.
+        """
+        lookup = self.redis.register_script(CACHED_PAGE_SCRIPT)
+        generation, cached = lookup(keys=[self.generation_key, self.cache_stats_key], args=[self.result_cache_prefix, digest])
+        cache_key = f"{self.result_cache_prefix}{generation}:{digest}"
+        return cache_key, json.loads(cached) if cached else None
+    
+    def _cache_page(self, cache_key: str, page: Dict[str, Any]):
+        """Store a result page"""
+        self.redis.setex(cache_key, RESULT_CACHE_TTL, json.dumps(page))
+    
+    def cache_metrics(self) -> Dict[str, Any]:
+        """
+        Result cache hit and miss counts across all workers
+        
+        Returns:
+            Dict with "lookups", "hits", "misses", "hit_ratio", "miss_ratio"
+            and the current index "generation"
+        """
+        if not self.redis:
+            return {"lookups": 0, "hits": 0, "misses": 0, "hit_ratio": 0.0, "miss_ratio": 0.0, "generation": 0}
+        
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hgetall(self.cache_stats_key)
+        pipe.get(self.generation_key)
+        stats, generation = pipe.execute()
+        
+        hits = int(stats.get("hits", 0))
+        misses = int(stats.get("misses", 0))
+        lookups = hits + misses
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "miss_ratio": misses / lookups if lookups else 0.0,
+            "generation": int(generation or 0),
+        }
+    
+    def _query_terms(
+        self,
+        query: Optional[str],
+        fuzzy: bool,
+        temp_key: Callable[[str], str]
+    ) -> Tuple[Dict[str, Tuple[str, str]], Dict[str, str]]:
+        """
+        Distinct query terms, with misspelled terms replaced when fuzzy
+        
+        Returns:
+            (term -> (posting set, rank set), see _resolve_terms; corrections)
+        """
+        terms = list(dict.fromkeys(tokenize(query or '')))
+        expansions = self._expand_terms(terms)
+        corrections = self._correct_terms(terms, expansions, temp_key) if fuzzy else {}
+        if corrections:
+            terms = list(dict.fromkeys(corrections.get(term, term) for term in terms))
+            expansions.update(self._expand_terms(set(corrections.values())))
+        return self._resolve_terms(terms, expansions, temp_key), corrections
+    
+    def _search_sorted(
+        self,
+        terms: Dict[str, Tuple[str, str]],
+        tags: Optional[List[str]],
+        category: Optional[str],
+        status: Optional[str],
+        ranges: Dict[str, Tuple[float, float]],
+        limit: int,
+        sort: Optional[str],
+        after: Optional[Tuple[float, str]],
+        temp_key: Callable[[str], str]
+    ) -> Dict[str, Any]:
+        """
+        One page of the filtered jobs ordered by date, budget or deadline
+        
+        Searches without a sort attribute (and relevance sorts without text
+        terms) are ordered newest first, like the unfiltered listing, and a
+        sort without filters pages the attribute index directly. Otherwise
+        the plan depends on the smallest filter:
+        
+        - selective (at most SELECTIVE_FILTER_SIZE jobs): the filter sets and
+          range sets join a ZINTERSTORE with weight 0, so the result is scored
+          by the sort attribute alone. ZINTERSTORE costs are driven by the
+          smallest input, which keeps this cheap.
+        - broad: the sort index is walked from the cursor and each chunk is
+          tested with SMISMEMBER (ZMSCORE for ranges) until the page is full,
+          so the cost follows the page size rather than the size of the
+          filters (see _walk_sorted).
+        
+        Both page with a (score, job_id) cursor.
+        """
+        attribute, ascending = SORT_ATTRIBUTES.get(sort, (None, False))
+        sort_key = self.attribute_keys[attribute] if attribute else self.all_jobs_key
+        
+        filters = self._filter_sets(terms, tags, category, status, temp_key)
+        set_keys = [key for key in filters.values() if key]
+        if not set_keys and not ranges:
+            return self._page_by_score(sort_key, limit, after, ascending)
+        
+        if self._smallest_filter(set_keys, ranges) > SELECTIVE_FILTER_SIZE:
+            page = self._walk_sorted(sort_key, set_keys, ranges, limit, after, ascending)
+            if page is not None:
+                return page
+        
+        weights = {key: 0 for key in set_keys + self._range_sets(ranges, temp_key)}
+        weights[sort_key] = 1
+        result_key = temp_key("sorted")
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zinterstore(result_key, weights, aggregate="SUM")
+        pipe.expire(result_key, TEMP_KEY_TTL)
+        pipe.execute()
+        return self._page_by_score(result_key, limit, after, ascending)
+    
+    def _smallest_filter(self, set_keys: List[str], ranges: Dict[str, Tuple[float, float]]) -> int:
+        """Number of jobs matching the most selective filter (SCARD, ZCOUNT for ranges)"""
+        pipe = self.redis.pipeline(transaction=False)
+        for key in set_keys:
+            pipe.scard(key)
+        for attribute, (low, high) in ranges.items():
+            pipe.zcount(self.attribute_keys[attribute], score_bound(low), score_bound(high))
+        return min(pipe.execute())
+    
+    def _walk_sorted(
+        self,
+        sort_key: str,
+        set_keys: List[str],
+        ranges: Dict[str, Tuple[float, float]],
+        limit: int,
+        after: Optional[Tuple[float, str]],
+        ascending: bool
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Walk the sort index from the cursor, keeping the jobs that pass every filter
+        
+        Each chunk of SORTED_WALK_CHUNK jobs costs one pipeline of SMISMEMBER
+        (one per filter set) and ZMSCORE (one per range attribute) calls.
+        Returns None when SORTED_WALK_BUDGET jobs were scanned without
+        filling the page, for the caller to intersect instead.
+        """
+        page: List[Tuple[str, float]] = []
+        position = after
+        scanned = 0
+        while len(page) <= limit:
+            if scanned >= SORTED_WALK_BUDGET:
+                return None
+            chunk = self._read_by_score(sort_key, SORTED_WALK_CHUNK, position, ascending)
+            if not chunk:
+                break
+            scanned += len(chunk)
+            position = (chunk[-1][1], chunk[-1][0])
+            
+            members = [member for member, _ in chunk]
+            pipe = self.redis.pipeline(transaction=False)
+            for key in set_keys:
+                pipe.smismember(key, members)
+            for attribute in ranges:
+                pipe.zmscore(self.attribute_keys[attribute], members)
+            results = pipe.execute()
+            
+            memberships = results[:len(set_keys)]
+            for scores, (low, high) in zip(results[len(set_keys):], ranges.values()):
+                memberships.append([score is not None and low <= score <= high for score in scores])
+            page.extend(item for item, *matches in zip(chunk, *memberships) if all(matches))
+            if len(chunk) < SORTED_WALK_CHUNK:
+                break
+        
+        return self._page_result(page, limit)
+    
+    def _range_sets(
+        self,
+        ranges: Dict[str, Tuple[float, float]],
+        temp_key: Callable[[str], str]
+    ) -> List[str]:
+        """
+        Copy the members of each attribute index within its range into a temporary key
+        
+        ZRANGESTORE ... BYSCORE only touches the members in range (O(log N + M)),
+        and the copies are sorted sets that ZINTERSTORE can combine with the
+        posting sets.
+        """
+        if not ranges:
             return []
+        keys = []
+        pipe = self.redis.pipeline(transaction=False)
+        for attribute, (low, high) in ranges.items():
+            range_key = temp_key(f"range:{attribute}")
+            pipe.zrangestore(range_key, self.attribute_keys[attribute], score_bound(low), score_bound(high), byscore=True)
+            pipe.expire(range_key, TEMP_KEY_TTL)
+            keys.append(range_key)
+        pipe.execute()
+        return keys
+    
+    def _filter_sets(
+        self,
+        terms: Dict[str, Tuple[str, str]],
+        tags: Optional[List[str]],
+        category: Optional[str],
+        status: Optional[str],
+        temp_key: Callable[[str], str]
+    ) -> Dict[str, Optional[str]]:
+        """
+        Posting set of each filter dimension (None when the filter is unset)
+        
+        Text terms come first, one entry per term (the posting sets resolved
+        by _query_terms), so callers can split them off. Multiple tags match any of the tags and are unioned into a
+        temporary key.
+        """
+        filters: Dict[str, Optional[str]] = {}
+        
+        # Text search - every term must match a word (or word prefix) in the job
+        for term, (set_key, _) in terms.items():
+            filters[f"term:{term}"] = set_key
+        
+        # Tag filter
+        filters["tags"] = None
+        if tags:
+            tag_sets = [f"{self.tag_index_prefix}{tag.lower()}" for tag in tags]
+            if len(tag_sets) == 1:
+                filters["tags"] = tag_sets[0]
+            else:
+                tags_key = temp_key("tags")
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.sunionstore(tags_key, *tag_sets)
+                pipe.expire(tags_key, TEMP_KEY_TTL)
+                pipe.execute()
+                filters["tags"] = tags_key
+        
+        # Category filter
+        filters["category"] = f"{self.search_index_key}:category:{category.lower()}" if category else None
+        
+        # Status filter
+        filters["status"] = f"{self.search_index_key}:status:{status.lower()}" if status else None
+        
+        return filters
+    
+    def facets(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        tag_limit: int = FACET_TAG_LIMIT
+    ) -> Dict[str, Any]:
+        """
+        Count matching jobs per tag, category and status
+        
+        Each dimension is counted with every other filter applied but not its
+        own, so the counts show what selecting another value would return
+        (tags keep their "any of" semantics). Only the tag_limit most popular
+        tags are counted. All counts are SINTERCARDs (SINTERSTOREs before
+        Redis 7) sent in a single pipeline, and the result is cached per
+        normalized query and index generation. Misspelled terms are corrected
+        as in search_jobs_page.
+        
+        Args:
+            query: Text search query
+            tags: List of tags to filter by
+            category: Category filter
+            status: Status filter
+            tag_limit: Number of most popular tags to count
+        
+        Returns:
+            Dict with "total" and "tags", "categories", "statuses" mappings of
+            value to count, ordered by count (values with no matches omitted)
+        """
+        empty = {"total": 0, "tags": {}, "categories": {}, "statuses": {}}
+        if not self.redis:
+            return empty
+        
+        terms = sorted(set(tokenize(query or '')))
+        normalized = {
+            "terms": terms,
+            "tags": sorted({tag.lower() for tag in tags or []}),
+            "category": (category or '').lower(),
+            "status": (status or '').lower(),
+            "tag_limit": tag_limit,
+        }
+        digest = hashlib.sha1(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
         
         try:
-            result_keys = []
+            # Read before counting, so counts racing a write are filed under the old generation
+            generation = int(self.redis.get(self.generation_key) or 0)
+            cache_key = f"{self.search_index_key}:facets:{generation}:{digest}"
+            cached = self.redis.get(cache_key)
+            if cached:
+                return json.loads(cached)
+            
+            with self._temp_keys() as temp_key:
+                terms, _ = self._query_terms(query, True, temp_key)
+                result = self._count_facets(terms, normalized["tags"], category, status, tag_limit, temp_key)
             
-            # Start with all jobs if no filters
-            if not query and not tags and not category and not status:
-                # Get all job IDs
-                pattern = f"{self.job_index_prefix}*"
-                keys = self.redis.keys(pattern)
-                result_keys = [key.replace(self.job_index_prefix, "") for key in keys]
+            self.redis.setex(cache_key, FACET_CACHE_TTL, json.dumps(result))
+            return result
+        
+        except Exception as e:
+            logger.error(f"Error computing facets: {e}")
+            return empty
+    
+    def _count_facets(
+        self,
+        terms: Dict[str, Tuple[str, str]],
+        tags: List[str],
+        category: Optional[str],
+        status: Optional[str],
+        tag_limit: int,
+        temp_key: Callable[[str], str]
+    ) -> Dict[str, Any]:
+        filters = self._filter_sets(terms, tags, category, status, temp_key)
+        has_sintercard = self._supports_sintercard()
+        
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zrevrange(self.tag_popularity_key, 0, tag_limit - 1)
+        pipe.smembers(f"{self.search_index_key}:categories")
+        tag_values, category_values = pipe.execute()
+        
+        dimensions = {
+            "tags": (f"{self.tag_index_prefix}", sorted(tag_values)),
+            "categories": (f"{self.search_index_key}:category:", sorted(category_values)),
+            "statuses": (f"{self.search_index_key}:status:", [value.value for value in JobStatus]),
+        }
+        own_filter = {"tags": "tags", "categories": "category", "statuses": "status"}
+        # Pipeline position of each count (the SINTERSTORE fallback queues extra commands)
+        positions: List[int] = []
+        count_key = None if has_sintercard else temp_key("count")
+        
+        def queue_count(keys: List[str]):
+            positions.append(len(pipe))
+            if not keys:
+                pipe.zcard(self.all_jobs_key)
+            elif len(keys) == 1:
+                pipe.scard(keys[0])
+            elif has_sintercard:
+                pipe.sintercard(len(keys), keys)
             else:
-                # Build intersection of filters
-                sets_to_intersect = []
-                
-                # Text search - supports partial word matching
-                if query:
-                    query_lower = query.lower().strip()
-                    if len(query_lower) >= 2:  # Allow searches with 2+ characters
-                        # Get all job keys to search through
-                        all_job_keys = self.redis.keys(f"{self.job_index_prefix}*")
-                        matching_job_ids = set()
-                        
-                        # Search through job data for partial matches
-                        for job_key in all_job_keys:
-                            try:
-                                job_data_str = self.redis.get(job_key)
-                                if job_data_str:
-                                    job_data = json.loads(job_data_str)
-                                    
-                                    # Search in title, description, tags, skills, and category
-                                    searchable_fields = [
-                                        job_data.get('title', ''),
-                                        job_data.get('description', ''),
-                                        ' '.join(job_data.get('tags', [])),
-                                        job_data.get('category', ''),
-                                        ' '.join(job_data.get('skills_required', []))
-                                    ]
-                                    searchable_text = ' '.join(searchable_fields).lower()
-                                    
-                                    # Check if query appears anywhere (partial match)
-                                    if query_lower in searchable_text:
-                                        job_id = job_key.replace(self.job_index_prefix, "")
-                                        matching_job_ids.add(job_id)
-                            except Exception as e:
-                                logger.warning(f"Error processing job {job_key}: {e}")
-                                continue
-                        
-                        # Store matching IDs temporarily for intersection
-                        if matching_job_ids:
-                            temp_key = f"{self.search_index_key}:temp:query:{hash(query_lower)}"
-                            # Clean up old temp key if exists
-                            self.redis.delete(temp_key)
-                            if matching_job_ids:
-                                self.redis.sadd(temp_key, *matching_job_ids)
-                                self.redis.expire(temp_key, 60)  # 60 second TTL
-                            sets_to_intersect.append(temp_key)
-                        else:
-                            # No matches, create empty set to ensure no results
-                            temp_key = f"{self.search_index_key}:temp:query:empty:{hash(query_lower)}"
-                            self.redis.delete(temp_key)
-                            self.redis.sadd(temp_key, "no_match_placeholder")
-                            self.redis.expire(temp_key, 60)
-                            sets_to_intersect.append(temp_key)
-                
-                # Tag filter
-                if tags:
-                    tag_sets = [f"{self.tag_index_prefix}{tag.lower()}" for tag in tags]
-                    if len(tag_sets) == 1:
-                        sets_to_intersect.append(tag_sets[0])
-                    else:
-                        temp_key = f"{self.search_index_key}:temp:tags"
-                        self.redis.sunionstore(temp_key, *tag_sets)
-                        sets_to_intersect.append(temp_key)
-                
-                # Category filter
-                if category:
-                    sets_to_intersect.append(f"{self.search_index_key}:category:{category.lower()}")
-                
-                # Status filter
-                if status:
-                    sets_to_intersect.append(f"{self.search_index_key}:status:{status.lower()}")
-                
-                # Intersect all sets
-                if sets_to_intersect:
-                    if len(sets_to_intersect) == 1:
-                        result_keys = list(self.redis.smembers(sets_to_intersect[0]))
-                    else:
-                        temp_result_key = f"{self.search_index_key}:temp:result"
-                        self.redis.sinterstore(temp_result_key, *sets_to_intersect)
-                        result_keys = list(self.redis.smembers(temp_result_key))
-                        self.redis.delete(temp_result_key)
-                    
-                    # Filter out placeholder values
-                    result_keys = [k for k in result_keys if k != "no_match_placeholder"]
-                    
-                    # Clean up temp keys
-                    temp_keys_to_clean = []
-                    for key in sets_to_intersect:
-                        if ':temp:' in key:
-                            temp_keys_to_clean.append(key)
-                    for key in temp_keys_to_clean:
-                        try:
-                            self.redis.delete(key)
-                        except:
-                            pass
+                # SINTERSTORE replies with the cardinality of the stored intersection
+                pipe.sinterstore(count_key, *keys)
+                pipe.expire(count_key, TEMP_KEY_TTL)
+        
+        queue_count([key for key in filters.values() if key])
+        for name, (prefix, values) in dimensions.items():
+            base = [key for dimension, key in filters.items() if key and dimension != own_filter[name]]
+            for value in values:
+                queue_count(base + [f"{prefix}{value}"])
+        replies = pipe.execute()
+        counts = iter(replies[position] for position in positions)
+        
+        result: Dict[str, Any] = {"total": next(counts)}
+        for name, (_, values) in dimensions.items():
+            matched = [(value, count) for value, count in zip(values, counts) if count]
+            matched.sort(key=lambda item: (-item[1], item[0]))
+            result[name] = dict(matched)
+        return result
+    
+    def _supports_sintercard(self) -> bool:
+        """Whether the server is Redis 7+ (SINTERCARD), checked once per service"""
+        if self._has_sintercard is None:
+            try:
+                version = str(self.redis.info("server").get("redis_version", "0"))
+                major = version.split(".")[0]
+                self._has_sintercard = major.isdigit() and int(major) >= 7
+            except Exception as e:
+                # Servers that restrict INFO get the SINTERSTORE fallback, which works everywhere
+                logger.warning(f"Could not read the Redis version, counting facets without SINTERCARD: {e}")
+                self._has_sintercard = False
+        return self._has_sintercard
+    
+    def reindex_job(self, job_id: str, job_data: Dict[str, Any]) -> bool:
+        """
+        Update the index entries of a job after it changed
+        
+        The new postings are diffed against the job's reverse posting index
+        and only the posting sets whose values changed are touched, e.g. a
+        status change is one SREM and one SADD. Relevance postings are
+        rewritten only when a text field changed. Jobs that were never
+        indexed (or whose cached document expired) are fully indexed.
+        
+        Args:
+            job_id: Job ID
+            job_data: New job data dictionary
+        
+        Returns:
+            True if successful
+        """
+        if not self.redis:
+            logger.warning("Redis not available, skipping reindexing")
+            return False
+        
+        try:
+            postings_key = self._postings_key(job_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(f"{self.job_index_prefix}{job_id}")
+            pipe.smembers(postings_key)
+            previous_data, old_keys = pipe.execute()
+            if not previous_data or not old_keys:
+                self._index_batch({job_id: job_data})
+                return True
+            previous = json.loads(previous_data)
+            
+            rank_prefix = f"{self.search_index_key}:rank:"
+            old_rank_keys = {key for key in old_keys if key.startswith(rank_prefix)}
+            old_set_keys = {key for key in old_keys if not self._is_sorted_key(key)}
+            new_set_keys = self._set_postings(job_data)
+            sorted_postings = self._sorted_postings(job_data)
+            
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.setex(f"{self.job_index_prefix}{job_id}", JOB_CACHE_TTL, json.dumps(job_data))
+            for key in new_set_keys - old_set_keys:
+                pipe.sadd(key, job_id)
+            self._queue_vocabulary(pipe, new_set_keys - old_set_keys)
+            self._queue_posting_removal(pipe, job_id, old_set_keys - new_set_keys)
+            
+            new_tags = {tag.lower() for tag in job_data.get('tags', [])}
+            old_tags = self._tags_of(old_keys)
+            tag_deltas = {tag: 1 for tag in new_tags - old_tags}
+            tag_deltas.update((tag, -1) for tag in old_tags - new_tags)
+            self._queue_tag_popularity(pipe, tag_deltas)
+            new_category = job_data.get('category', '').lower()
+            if new_category and new_category != previous.get('category', '').lower():
+                pipe.sadd(f"{self.search_index_key}:categories", new_category)
+            self._queue_trigrams(pipe, self._fuzzy_words(job_data) - self._fuzzy_words(previous))
+            new_entries = self._suggestions(job_data)
+            old_entries = self._suggestions_of(old_keys)
+            suggestion_deltas = {entry: 1 for entry in new_entries - old_entries}
+            suggestion_deltas.update((entry, -1) for entry in old_entries - new_entries)
+            self._queue_suggestion_counts(pipe, suggestion_deltas)
+            markers = {self._suggestion_marker(entry) for entry in new_entries}
             
-            # Limit results
-            return result_keys[:limit]
+            previous_sorted = self._sorted_postings(previous)
+            for key, score in sorted_postings.items():
+                if key not in old_keys or previous_sorted.get(key) != score:
+                    pipe.zadd(key, {job_id: score})
+            self._queue_posting_removal(pipe, job_id, set(previous_sorted) - set(sorted_postings))
+            
+            new_keys = new_set_keys | old_rank_keys | set(sorted_postings) | markers
+            if any(self._field_text(previous, field) != self._field_text(job_data, field) for field in FIELD_WEIGHTS):
+                new_rank_keys = self._queue_rank_update(pipe, job_id, previous, job_data)
+                self._queue_posting_removal(pipe, job_id, old_rank_keys - new_rank_keys)
+                new_keys = new_set_keys | new_rank_keys | set(sorted_postings) | markers
+            
+            if old_keys - new_keys:
+                pipe.srem(postings_key, *(old_keys - new_keys))
+            if new_keys - old_keys:
+                pipe.sadd(postings_key, *(new_keys - old_keys))
+            pipe.incr(self.generation_key)
+            
+            self._execute_write(pipe, [job_id])
+            return True
         
         except Exception as e:
-            logger.error(f"Error searching jobs: {e}")
-            return []
+            logger.error(f"Error reindexing job {job_id}: {e}")
+            return False
+    
+    def _queue_rank_update(
+        self,
+        pipe: Pipeline,
+        job_id: str,
+        previous: Dict[str, Any],
+        job_data: Dict[str, Any]
+    ) -> Set[str]:
+        """Queue the relevance postings of an edited job on pipe, returns its rank keys"""
+        stats_key = f"{self.search_index_key}:stats"
+        _, old_length = self._term_frequencies(previous)
+        frequencies, length = self._term_frequencies(job_data)
+        
+        stats = self.redis.hgetall(stats_key)
+        docs = max(int(stats.get("docs", 1)), 1)
+        avg_length = max(int(stats.get("length", 0)) + length - old_length, 1) / docs
+        
+        for key, score in self._bm25_scores(frequencies, length, avg_length).items():
+            pipe.zadd(key, {job_id: score})
+        
+        pipe.hset(f"{self.search_index_key}:doclen", job_id, length)
+        pipe.hincrby(stats_key, "length", length - old_length)
+        return set(frequencies)
+    
+    def sync_job(self, job: Job) -> bool:
+        """Bring the index entries of a Job row in line with the database after a commit"""
+        try:
+            job_data = job_to_document(job)
+        except Exception as e:
+            logger.error(f"Error reading job for reindexing: {e}")
+            return False
+        return self.reindex_job(job_data['id'], job_data)
     
     def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
-        """Get job data from Redis cache"""
+        """Get job data from Redis cache (None for documents of the original indexer)"""
         if not self.redis:
             return None
         
@@ -232,67 +1478,529 @@ class SearchService:
             job_key = f"{self.job_index_prefix}{job_id}"
             job_data = self.redis.get(job_key)
             if job_data:
-                return json.loads(job_data)
+                document = json.loads(job_data)
+                return document if is_full_document(document) else None
             return None
         except Exception as e:
             logger.error(f"Error getting job {job_id}: {e}")
             return None
-    
+
+    def get_jobs(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached job documents in a single MGET
+
+        Args:
+            job_ids: Job IDs to fetch
+
+        Returns:
+            Mapping of job ID to document for the IDs present in the cache.
+            Partial documents left by the original indexer are left out, so
+            callers reload them from the database.
+        """
+        if not self.redis or not job_ids:
+            return {}
+
+        try:
+            values = self.redis.mget([f"{self.job_index_prefix}{job_id}" for job_id in job_ids])
+            documents = (
+                (job_id, json.loads(value))
+                for job_id, value in zip(job_ids, values)
+                if value is not None
+            )
+            return {job_id: document for job_id, document in documents if is_full_document(document)}
+        except Exception as e:
+            logger.error(f"Error getting cached jobs: {e}")
+            return {}
+
+    def cache_jobs(self, documents: Dict[str, Dict[str, Any]]) -> bool:
+        """
+        Write job documents back into the cache without touching the index
+
+        Args:
+            documents: Mapping of job ID to document (see job_to_document)
+
+        Returns:
+            True if the documents were written
+        """
+        if not self.redis or not documents:
+            return False
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for job_id, document in documents.items():
+                pipe.setex(f"{self.job_index_prefix}{job_id}", JOB_CACHE_TTL, json.dumps(document))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error caching jobs: {e}")
+            return False
+
+    def hydrate_jobs(self, job_ids: List[str], db_factory: Callable[[], Session]) -> List[Dict[str, Any]]:
+        """
+        Load job documents for search results, cache first
+
+        Documents come from one MGET; only cache misses are read from the
+        database (opening a session only when there are misses) and are
+        written back so the next search finds them. IDs that no longer exist
+        in the database are dropped.
+
+        Args:
+            job_ids: Job IDs in ranking order
+            db_factory: Callable returning a new database session
+
+        Returns:
+            Job documents in the same order as job_ids
+        """
+        documents = self.get_jobs(job_ids)
+        missing = [job_id for job_id in job_ids if job_id not in documents]
+
+        if missing:
+            db = db_factory()
+            try:
+                loaded = {
+                    job.id: job_to_document(job)
+                    for job in db.query(Job).filter(Job.id.in_(missing)).all()
+                }
+            finally:
+                db.close()
+            self.cache_jobs(loaded)
+            documents.update(loaded)
+
+        return [documents[job_id] for job_id in job_ids if job_id in documents]
+
     def delete_job(self, job_id: str) -> bool:
-        """Remove job from search index"""
+        """
+        Remove job from search index
+        
+        Uses the job's reverse posting index, so the cost is proportional to
+        the number of postings of that job and no posting set keeps the ID.
+        """
         if not self.redis:
             return False
         
         try:
-            job_key = f"{self.job_index_prefix}{job_id}"
-            job_data = self.redis.get(job_key)
+            doclen_key = f"{self.search_index_key}:doclen"
+            postings_key = self._postings_key(job_id)
             
-            if job_data:
-                job = json.loads(job_data)
-                
-                # Remove from word indexes
-                searchable_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-                words = searchable_text.split()
-                for word in words:
-                    if len(word) > 2:
-                        self.redis.srem(f"{self.search_index_key}:{word}", job_id)
-                
-                # Remove from tag indexes
-                tags = job.get('tags', [])
-                for tag in tags:
-                    tag_key = f"{self.tag_index_prefix}{tag.lower()}"
-                    self.redis.srem(tag_key, job_id)
-                
-                # Remove from category and status indexes
-                category = job.get('category', '').lower()
-                if category:
-                    self.redis.srem(f"{self.search_index_key}:category:{category}", job_id)
-                
-                status = job.get('status', '').lower()
-                if status:
-                    self.redis.srem(f"{self.search_index_key}:status:{status}", job_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.smembers(postings_key)
+            pipe.hget(doclen_key, job_id)
+            postings, length = pipe.execute()
+            
+            pipe = self.redis.pipeline(transaction=False)
+            self._queue_posting_removal(pipe, job_id, postings)
+            self._queue_tag_popularity(pipe, {tag: -1 for tag in self._tags_of(postings)})
+            self._queue_suggestion_counts(pipe, {entry: -1 for entry in self._suggestions_of(postings)})
+            if length is not None:
+                stats_key = f"{self.search_index_key}:stats"
+                pipe.hdel(doclen_key, job_id)
+                pipe.hincrby(stats_key, "docs", -1)
+                pipe.hincrby(stats_key, "length", -int(length))
             
             # Delete job data
-            self.redis.delete(job_key)
+            pipe.delete(f"{self.job_index_prefix}{job_id}", postings_key)
+            pipe.incr(self.generation_key)
+            self._execute_write(pipe, [job_id])
             return True
         
         except Exception as e:
             logger.error(f"Error deleting job {job_id}: {e}")
             return False
     
-    def get_all_tags(self) -> List[str]:
-        """Get all available tags"""
+    def _posting_patterns(self) -> List[str]:
+        """SCAN patterns covering every posting set and relevance sorted set"""
+        return [
+            f"{self.search_index_key}:word:*",
+            f"{self.search_index_key}:prefix:*",
+            f"{self.search_index_key}:rank:*",
+            f"{self.search_index_key}:category:*",
+            f"{self.search_index_key}:status:*",
+            f"{self.tag_index_prefix}*",
+            self.all_jobs_key,
+            *self.attribute_keys.values(),
+        ]
+    
+    def compact_index(self, batch_size: int = 500) -> int:
+        """
+        Remove dangling job IDs from every posting set
+        
+        A job ID is dangling when the job is no longer registered in the
+        index (it has no entry in the document length table), e.g. postings
+        leaked by deletions made before the reverse index existed. Posting
+        sets are walked with SCAN/SSCAN/ZSCAN so Redis is never blocked, and
+        each batch of members is checked with one HMGET and cleaned in a
+        WATCH/MULTI transaction on the document length table, so a job
+        registered by a concurrent index write is never removed. Trigram sets
+        are pruned of words no job contains any more (see _prune_trigrams).
+        
+        Returns:
+            Number of postings and trigram entries removed
+        """
         if not self.redis:
+            return 0
+        
+        doclen_key = f"{self.search_index_key}:doclen"
+        removed = 0
+        
+        for pattern in self._posting_patterns():
+            for key in self.redis.scan_iter(match=pattern, count=batch_size):
+                if self._is_sorted_key(key):
+                    members = (member for member, _ in self.redis.zscan_iter(key, count=batch_size))
+                else:
+                    members = self.redis.sscan_iter(key, count=batch_size)
+                
+                batch: List[str] = []
+                for member in members:
+                    batch.append(member)
+                    if len(batch) >= batch_size:
+                        removed += self._remove_unregistered(doclen_key, key, batch)
+                        batch = []
+                if batch:
+                    removed += self._remove_unregistered(doclen_key, key, batch)
+        
+        for key in self.redis.scan_iter(match=self._trigram_key("*"), count=batch_size):
+            batch = []
+            for word in self.redis.sscan_iter(key, count=batch_size):
+                batch.append(word)
+                if len(batch) >= batch_size:
+                    removed += self._prune_trigrams(key, batch)
+                    batch = []
+            if batch:
+                removed += self._prune_trigrams(key, batch)
+        
+        if removed:
+            self.redis.incr(self.generation_key)
+            logger.info(f"Search index compaction removed {removed} dangling postings")
+        return removed
+    
+    def _remove_unregistered(self, doclen_key: str, key: str, job_ids: List[str]) -> int:
+        """
+        Remove the job IDs that are not in the document length table from a posting key
+        
+        The check and the removal run under WATCH, so a job registered in
+        between aborts the transaction and the batch is checked again. A batch
+        that keeps losing the race is left for the next compaction run.
+        """
+        with self.redis.pipeline() as pipe:
+            for _ in range(COMPACTION_RETRIES):
+                try:
+                    pipe.watch(doclen_key)
+                    lengths = pipe.hmget(doclen_key, job_ids)
+                    dangling = [job_id for job_id, length in zip(job_ids, lengths) if length is None]
+                    if not dangling:
+                        pipe.unwatch()
+                        return 0
+                    pipe.multi()
+                    if self._is_sorted_key(key):
+                        pipe.zrem(key, *dangling)
+                    else:
+                        pipe.srem(key, *dangling)
+                    return pipe.execute()[0]
+                except redis.WatchError:
+                    continue
+        return 0
+    
+    def _prune_trigrams(self, key: str, words: List[str]) -> int:
+        """
+        Remove the words that no longer have a word posting set from a trigram set
+        
+        The word sets are watched while they are checked, so a word indexed
+        again in between aborts the transaction and the batch is checked
+        again, as in _remove_unregistered.
+        """
+        word_keys = {word: f"{self.search_index_key}:word:{word}" for word in words}
+        with self.redis.pipeline() as pipe:
+            for _ in range(COMPACTION_RETRIES):
+                try:
+                    pipe.watch(*word_keys.values())
+                    exists = [pipe.exists(word_key) for word_key in word_keys.values()]
+                    gone = [word for word, found in zip(word_keys, exists) if not found]
+                    if not gone:
+                        pipe.unwatch()
+                        return 0
+                    pipe.multi()
+                    pipe.srem(key, *gone)
+                    return pipe.execute()[0]
+                except redis.WatchError:
+                    continue
+        return 0
+    
+    def _index_patterns(self) -> List[str]:
+        """SCAN patterns covering every key of this index"""
+        return [
+            f"{self.job_index_prefix}*",
+            f"{self.tag_index_prefix}*",
+            f"{self.search_index_key}:*",
+        ]
+    
+    def swap_in(self, shadow: "SearchService", batch_size: int = 1000) -> int:
+        """
+        Replace this index with one built under a shadow namespace
+        
+        Every shadow key is moved over its live name with RENAME, so each
+        posting set is swapped atomically. Live keys that have no shadow
+        counterpart (jobs no longer in the source) are deleted afterwards.
+        Reverse posting indexes hold key names, so they are rewritten to the
+        live names instead. Swapped key names are tracked in a Redis set rather
+        than in process memory.
+        
+        The swap as a whole is not atomic: while it runs, a search can
+        intersect posting sets that were already swapped with ones that were
+        not, and miss or include jobs that changed during the rebuild. Result
+        pages computed meanwhile are cached under the old generation, which is
+        bumped at the end. Writes made to the live index during the build are
+        overwritten by the shadow keys; mark_rebuilding records their job IDs
+        and finish_rebuild re-syncs them after the swap.
+        
+        Args:
+            shadow: Search service whose namespace holds the rebuilt index
+            batch_size: Keys renamed per MULTI/EXEC transaction
+        
+        Returns:
+            Number of keys swapped in
+        """
+        swapped_key = f"{shadow.namespace}swapped"
+        reverse_prefix = shadow._postings_key("")
+        swapped = 0
+        batch: List[str] = []
+        
+        def live_name(key: str) -> str:
+            return f"{self.namespace}{key[len(shadow.namespace):]}"
+        
+        def flush() -> int:
+            # Reverse posting indexes list shadow key names; they are rewritten, not renamed
+            reverse_keys = [key for key in batch if key.startswith(reverse_prefix)]
+            pipe = self.redis.pipeline(transaction=False)
+            for key in reverse_keys:
+                pipe.smembers(key)
+            reverse_members = dict(zip(reverse_keys, pipe.execute()))
+            
+            pipe = self.redis.pipeline(transaction=True)
+            renames: List[int] = []
+            rewritten = 0
+            for key in batch:
+                live_key = live_name(key)
+                if key in reverse_members:
+                    # SCAN may return a key twice; the second time it is already gone
+                    members = reverse_members[key]
+                    if not members:
+                        continue
+                    pipe.delete(live_key)
+                    pipe.sadd(live_key, *(live_name(member) for member in members))
+                    pipe.delete(key)
+                    rewritten += 1
+                else:
+                    renames.append(len(pipe))
+                    pipe.rename(key, live_key)
+                pipe.sadd(swapped_key, live_key)
+            # A key returned twice by SCAN fails its second RENAME harmlessly
+            results = pipe.execute(raise_on_error=False)
+            return rewritten + sum(1 for position in renames if results[position] is True)
+        
+        for pattern in shadow._index_patterns():
+            for key in self.redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    swapped += flush()
+                    batch = []
+        if batch:
+            swapped += flush()
+        
+        # Drop live keys that were not rebuilt (skipping in-flight query temp keys)
+        for pattern in self._index_patterns():
+            stale: List[str] = []
+            for key in self.redis.scan_iter(match=pattern, count=batch_size):
+                if ':temp:' not in key:
+                    stale.append(key)
+                if len(stale) >= batch_size:
+                    self._delete_unswapped(swapped_key, stale)
+                    stale = []
+            if stale:
+                self._delete_unswapped(swapped_key, stale)
+        
+        self.redis.delete(swapped_key, shadow.generation_key)
+        self.redis.incr(self.generation_key)
+        return swapped
+    
+    def mark_rebuilding(self):
+        """
+        Record the job IDs written to this index from now on (see swap_in)
+        
+        The marker expires after REBUILD_MARKER_TTL seconds; a running rebuild
+        calls this again to extend it.
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.set(self.rebuild_key, 1, ex=REBUILD_MARKER_TTL)
+        pipe.expire(self.rebuild_writes_key, REBUILD_MARKER_TTL)
+        pipe.execute()
+    
+    def finish_rebuild(self, db_factory: Callable[[], Session], batch_size: int = 500) -> int:
+        """
+        Stop recording writes and re-sync the jobs written during the rebuild
+        
+        Each recorded job is brought in line with its database row, or
+        removed from the index if the row is gone. Writes made after the
+        marker is dropped go straight to the swapped-in index.
+        
+        Args:
+            db_factory: Callable returning a database session
+            batch_size: Jobs loaded per query
+        
+        Returns:
+            Number of jobs re-synced
+        """
+        self.redis.delete(self.rebuild_key)
+        replayed = 0
+        while True:
+            job_ids = self.redis.spop(self.rebuild_writes_key, batch_size)
+            if not job_ids:
+                return replayed
+            db = db_factory()
+            try:
+                jobs = {job.id: job for job in db.query(Job).filter(Job.id.in_(job_ids)).all()}
+                for job_id in job_ids:
+                    if job_id in jobs:
+                        self.sync_job(jobs[job_id])
+                    else:
+                        self.delete_job(job_id)
+            finally:
+                db.close()
+            replayed += len(job_ids)
+    
+    def clear(self) -> int:
+        """Delete every key of this index (used to discard an abandoned shadow build)"""
+        deleted = 0
+        for pattern in self._index_patterns():
+            batch: List[str] = []
+            for key in self.redis.scan_iter(match=pattern, count=1000):
+                batch.append(key)
+                if len(batch) >= 1000:
+                    deleted += self.redis.delete(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis.delete(*batch)
+        return deleted
+    
+    def _delete_unswapped(self, swapped_key: str, keys: List[str]):
+        present = self.redis.smismember(swapped_key, keys)
+        stale = [key for key, is_present in zip(keys, present) if not is_present]
+        if stale:
+            self.redis.delete(*stale)
+    
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Autocomplete title words, skills and tags starting with a prefix
+        
+        The prefix sets written at indexing time hold each entry with the
+        number of jobs whose title or skills contain the word (or that carry
+        the tag), most popular first, so a prefix of up to
+        SUGGEST_PREFIX_LENGTH characters is a single ZRANGE of the top
+        entries. Longer prefixes take the entries starting with them from the
+        lexicographic entry set with ZRANGEBYLEX, read their counts from the
+        set of their first SUGGEST_PREFIX_LENGTH characters and sort that
+        bounded list (LEX_SCORES_SCRIPT, one round trip); entries without a
+        count (no job contains them any more) are dropped from the
+        lexicographic set on the way.
+        
+        Args:
+            prefix: Text typed so far
+            limit: Maximum number of suggestions
+        
+        Returns:
+            List of {"text", "type" ("word" or "tag"), "count"}, most popular first
+        """
+        prefix = prefix.strip().lower()
+        if not self.redis or not prefix:
             return []
         
         try:
-            tags = self.redis.smembers(f"{self.search_index_key}:tags")
-            return sorted(list(tags))
+            key = self._suggest_key(prefix)
+            if len(prefix) <= SUGGEST_PREFIX_LENGTH:
+                entries = self.redis.zrange(key, 0, limit - 1, withscores=True)
+            else:
+                lookup = self.redis.register_script(LEX_SCORES_SCRIPT)
+                found = lookup(
+                    keys=[self.suggest_lex_key, key],
+                    args=[f"[{prefix}", f"[{prefix}{LEX_RANGE_END}", SUGGEST_LEX_LIMIT],
+                )
+                entries = sorted(
+                    ((entry, float(score)) for entry, score in zip(found[::2], found[1::2])),
+                    key=lambda item: (item[1], item[0]),
+                )
+            
+            suggestions = []
+            for entry, score in entries[:limit]:
+                text, kind = entry.rsplit("|", 1)
+                suggestions.append({"text": text, "type": kind, "count": int(-score)})
+            return suggestions
         except Exception as e:
-            logger.error(f"Error getting tags: {e}")
+            logger.error(f"Error getting suggestions for {prefix!r}: {e}")
             return []
+    
+    def popular_tags(self, prefix: Optional[str] = None, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """
+        Tags ordered by the number of jobs carrying them, most popular first
+        
+        Without a prefix a page is one ZREVRANGE (O(log n + limit)). With a
+        prefix the tags starting with it are read from the lexicographic tag
+        set with ZRANGEBYLEX and their counts from the popularity set
+        (LEX_SCORES_SCRIPT, one round trip), so only the matching tags are
+        touched and sorted.
+        
+        Args:
+            prefix: Only tags starting with this text
+            offset: Number of tags to skip
+            limit: Maximum number of tags
+        
+        Returns:
+            Dict with "tags" (list of {"tag", "count"}) and "total" (tags matching)
+        """
+        if not self.redis:
+            return {"tags": [], "total": 0}
+        
+        try:
+            prefix = (prefix or '').strip().lower()
+            if not prefix:
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.zrevrange(self.tag_popularity_key, offset, offset + limit - 1, withscores=True)
+                pipe.zcard(self.tag_popularity_key)
+                page, total = pipe.execute()
+            else:
+                lookup = self.redis.register_script(LEX_SCORES_SCRIPT)
+                found = lookup(
+                    keys=[self.tag_lex_key, self.tag_popularity_key],
+                    args=[f"[{prefix}", f"[{prefix}{LEX_RANGE_END}", -1],
+                )
+                matched = [(tag, float(count)) for tag, count in zip(found[::2], found[1::2])]
+                # Same order as ZREVRANGE: count, then tag, descending
+                matched.sort(key=lambda item: (item[1], item[0]), reverse=True)
+                page, total = matched[offset:offset + limit], len(matched)
+            
+            return {"tags": [{"tag": tag, "count": int(count)} for tag, count in page], "total": total}
+        except Exception as e:
+            logger.error(f"Error getting popular tags: {e}")
+            return {"tags": [], "total": 0}
+
+
+# Singleton instance (the in-process engine replaces the Redis index when configured)
+search_service = MemorySearchService() if settings.SEARCH_BACKEND == "memory" else SearchService()
 
 
-# Singleton instance
-search_service = SearchService()
+async def run_index_compaction(interval_seconds: int):
+    """
+    Background task compacting the search index every interval_seconds
+    
+    A Redis lock held for the interval makes sure only one worker process
+    compacts per interval. Compaction runs in a thread so the event loop is
+    not blocked.
+    """
+    lock_key = f"{search_service.search_index_key}:compaction:lock"
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            client = search_service.redis
+            if client and client.set(lock_key, 1, nx=True, ex=interval_seconds):
+                await asyncio.to_thread(search_service.compact_index)
+        except Exception as e:
+            logger.error(f"Error compacting search index: {e}")
 
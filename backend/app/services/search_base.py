@@ -0,0 +1,322 @@
+"""
+Search backend interface and the text analysis shared by all engines
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Optional, Tuple, Iterator
+from datetime import datetime
+import base64
+import json
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.database import Job
+
+# Prefix lengths indexed for partial word matching
+PREFIX_LENGTHS = (2, 3, 4)
+MAX_PREFIX_LENGTH = max(PREFIX_LENGTHS)
+
+# Longer query terms match the indexed words they start, at most this many words
+TERM_EXPANSION_LIMIT = 200
+
+# Relevance ranking (BM25): term frequency is weighted by the field it occurs in
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'skills_required': 2.0,
+    'tags': 2.0,
+    'description': 1.0,
+    'category': 1.0,
+}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+SORT_RELEVANCE = "relevance"
+
+# Attribute sorts: sort value -> (numeric attribute, ascending)
+SORT_ATTRIBUTES = {
+    "budget_asc": ("budget", True),
+    "budget_desc": ("budget", False),
+    "deadline_asc": ("deadline", True),
+    "deadline_desc": ("deadline", False),
+}
+
+# Numeric attributes indexed for range filters and sorting (deadline as epoch seconds)
+RANGE_ATTRIBUTES = ('budget', 'deadline')
+
+# Autocomplete: completions come from title words, skills and tags
+SUGGEST_FIELDS = ('title', 'skills_required')
+
+# Facets count only the most popular tags by default
+FACET_TAG_LIMIT = 50
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric words of 2+ characters"""
+    words = []
+    for word in text.lower().split():
+        # Remove punctuation and clean word
+        clean_word = ''.join(c for c in word if c.isalnum())
+        if len(clean_word) >= 2:
+            words.append(clean_word)
+    return words
+
+
+def encode_cursor(score: float, job_id: str) -> str:
+    """Opaque pagination token for the position after (score, job_id)"""
+    return base64.urlsafe_b64encode(json.dumps([score, job_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Inverse of encode_cursor, raises ValueError for malformed tokens"""
+    try:
+        score, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(score), str(job_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def attribute_value(job_data: Dict[str, Any], attribute: str) -> Optional[float]:
+    """Numeric value of a search document attribute (timestamps as epoch seconds)"""
+    value = job_data.get(attribute)
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def range_filters(
+    min_budget: Optional[float] = None,
+    max_budget: Optional[float] = None,
+    deadline_after: Optional[datetime] = None,
+    deadline_before: Optional[datetime] = None
+) -> Dict[str, Tuple[float, float]]:
+    """Inclusive (low, high) bounds of each attribute with a range filter set"""
+    ranges = {}
+    if min_budget is not None or max_budget is not None:
+        ranges['budget'] = (
+            float(min_budget) if min_budget is not None else float('-inf'),
+            float(max_budget) if max_budget is not None else float('inf'),
+        )
+    if deadline_after is not None or deadline_before is not None:
+        ranges['deadline'] = (
+            deadline_after.timestamp() if deadline_after is not None else float('-inf'),
+            deadline_before.timestamp() if deadline_before is not None else float('inf'),
+        )
+    return ranges
+
+
+def job_to_document(job: Job) -> Dict[str, Any]:
+    """Build the cached search document for a Job row"""
+    return {
+        'id': job.id,
+        'client_address': job.client_address,
+        'freelancer_address': job.freelancer_address,
+        'title': job.title,
+        'description': job.description,
+        'category': job.category,
+        'skills_required': job.skills_required or [],
+        'tags': job.tags or [],
+        'budget': job.budget,
+        'deadline': job.deadline.isoformat() if job.deadline else None,
+        'status': job.status,
+        'ipfs_hash': job.ipfs_hash,
+        'blockchain_job_id': job.blockchain_job_id,
+        'deliverable_url': job.deliverable_url,
+        'client_confirmed_completion': bool(job.client_confirmed_completion),
+        'freelancer_confirmed_completion': bool(job.freelancer_confirmed_completion),
+        'escrow_address': job.escrow_address,
+        'allow_escrow_revert': bool(job.allow_escrow_revert),
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'updated_at': job.updated_at.isoformat() if job.updated_at else None,
+        'proposal_count': job.proposal_count or 0,
+    }
+
+
+# Every key job_to_document writes. Cached documents lacking one were written by
+# the original indexer (id, title, description, category, tags, status and
+# skills only) and are treated as cache misses
+DOCUMENT_FIELDS = frozenset((
+    'id', 'client_address', 'freelancer_address', 'title', 'description', 'category',
+    'skills_required', 'tags', 'budget', 'deadline', 'status', 'ipfs_hash',
+    'blockchain_job_id', 'deliverable_url', 'client_confirmed_completion',
+    'freelancer_confirmed_completion', 'escrow_address', 'allow_escrow_revert',
+    'created_at', 'updated_at', 'proposal_count',
+))
+
+
+def is_full_document(document: Dict[str, Any]) -> bool:
+    """Whether a cached document carries every field of job_to_document"""
+    return DOCUMENT_FIELDS <= document.keys()
+
+
+def stream_jobs(db: Session, chunk_size: int = 1000) -> Iterator[Job]:
+    """
+    Stream every job ordered by (created_at, id) in bounded memory
+    
+    Uses keyset pagination so each chunk is an index range scan rather than
+    an OFFSET, and yield_per so rows are fetched from the cursor in batches.
+    The session is cleared between chunks so loaded rows do not accumulate.
+    """
+    last_key = None
+    while True:
+        query = db.query(Job).order_by(Job.created_at, Job.id)
+        if last_key is not None:
+            query = query.filter(tuple_(Job.created_at, Job.id) > last_key)
+        
+        count = 0
+        for job in query.limit(chunk_size).yield_per(chunk_size):
+            count += 1
+            last_key = (job.created_at, job.id)
+            yield job
+        
+        db.expunge_all()
+        if count < chunk_size:
+            return
+
+
+class SearchBackend(ABC):
+    """Engine answering job searches (Redis index or PostgreSQL full-text search)"""
+    
+    name: str = ""
+    
+    @abstractmethod
+    def search_jobs_page(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        sort: Optional[str] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        fuzzy: bool = True,
+        min_budget: Optional[float] = None,
+        max_budget: Optional[float] = None,
+        deadline_after: Optional[datetime] = None,
+        deadline_before: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Search for jobs, returning one page of results
+        
+        Args:
+            query: Text search query
+            tags: List of tags to filter by (a job matches any of them)
+            category: Category filter
+            status: Status filter
+            limit: Maximum number of results
+            sort: "relevance" to rank text matches, a SORT_ATTRIBUTES key
+                (e.g. "budget_desc") to order by budget or deadline, newest
+                first otherwise
+            offset: Number of results to skip
+            cursor: Token from a previous page's next_cursor
+            fuzzy: Correct query terms that match no job (if supported)
+            min_budget: Minimum budget (inclusive)
+            max_budget: Maximum budget (inclusive)
+            deadline_after: Earliest deadline (inclusive)
+            deadline_before: Latest deadline (inclusive)
+        
+        Returns:
+            Dict with "job_ids", "next_cursor" (None when there are no more
+            pages) and "corrections" (misspelled term -> word searched instead)
+        
+        Raises:
+            ValueError: If cursor is malformed
+        """
+    
+    def search_jobs(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        sort: Optional[str] = None,
+        offset: int = 0,
+        fuzzy: bool = True,
+        min_budget: Optional[float] = None,
+        max_budget: Optional[float] = None,
+        deadline_after: Optional[datetime] = None,
+        deadline_before: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        Search for jobs
+        
+        Args:
+            query: Text search query
+            tags: List of tags to filter by
+            category: Category filter
+            status: Status filter
+            limit: Maximum number of results
+            sort: "relevance" to rank text matches, or a SORT_ATTRIBUTES key
+            offset: Number of results to skip
+            fuzzy: Correct query terms that match no job (if supported)
+            min_budget: Minimum budget (inclusive)
+            max_budget: Maximum budget (inclusive)
+            deadline_after: Earliest deadline (inclusive)
+            deadline_before: Latest deadline (inclusive)
+        
+        Returns:
+            List of job IDs
+        """
+        return self.search_jobs_page(
+            query=query,
+            tags=tags,
+            category=category,
+            status=status,
+            limit=limit,
+            sort=sort,
+            offset=offset,
+            fuzzy=fuzzy,
+            min_budget=min_budget,
+            max_budget=max_budget,
+            deadline_after=deadline_after,
+            deadline_before=deadline_before
+        )["job_ids"]
+    
+    @abstractmethod
+    def facets(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        tag_limit: int = FACET_TAG_LIMIT
+    ) -> Dict[str, Any]:
+        """
+        Count matching jobs per tag, category and status for a search
+        
+        Each dimension is counted with every other filter applied but not its
+        own, and only the tag_limit most popular tags are counted.
+        
+        Returns:
+            Dict with "total" and "tags", "categories", "statuses" mappings of
+            value to count, ordered by count (values with no matches omitted)
+        """
+    
+    @abstractmethod
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Autocomplete title words, skills and tags starting with a prefix
+        
+        Returns:
+            List of {"text", "type" ("word" or "tag"), "count"}, most popular first
+        """
+    
+    @abstractmethod
+    def popular_tags(self, prefix: Optional[str] = None, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """
+        Tags ordered by the number of jobs carrying them, most popular first
+        
+        Args:
+            prefix: Only tags starting with this text
+            offset: Number of tags to skip
+            limit: Maximum number of tags
+        
+        Returns:
+            Dict with "tags" (list of {"tag", "count"}) and "total" (tags matching)
+        """
@@ -0,0 +1,650 @@
+"""
+In-process search engine for single-node deployments without Redis
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Callable, Set
+from datetime import datetime
+import heapq
+import logging
+import math
+import sys
+import threading
+
+from sqlalchemy.orm import Session
+
+from app.database import Job
+from app.models import JobStatus
+from app.services.search_base import (
+    SearchBackend,
+    PREFIX_LENGTHS,
+    MAX_PREFIX_LENGTH,
+    TERM_EXPANSION_LIMIT,
+    FIELD_WEIGHTS,
+    BM25_K1,
+    BM25_B,
+    SORT_RELEVANCE,
+    SORT_ATTRIBUTES,
+    RANGE_ATTRIBUTES,
+    SUGGEST_FIELDS,
+    FACET_TAG_LIMIT,
+    tokenize,
+    encode_cursor,
+    decode_cursor,
+    attribute_value,
+    range_filters,
+    job_to_document,
+    stream_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+# Posting list key prefixes (text keys carry a parallel array of term weights)
+PREFIX_KEY = "p:"
+WORD_KEY = "w:"
+TAG_KEY = "tag:"
+CATEGORY_KEY = "category:"
+STATUS_KEY = "status:"
+
+
+def gallop(postings: array, target: int, low: int) -> int:
+    """
+    Index of the first posting >= target, searching from index low
+    
+    Probes low + 1, low + 2, low + 4, ... until it passes target, then
+    binary-searches the last step, so skipping k postings costs O(log k).
+    """
+    size = len(postings)
+    if low >= size or postings[low] >= target:
+        return low
+    step = 1
+    while low + step < size and postings[low + step] < target:
+        low += step
+        step *= 2
+    return bisect_left(postings, target, low + 1, min(low + step + 1, size))
+
+
+def intersect(small: array, large: array) -> array:
+    """Intersect two sorted posting lists, galloping through the longer one"""
+    if len(small) > len(large):
+        small, large = large, small
+    result = array('I')
+    position = 0
+    for doc in small:
+        position = gallop(large, doc, position)
+        if position >= len(large):
+            break
+        if large[position] == doc:
+            result.append(doc)
+    return result
+
+
+def intersect_all(postings: List[array]) -> array:
+    """Intersect posting lists, shortest first so intermediate results stay small"""
+    postings = sorted(postings, key=len)
+    result = postings[0]
+    for other in postings[1:]:
+        if not result:
+            break
+        result = intersect(result, other)
+    return result
+
+
+def union(postings: List[array]) -> array:
+    """Merge sorted posting lists into one without duplicates"""
+    result = array('I')
+    for doc in heapq.merge(*postings):
+        if not result or result[-1] != doc:
+            result.append(doc)
+    return result
+
+
+class MemorySearchService(SearchBackend):
+    """
+    Search index held in process memory, same API as the Redis SearchService
+    
+    Job UUIDs are mapped to dense integer doc ids, and every posting list is
+    a sorted array('I') of doc ids (4 bytes per posting); text postings carry
+    a parallel array('f') of field-weighted term frequencies for BM25. Doc
+    ids are handed out in increasing order, so indexing a new job appends to
+    each list. The index is loaded from the jobs table at startup and kept
+    current by the same index/sync/delete calls as the Redis index. State
+    is per process, so run a single worker with this engine.
+    """
+    
+    name = "memory"
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._doc_ids: Dict[str, int] = {}
+        self._job_ids: List[Optional[str]] = []
+        self._doc_keys: List[Optional[Tuple[str, ...]]] = []
+        self._created = array('d')
+        # Budget and deadline per doc id, NaN when the job has no value
+        self._attributes: Dict[str, array] = {attribute: array('d') for attribute in RANGE_ATTRIBUTES}
+        self._lengths = array('I')
+        self._postings: Dict[str, array] = {}
+        self._weights: Dict[str, array] = {}
+        self._tags: Set[str] = set()
+        self._categories: Set[str] = set()
+        self._suggestions: Set[Tuple[str, str]] = set()
+        self._total_length = 0
+        # Sorted views rebuilt lazily after changes
+        self._listing: Optional[List[Tuple[float, str]]] = None
+        self._vocabulary: Optional[List[Tuple[str, str]]] = None
+        self._words: Optional[List[str]] = None
+    
+    @property
+    def redis(self) -> None:
+        """No Redis client, this engine never needs one"""
+        return None
+    
+    def _field_text(self, job_data: Dict[str, Any], field: str) -> str:
+        value = job_data.get(field) or ''
+        if isinstance(value, list):
+            return ' '.join(value)
+        return value
+    
+    def _term_key(self, term: str) -> str:
+        """Posting list that answers a single query term (prefix list for short terms)"""
+        if len(term) <= MAX_PREFIX_LENGTH:
+            return f"{PREFIX_KEY}{term}"
+        return f"{WORD_KEY}{term}"
+    
+    def _term_postings(self, term: str) -> Tuple[array, array]:
+        """
+        Posting list and term weights answering a query term
+        
+        Terms longer than MAX_PREFIX_LENGTH match every word they start (at
+        most TERM_EXPANSION_LIMIT words), merged keeping each doc's highest
+        weight, like the Redis engine's ZUNIONSTORE ... AGGREGATE MAX.
+        """
+        if len(term) <= MAX_PREFIX_LENGTH:
+            key = self._term_key(term)
+            return self._postings.get(key, array('I')), self._weights.get(key, array('f'))
+        
+        if self._words is None:
+            self._words = sorted(key[len(WORD_KEY):] for key in self._postings if key.startswith(WORD_KEY))
+        start = bisect_left(self._words, term)
+        words = []
+        for word in self._words[start:start + TERM_EXPANSION_LIMIT]:
+            if not word.startswith(term):
+                break
+            words.append(word)
+        if len(words) == 1:
+            key = f"{WORD_KEY}{words[0]}"
+            return self._postings[key], self._weights[key]
+        
+        merged: Dict[int, float] = {}
+        for word in words:
+            key = f"{WORD_KEY}{word}"
+            for doc, weight in zip(self._postings[key], self._weights[key]):
+                if weight > merged.get(doc, 0.0):
+                    merged[doc] = weight
+        docs = sorted(merged)
+        return array('I', docs), array('f', (merged[doc] for doc in docs))
+    
+    def _analyze(self, job_data: Dict[str, Any]) -> Tuple[Dict[str, Optional[float]], int]:
+        """
+        Posting keys of a job with their term weight (None for filter keys)
+        
+        Returns:
+            (posting key -> weighted term frequency, document length in words)
+        """
+        keys: Dict[str, Optional[float]] = {}
+        length = 0
+        for field, weight in FIELD_WEIGHTS.items():
+            words = tokenize(self._field_text(job_data, field))
+            length += len(words)
+            for word in words:
+                word_keys = {f"{PREFIX_KEY}{word[:n]}" for n in PREFIX_LENGTHS if len(word) >= n}
+                if len(word) > MAX_PREFIX_LENGTH:
+                    word_keys.add(f"{WORD_KEY}{word}")
+                for key in word_keys:
+                    keys[key] = (keys.get(key) or 0.0) + weight
+        
+        for tag in job_data.get('tags', []):
+            keys[f"{TAG_KEY}{tag.lower()}"] = None
+        if job_data.get('category'):
+            keys[f"{CATEGORY_KEY}{job_data['category'].lower()}"] = None
+        if job_data.get('status'):
+            keys[f"{STATUS_KEY}{job_data['status'].lower()}"] = None
+        return {sys.intern(key): weight for key, weight in keys.items()}, length
+    
+    def _insert(self, key: str, doc: int, weight: Optional[float]):
+        postings = self._postings.get(key)
+        if postings is None:
+            postings = self._postings[key] = array('I')
+            if weight is not None:
+                self._weights[key] = array('f')
+            if key.startswith(TAG_KEY):
+                self._tags.add(key[len(TAG_KEY):])
+            elif key.startswith(CATEGORY_KEY):
+                self._categories.add(key[len(CATEGORY_KEY):])
+            elif key.startswith(WORD_KEY):
+                self._words = None
+        position = len(postings) if not postings or postings[-1] < doc else bisect_left(postings, doc)
+        postings.insert(position, doc)
+        if weight is not None:
+            self._weights[key].insert(position, weight)
+    
+    def _remove(self, key: str, doc: int):
+        postings = self._postings[key]
+        position = bisect_left(postings, doc)
+        del postings[position]
+        if key in self._weights:
+            del self._weights[key][position]
+        if not postings:
+            del self._postings[key]
+            self._weights.pop(key, None)
+            if key.startswith(TAG_KEY):
+                self._tags.discard(key[len(TAG_KEY):])
+            elif key.startswith(CATEGORY_KEY):
+                self._categories.discard(key[len(CATEGORY_KEY):])
+            elif key.startswith(WORD_KEY):
+                self._words = None
+    
+    def _set_weight(self, key: str, doc: int, weight: float):
+        postings = self._postings[key]
+        self._weights[key][bisect_left(postings, doc)] = weight
+    
+    def _index(self, job_id: str, job_data: Dict[str, Any]):
+        """Add or update one job, touching only the posting lists that changed"""
+        keys, length = self._analyze(job_data)
+        doc = self._doc_ids.get(job_id)
+        
+        if doc is None:
+            doc = len(self._job_ids)
+            self._doc_ids[job_id] = doc
+            self._job_ids.append(job_id)
+            self._doc_keys.append(None)
+            self._created.append(0.0)
+            for values in self._attributes.values():
+                values.append(math.nan)
+            self._lengths.append(0)
+        
+        old_keys = set(self._doc_keys[doc] or ())
+        for key in old_keys - keys.keys():
+            self._remove(key, doc)
+        for key, weight in keys.items():
+            if key not in old_keys:
+                self._insert(key, doc, weight)
+            elif weight is not None:
+                self._set_weight(key, doc, weight)
+        
+        self._doc_keys[doc] = tuple(keys)
+        self._created[doc] = attribute_value(job_data, 'created_at') or 0.0
+        for attribute, values in self._attributes.items():
+            value = attribute_value(job_data, attribute)
+            values[doc] = value if value is not None else math.nan
+        self._total_length += length - self._lengths[doc]
+        self._lengths[doc] = length
+        
+        new_suggestions = {
+            (word, "word")
+            for field in SUGGEST_FIELDS
+            for word in tokenize(self._field_text(job_data, field))
+        }
+        new_suggestions.update((tag.lower(), "tag") for tag in job_data.get('tags', []))
+        if not new_suggestions <= self._suggestions:
+            self._suggestions |= new_suggestions
+            self._vocabulary = None
+        self._listing = None
+    
+    def index_job(self, job_id: str, job_data: Dict[str, Any]) -> bool:
+        """
+        Index a job for search
+        
+        Args:
+            job_id: Job ID
+            job_data: Job data dictionary with title, description, tags, etc.
+        
+        Returns:
+            True if successful
+        """
+        try:
+            with self._lock:
+                self._index(job_id, job_data)
+            return True
+        except Exception as e:
+            logger.error(f"Error indexing job {job_id}: {e}")
+            return False
+    
+    def index_jobs(self, jobs: Iterable[Tuple[str, Dict[str, Any]]], batch_size: int = 500) -> int:
+        """Index many jobs, returns the number indexed"""
+        indexed = 0
+        for job_id, job_data in jobs:
+            if self.index_job(job_id, job_data):
+                indexed += 1
+        return indexed
+    
+    def reindex_job(self, job_id: str, job_data: Dict[str, Any]) -> bool:
+        """Update the index entries of a job after it changed"""
+        return self.index_job(job_id, job_data)
+    
+    def sync_job(self, job: Job) -> bool:
+        """Bring the index entries of a Job row in line with the database after a commit"""
+        try:
+            job_data = job_to_document(job)
+        except Exception as e:
+            logger.error(f"Error reading job for reindexing: {e}")
+            return False
+        return self.reindex_job(job_data['id'], job_data)
+    
+    def delete_job(self, job_id: str) -> bool:
+        """Remove job from search index"""
+        try:
+            with self._lock:
+                doc = self._doc_ids.pop(job_id, None)
+                if doc is None:
+                    return True
+                for key in self._doc_keys[doc]:
+                    self._remove(key, doc)
+                # Doc ids are not reused, so posting lists stay append-only for new jobs
+                self._job_ids[doc] = None
+                self._doc_keys[doc] = None
+                self._total_length -= self._lengths[doc]
+                self._lengths[doc] = 0
+                self._listing = None
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting job {job_id}: {e}")
+            return False
+    
+    def load(self, db_factory: Callable[[], Session], chunk_size: int = 1000) -> int:
+        """
+        Build the index from the jobs table
+        
+        Args:
+            db_factory: Callable returning a new database session
+            chunk_size: Rows fetched per query
+        
+        Returns:
+            Number of jobs indexed
+        """
+        db = db_factory()
+        try:
+            indexed = self.index_jobs((job.id, job_to_document(job)) for job in stream_jobs(db, chunk_size))
+        finally:
+            db.close()
+        usage = self.memory_usage()
+        logger.info(
+            f"In-memory search index loaded: {indexed} jobs, "
+            f"{usage['bytes'] / 1048576:.1f} MiB ({usage['bytes_per_job']:.0f} bytes per job)"
+        )
+        return indexed
+    
+    def memory_usage(self) -> Dict[str, Any]:
+        """
+        Approximate memory held by the index
+        
+        Returns:
+            Dict with "jobs", "postings", "bytes" and "bytes_per_job"
+        """
+        with self._lock:
+            total = sum(sys.getsizeof(postings) for postings in self._postings.values())
+            total += sum(sys.getsizeof(weights) for weights in self._weights.values())
+            total += sum(sys.getsizeof(key) for key in self._postings)
+            total += sys.getsizeof(self._postings) + sys.getsizeof(self._weights)
+            total += sum(sys.getsizeof(keys) for keys in self._doc_keys if keys)
+            total += sum(sys.getsizeof(job_id) for job_id in self._doc_ids)
+            total += sys.getsizeof(self._doc_ids) + sys.getsizeof(self._job_ids) + sys.getsizeof(self._doc_keys)
+            total += sys.getsizeof(self._created) + sys.getsizeof(self._lengths)
+            total += sum(sys.getsizeof(values) for values in self._attributes.values())
+            total += sys.getsizeof(self._suggestions) + sum(sys.getsizeof(entry) for entry in self._suggestions)
+            jobs = len(self._doc_ids)
+            return {
+                "jobs": jobs,
+                "postings": sum(len(postings) for postings in self._postings.values()),
+                "bytes": total,
+                "bytes_per_job": total / jobs if jobs else 0.0,
+            }
+    
+    def _filter_postings(
+        self,
+        terms: List[str],
+        tags: Optional[List[str]],
+        category: Optional[str],
+        status: Optional[str]
+    ) -> Dict[str, Optional[array]]:
+        """Posting list of each filter dimension (None when the filter is unset)"""
+        empty = array('I')
+        filters: Dict[str, Optional[array]] = {}
+        for term in terms:
+            filters[f"term:{term}"] = self._term_postings(term)[0]
+        
+        filters["tags"] = None
+        if tags:
+            filters["tags"] = union([self._postings.get(f"{TAG_KEY}{tag.lower()}", empty) for tag in tags])
+        filters["category"] = self._postings.get(f"{CATEGORY_KEY}{category.lower()}", empty) if category else None
+        filters["status"] = self._postings.get(f"{STATUS_KEY}{status.lower()}", empty) if status else None
+        return filters
+    
+    def _rank(self, docs: array, terms: List[str]) -> List[int]:
+        """Order matching docs by BM25 score, walking each term list with galloping"""
+        live = len(self._doc_ids)
+        avg_length = max(self._total_length, 1) / max(live, 1)
+        scores = [0.0] * len(docs)
+        for term in terms:
+            postings, weights = self._term_postings(term)
+            idf = math.log(1 + (live - len(postings) + 0.5) / (len(postings) + 0.5))
+            position = 0
+            for index, doc in enumerate(docs):
+                position = gallop(postings, doc, position)
+                tf = weights[position]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[doc] / avg_length)
+                scores[index] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        # Ties broken by job ID, highest first, like ZREVRANGE in the Redis engine
+        order = sorted(range(len(docs)), key=lambda index: (scores[index], self._job_ids[docs[index]]), reverse=True)
+        return [docs[index] for index in order]
+    
+    def _page_newest(self, limit: int, after: Optional[Tuple[float, str]]) -> Dict[str, Any]:
+        """Newest-first listing paged by (created_at, job_id) like the Redis engine"""
+        if self._listing is None:
+            self._listing = sorted(
+                (self._created[doc], job_id) for job_id, doc in self._doc_ids.items()
+            )
+        end = bisect_left(self._listing, after) if after else len(self._listing)
+        page = self._listing[max(end - limit - 1, 0):end][::-1]
+        next_cursor = encode_cursor(*page[limit - 1]) if len(page) > limit else None
+        return {"job_ids": [job_id for _, job_id in page[:limit]], "next_cursor": next_cursor}
+    
+    def _in_ranges(self, doc: int, ranges: Dict[str, Tuple[float, float]]) -> bool:
+        """Whether a doc's attributes fall within every range (NaN never does)"""
+        return all(low <= self._attributes[attribute][doc] <= high for attribute, (low, high) in ranges.items())
+    
+    def _page_sorted(
+        self,
+        matches: Optional[array],
+        ranges: Dict[str, Tuple[float, float]],
+        attribute: Optional[str],
+        ascending: bool,
+        limit: int,
+        after: Optional[Tuple[float, str]]
+    ) -> Dict[str, Any]:
+        """
+        Page matching docs by date, budget or deadline with a (score, job_id) cursor
+        
+        Ties are ordered by job_id in the direction of the sort, as in the
+        Redis engine. Only the requested page is kept (heap selection).
+        """
+        docs = matches if matches is not None else self._doc_ids.values()
+        values = self._attributes[attribute] if attribute else self._created
+        entries = []
+        for doc in docs:
+            score = values[doc]
+            # Jobs without the sort attribute are not listed (as in the Redis index)
+            if math.isnan(score) or (ranges and not self._in_ranges(doc, ranges)):
+                continue
+            entry = (score, self._job_ids[doc])
+            if after and (entry <= after if ascending else entry >= after):
+                continue
+            entries.append(entry)
+        
+        page = heapq.nsmallest(limit + 1, entries) if ascending else heapq.nlargest(limit + 1, entries)
+        next_cursor = encode_cursor(*page[limit - 1]) if len(page) > limit else None
+        return {"job_ids": [job_id for _, job_id in page[:limit]], "next_cursor": next_cursor}
+    
+    def search_jobs_page(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        sort: Optional[str] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        fuzzy: bool = True,
+        min_budget: Optional[float] = None,
+        max_budget: Optional[float] = None,
+        deadline_after: Optional[datetime] = None,
+        deadline_before: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Search for jobs, returning one page of results
+        
+        Same semantics as the Redis SearchService: the cursor pages listings
+        ordered by date (the default), budget or deadline, offset pages
+        relevance-ranked results. Fuzzy correction is not supported by this engine.
+        
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        ranges = range_filters(min_budget, max_budget, deadline_after, deadline_before)
+        attribute, ascending = SORT_ATTRIBUTES.get(sort, (None, False))
+        
+        try:
+            with self._lock:
+                if not query and not tags and not category and not status and not ranges and not attribute:
+                    page = self._page_newest(limit, after)
+                    page["corrections"] = {}
+                    return page
+                
+                terms = list(dict.fromkeys(tokenize(query or '')))
+                postings = [docs for docs in self._filter_postings(terms, tags, category, status).values() if docs is not None]
+                matches = intersect_all(postings) if postings else None
+                ranked = sort == SORT_RELEVANCE and bool(terms)
+                
+                if not ranked:
+                    page = self._page_sorted(matches, ranges, attribute, ascending, limit, after)
+                    page["corrections"] = {}
+                    return page
+                if ranges:
+                    matches = array('I', (doc for doc in matches if self._in_ranges(doc, ranges)))
+                
+                docs = self._rank(matches, terms)[offset:offset + limit] if matches else []
+                return {"job_ids": [self._job_ids[doc] for doc in docs], "next_cursor": None, "corrections": {}}
+        
+        except Exception as e:
+            logger.error(f"Error searching jobs: {e}")
+            return {"job_ids": [], "next_cursor": None, "corrections": {}}
+    
+    def hydrate_jobs(self, job_ids: List[str], db_factory: Callable[[], Session]) -> List[Dict[str, Any]]:
+        """Load job documents from the database, in the order of job_ids"""
+        if not job_ids:
+            return []
+        db = db_factory()
+        try:
+            documents = {
+                job.id: job_to_document(job)
+                for job in db.query(Job).filter(Job.id.in_(job_ids)).all()
+            }
+        finally:
+            db.close()
+        return [documents[job_id] for job_id in job_ids if job_id in documents]
+    
+    def facets(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        tag_limit: int = FACET_TAG_LIMIT
+    ) -> Dict[str, Any]:
+        """
+        Count matching jobs per tag, category and status
+        
+        Each dimension is counted with every other filter applied but not its
+        own, and only the tag_limit most popular tags are counted, as in the
+        Redis engine.
+        """
+        try:
+            with self._lock:
+                terms = list(dict.fromkeys(tokenize(query or '')))
+                filters = self._filter_postings(terms, tags, category, status)
+                # Ties broken like ZREVRANGE over the tag popularity set
+                counted_tags = sorted(
+                    self._tags, key=lambda tag: (len(self._postings.get(f"{TAG_KEY}{tag}", ())), tag), reverse=True
+                )[:tag_limit]
+                dimensions = {
+                    "tags": (TAG_KEY, sorted(counted_tags), "tags"),
+                    "categories": (CATEGORY_KEY, sorted(self._categories), "category"),
+                    "statuses": (STATUS_KEY, [value.value for value in JobStatus], "status"),
+                }
+                
+                def count(postings: List[array]) -> int:
+                    return len(intersect_all(postings)) if postings else len(self._doc_ids)
+                
+                result: Dict[str, Any] = {"total": count([docs for docs in filters.values() if docs is not None])}
+                for name, (prefix, values, own_filter) in dimensions.items():
+                    base = [docs for dimension, docs in filters.items() if docs is not None and dimension != own_filter]
+                    matched = []
+                    for value in values:
+                        postings = self._postings.get(f"{prefix}{value}")
+                        if postings:
+                            value_count = count(base + [postings])
+                            if value_count:
+                                matched.append((value, value_count))
+                    matched.sort(key=lambda item: (-item[1], item[0]))
+                    result[name] = dict(matched)
+                return result
+        except Exception as e:
+            logger.error(f"Error computing facets: {e}")
+            return {"total": 0, "tags": {}, "categories": {}, "statuses": {}}
+    
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Autocomplete title words, skills and tags starting with a prefix
+        
+        Popularity is the length of the entry's posting list (for words of
+        up to MAX_PREFIX_LENGTH characters, jobs with a word starting with it).
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        
+        with self._lock:
+            if self._vocabulary is None:
+                self._vocabulary = sorted(self._suggestions)
+            suggestions = []
+            for text, kind in self._vocabulary[bisect_left(self._vocabulary, (prefix, "")):]:
+                if not text.startswith(prefix):
+                    break
+                key = f"{TAG_KEY}{text}" if kind == "tag" else self._term_key(text)
+                count = len(self._postings.get(key, ()))
+                if count:
+                    suggestions.append({"text": text, "type": kind, "count": count})
+        suggestions.sort(key=lambda suggestion: (-suggestion["count"], suggestion["text"]))
+        return suggestions[:limit]
+    
+    def cache_metrics(self) -> Dict[str, Any]:
+        """No result cache, searches are answered from memory"""
+        return {"lookups": 0, "hits": 0, "misses": 0, "hit_ratio": 0.0, "miss_ratio": 0.0, "generation": 0}
+    
+    def popular_tags(self, prefix: Optional[str] = None, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """Tags ordered by the number of jobs carrying them, as in the Redis engine"""
+        prefix = (prefix or '').strip().lower()
+        with self._lock:
+            matched = [
+                (tag, len(self._postings[f"{TAG_KEY}{tag}"]))
+                for tag in self._tags
+                if tag.startswith(prefix)
+            ]
+        matched.sort(key=lambda item: (item[1], item[0]), reverse=True)
+        return {
+            "tags": [{"tag": tag, "count": count} for tag, count in matched[offset:offset + limit]],
+            "total": len(matched),
+        }
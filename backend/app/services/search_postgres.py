@@ -0,0 +1,407 @@
+"""
+PostgreSQL full-text search backend
+"""
+
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from datetime import datetime, timezone
+import hashlib
+import json
+import logging
+
+from sqlalchemy import cast, func, tuple_, union_all
+from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, array
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal, Job, get_redis
+from app.models import JobStatus
+from app.services.search import (
+    CACHED_PAGE_SCRIPT,
+    SORT_RELEVANCE,
+    decode_cursor,
+    encode_cursor,
+    search_service,
+    tokenize,
+)
+from app.services.search_base import SearchBackend, SORT_ATTRIBUTES, FACET_TAG_LIMIT, range_filters
+
+logger = logging.getLogger(__name__)
+
+# Text search configuration used by the jobs.search_vector generated column
+TS_CONFIG = "english"
+
+# Results are cached in Redis (when connected) for this many seconds, under the
+# index generation so job writes (which bump it) invalidate them at once
+PG_SEARCH_CACHE_TTL = 30
+PG_CACHE_PREFIX = "search:pg:"
+PG_CACHE_STATS_KEY = "search:pg:stats"
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    Job search over the jobs.search_vector tsvector column
+    
+    Every query term must match a lexeme of the job (as a prefix, like the
+    Redis index). Relevance ordering uses ts_rank, attribute sorts use the
+    budget or deadline column, otherwise jobs are listed newest first; all
+    are paged with a keyset on (score, id). Facets, suggestions and tag
+    counts are aggregated from the jobs table.
+    """
+    
+    name = "postgres"
+    
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        cache_ttl: int = PG_SEARCH_CACHE_TTL
+    ):
+        self.session_factory = session_factory
+        # 0 disables the Redis page cache
+        self.cache_ttl = cache_ttl
+    
+    def search_jobs_page(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: int = 50,
+        sort: Optional[str] = None,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        fuzzy: bool = True,
+        min_budget: Optional[float] = None,
+        max_budget: Optional[float] = None,
+        deadline_after: Optional[datetime] = None,
+        deadline_before: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Search for jobs, returning one page of results
+        
+        Pages are served from the Redis cache when present. The cursor works
+        for every query (keyset on the sort score); offset applies only to
+        the first page. Fuzzy correction is not supported by this backend.
+        
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        terms = list(dict.fromkeys(tokenize(query or '')))
+        ranges = range_filters(min_budget, max_budget, deadline_after, deadline_before)
+        cache_key, cached = self._cached("page", {
+            **self._normalized_filters(terms, tags, category, status),
+            "ranges": {attribute: [str(low), str(high)] for attribute, (low, high) in ranges.items()},
+            "limit": limit,
+            "sort": sort,
+            "offset": offset,
+            "cursor": cursor,
+        })
+        if cached is not None:
+            return cached
+        
+        db = self.session_factory()
+        try:
+            page = self._query_page(db, terms, tags, category, status, ranges, limit, sort, offset, after)
+        except Exception as e:
+            logger.error(f"Error searching jobs in PostgreSQL: {e}")
+            return {"job_ids": [], "next_cursor": None, "corrections": {}}
+        finally:
+            db.close()
+        
+        self._cache_set(cache_key, page)
+        return page
+    
+    def _filtered(
+        self,
+        query,
+        terms: List[str],
+        tags: Optional[List[str]],
+        category: Optional[str],
+        status: Optional[str],
+        ranges: Optional[Dict[str, tuple]] = None
+    ):
+        """Apply the search filters to a query on jobs, returns (query, tsquery or None)"""
+        # Text search - every term must match a lexeme prefix (uses the GIN index)
+        ts_query = None
+        if terms:
+            ts_query = func.to_tsquery(TS_CONFIG, " & ".join(f"{term}:*" for term in terms))
+            query = query.filter(Job.search_vector.op("@@")(ts_query))
+        
+        # Tag filter (any of the tags, matched case-insensitively like the Redis index)
+        if tags:
+            query = query.filter(Job.tags.op("&&")(array(sorted({*tags, *(tag.lower() for tag in tags)}))))
+        
+        if category:
+            query = query.filter(func.lower(Job.category) == category.lower())
+        
+        if status:
+            query = query.filter(Job.status == status.lower())
+        
+        # Range filters (bounds are inclusive, infinite bounds are left open)
+        ranges = ranges or {}
+        if 'budget' in ranges:
+            low, high = ranges['budget']
+            if low != float('-inf'):
+                query = query.filter(Job.budget >= low)
+            if high != float('inf'):
+                query = query.filter(Job.budget <= high)
+        if 'deadline' in ranges:
+            low, high = ranges['deadline']
+            if low != float('-inf'):
+                query = query.filter(Job.deadline >= datetime.fromtimestamp(low, timezone.utc))
+            if high != float('inf'):
+                query = query.filter(Job.deadline <= datetime.fromtimestamp(high, timezone.utc))
+        return query, ts_query
+    
+    def _query_page(
+        self,
+        db: Session,
+        terms: List[str],
+        tags: Optional[List[str]],
+        category: Optional[str],
+        status: Optional[str],
+        ranges: Dict[str, tuple],
+        limit: int,
+        sort: Optional[str],
+        offset: int,
+        after: Optional[tuple]
+    ) -> Dict[str, Any]:
+        query, ts_query = self._filtered(db.query(Job.id), terms, tags, category, status, ranges)
+        
+        ranked = sort == SORT_RELEVANCE and ts_query is not None
+        attribute, ascending = (None, False) if ranked else SORT_ATTRIBUTES.get(sort, (None, False))
+        if ranked:
+            score = cast(func.ts_rank(Job.search_vector, ts_query), DOUBLE_PRECISION)
+        elif attribute == 'budget':
+            score = Job.budget
+        elif attribute == 'deadline':
+            score = Job.deadline
+        else:
+            score = Job.created_at
+        # Timestamp sort keys travel in the cursor as epoch seconds
+        timestamps = not ranked and attribute != 'budget'
+        
+        if attribute:
+            # Jobs without the sort attribute are not listed (as in the Redis index)
+            query = query.filter(score.isnot(None))
+        query = query.add_columns(score.label("score"))
+        if ascending:
+            query = query.order_by(score.asc(), Job.id.asc())
+        else:
+            query = query.order_by(score.desc(), Job.id.desc())
+        
+        if after:
+            after_score = datetime.fromtimestamp(after[0], timezone.utc) if timestamps else after[0]
+            if ascending:
+                query = query.filter(tuple_(score, Job.id) > tuple_(after_score, after[1]))
+            else:
+                query = query.filter(tuple_(score, Job.id) < tuple_(after_score, after[1]))
+        elif offset:
+            query = query.offset(offset)
+        
+        rows = query.limit(limit + 1).all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            last_id, last_score = rows[limit - 1]
+            next_cursor = encode_cursor(last_score.timestamp() if timestamps else last_score, last_id)
+        return {"job_ids": [job_id for job_id, _ in rows[:limit]], "next_cursor": next_cursor, "corrections": {}}
+    
+    def facets(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        tag_limit: int = FACET_TAG_LIMIT
+    ) -> Dict[str, Any]:
+        """
+        Count matching jobs per tag, category and status
+        
+        Same semantics as the Redis engine: each dimension is counted with
+        every other filter applied but not its own, and only the tag_limit
+        most popular tags are counted. One GROUP BY per dimension.
+        """
+        empty = {"total": 0, "tags": {}, "categories": {}, "statuses": {}}
+        terms = list(dict.fromkeys(tokenize(query or '')))
+        cache_key, cached = self._cached("facets", {**self._normalized_filters(terms, tags, category, status), "tag_limit": tag_limit})
+        if cached is not None:
+            return cached
+        
+        db = self.session_factory()
+        try:
+            total = self._filtered(db.query(func.count(Job.id)), terms, tags, category, status)[0].scalar()
+            popular = {tag for tag, _ in self._tag_counts(db).limit(tag_limit)}
+            
+            job_tags = self._filtered(
+                db.query(Job.id.label("job_id"), func.lower(func.unnest(Job.tags)).label("value")),
+                terms, None, category, status
+            )[0].subquery()
+            tag_counts = db.query(job_tags.c.value, func.count(func.distinct(job_tags.c.job_id))).group_by(job_tags.c.value)
+            category_counts = self._filtered(
+                db.query(func.lower(Job.category), func.count(Job.id)), terms, tags, None, status
+            )[0].group_by(func.lower(Job.category))
+            status_counts = self._filtered(
+                db.query(Job.status, func.count(Job.id)), terms, tags, category, None
+            )[0].group_by(Job.status)
+            
+            statuses = {value.value for value in JobStatus}
+            result = {
+                "total": total,
+                "tags": self._ordered_counts((value, count) for value, count in tag_counts if value in popular),
+                "categories": self._ordered_counts((value, count) for value, count in category_counts if value),
+                "statuses": self._ordered_counts((value, count) for value, count in status_counts if value in statuses),
+            }
+        except Exception as e:
+            logger.error(f"Error computing facets in PostgreSQL: {e}")
+            return empty
+        finally:
+            db.close()
+        
+        self._cache_set(cache_key, result)
+        return result
+    
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Autocomplete title words, skills and tags starting with a prefix
+        
+        Words are split and cleaned like tokenize and counted once per job,
+        as in the Redis engine. This scans the title, skills and tags of
+        every job, so results are cached.
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        cache_key, cached = self._cached("suggest", {"prefix": prefix, "limit": limit})
+        if cached is not None:
+            return cached
+        
+        db = self.session_factory()
+        try:
+            title_words = db.query(
+                Job.id.label("job_id"),
+                func.regexp_split_to_table(func.lower(func.coalesce(Job.title, '')), r'\s+').label("word"),
+            )
+            skill_words = db.query(
+                Job.id.label("job_id"),
+                func.regexp_split_to_table(func.lower(func.job_search_text(Job.skills_required)), r'\s+').label("word"),
+            )
+            raw = union_all(title_words.statement, skill_words.statement).subquery()
+            cleaned = db.query(
+                raw.c.job_id, func.regexp_replace(raw.c.word, '[^[:alnum:]]', '', 'g').label("text")
+            ).subquery()
+            count = func.count(func.distinct(cleaned.c.job_id))
+            words = (
+                db.query(cleaned.c.text, count)
+                .filter(func.length(cleaned.c.text) >= 2, cleaned.c.text.startswith(prefix, autoescape=True))
+                .group_by(cleaned.c.text)
+                .order_by(count.desc(), cleaned.c.text)
+                .limit(limit)
+            )
+            rows = [(text, "word", count) for text, count in words]
+            rows.extend((tag, "tag", count) for tag, count in self._tag_counts(db, prefix).limit(limit))
+        except Exception as e:
+            logger.error(f"Error getting suggestions from PostgreSQL: {e}")
+            return []
+        finally:
+            db.close()
+        
+        rows.sort(key=lambda row: (-row[2], row[0], row[1]))
+        suggestions = [{"text": text, "type": kind, "count": count} for text, kind, count in rows[:limit]]
+        self._cache_set(cache_key, suggestions)
+        return suggestions
+    
+    def popular_tags(self, prefix: Optional[str] = None, offset: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """Tags ordered by the number of jobs carrying them, as in the Redis engine"""
+        prefix = (prefix or '').strip().lower()
+        cache_key, cached = self._cached("tags", {"prefix": prefix, "offset": offset, "limit": limit})
+        if cached is not None:
+            return cached
+        
+        db = self.session_factory()
+        try:
+            rows = self._tag_counts(db, prefix).add_columns(func.count().over()).offset(offset).limit(limit).all()
+            total = rows[0][2] if rows else self._tag_counts(db, prefix).count()
+        except Exception as e:
+            logger.error(f"Error getting popular tags from PostgreSQL: {e}")
+            return {"tags": [], "total": 0}
+        finally:
+            db.close()
+        
+        result = {"tags": [{"tag": tag, "count": count} for tag, count, _ in rows], "total": total}
+        self._cache_set(cache_key, result)
+        return result
+    
+    def _tag_counts(self, db: Session, prefix: str = ''):
+        """Query of (lowercased tag, jobs carrying it), most popular first like ZREVRANGE"""
+        job_tags = db.query(Job.id.label("job_id"), func.lower(func.unnest(Job.tags)).label("tag")).subquery()
+        count = func.count(func.distinct(job_tags.c.job_id))
+        query = db.query(job_tags.c.tag, count).group_by(job_tags.c.tag)
+        if prefix:
+            query = query.filter(job_tags.c.tag.startswith(prefix, autoescape=True))
+        return query.order_by(count.desc(), job_tags.c.tag.desc())
+    
+    def _ordered_counts(self, counts) -> Dict[str, int]:
+        """Facet counts ordered by count, then value (zero counts omitted)"""
+        return dict(sorted(((value, count) for value, count in counts if count), key=lambda item: (-item[1], item[0])))
+    
+    def _normalized_filters(
+        self,
+        terms: List[str],
+        tags: Optional[List[str]],
+        category: Optional[str],
+        status: Optional[str]
+    ) -> Dict[str, Any]:
+        return {
+            "terms": terms,
+            "tags": sorted({tag.lower() for tag in tags or []}),
+            "category": (category or '').lower(),
+            "status": (status or '').lower(),
+        }
+    
+    def _cached(self, kind: str, params: Dict[str, Any]) -> Tuple[Optional[str], Optional[Any]]:
+        """
+        Cache key and cached result for a query (None, None when caching is off)
+        
+        The key holds the Redis index generation, read in the same round trip
+        as the cached value (CACHED_PAGE_SCRIPT, hits and misses counted in
+        PG_CACHE_STATS_KEY), so a result computed while jobs change is stored
+        under the old generation and never served.
+        """
+        redis_client = get_redis()
+        if not redis_client or not self.cache_ttl:
+            return None, None
+        digest = hashlib.sha1(json.dumps({"kind": kind, **params}, sort_keys=True).encode()).hexdigest()
+        try:
+            lookup = redis_client.register_script(CACHED_PAGE_SCRIPT)
+            generation, cached = lookup(keys=[search_service.generation_key, PG_CACHE_STATS_KEY], args=[PG_CACHE_PREFIX, digest])
+            return f"{PG_CACHE_PREFIX}{generation}:{digest}", json.loads(cached) if cached else None
+        except Exception as e:
+            logger.warning(f"Search cache read failed: {e}")
+            return None, None
+    
+    def _cache_set(self, key: Optional[str], result: Any):
+        redis_client = get_redis()
+        if not key or not redis_client:
+            return
+        try:
+            redis_client.setex(key, self.cache_ttl, json.dumps(result))
+        except Exception as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+
+# Singleton instance
+postgres_search = PostgresSearchBackend()
+
+
+def get_search_backend() -> SearchBackend:
+    """
+    Search backend selected by SEARCH_BACKEND
+    
+    The Redis index is used by default. When Redis is not connected,
+    searches are answered by PostgreSQL instead of returning no results.
+    The in-process engine (SEARCH_BACKEND=memory) is search_service itself.
+    """
+    if settings.SEARCH_BACKEND == "postgres" or (search_service.name == "redis" and not search_service.redis):
+        return postgres_search
+    return search_service
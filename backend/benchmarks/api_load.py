@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+API load benchmark: requests/s of the database-backed endpoints under concurrency
+
+Replays a mix of read endpoints (job listings, a user profile and stats,
+notification counts, conversations, proposals) against a running server at
+each concurrency level, and reports throughput, p50/p95/p99 latency and
+failed requests per level.
+
+The wallet address used for the per-user endpoints defaults to the client of
+the most recent job, so point it at a server with some data in PostgreSQL.
+To compare two builds (e.g. before and after a change), run it once against
+each and save the results, then print them side by side:
+
+    python benchmarks/api_load.py --output before.json
+    ... deploy the other build ...
+    python benchmarks/api_load.py --output after.json --compare before.json
+
+Usage (from backend/):
+    python benchmarks/api_load.py [--base-url http://localhost:8000] \\
+        [--concurrency 50 200 1000] [--requests 5000] [--address 0x...] \\
+        [--output results.json] [--compare before.json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+def endpoint_mix(address: str) -> List[str]:
+    """Paths replayed round-robin, weighted towards the listing pages"""
+    return [
+        "/api/v1/jobs/?limit=20",
+        "/api/v1/jobs/?status=open&limit=20",
+        f"/api/v1/jobs/client/{address}?limit=10",
+        f"/api/v1/users/{address}",
+        f"/api/v1/users/{address}/stats",
+        f"/api/v1/notifications/count?user_address={address}",
+        f"/api/v1/notifications/?user_address={address}&limit=20",
+        f"/api/v1/chat/conversations?user_address={address}",
+        f"/api/v1/proposals/freelancer/{address}",
+        f"/api/v1/jobs/saved/{address}",
+    ]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def discover_address(base_url: str) -> Optional[str]:
+    """Client address of the most recent job"""
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        response = await client.get("/api/v1/jobs/", params={"limit": 1})
+        response.raise_for_status()
+        jobs = response.json()["jobs"]
+        return jobs[0]["client_address"] if jobs else None
+
+
+async def run_level(base_url: str, paths: List[str], requests: int, concurrency: int) -> Dict[str, Any]:
+    """Issue `requests` requests with `concurrency` clients, each keeping one request in flight"""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    latencies: List[float] = []
+    errors = 0
+    next_request = 0
+    
+    async def client_loop(client: httpx.AsyncClient):
+        nonlocal errors, next_request
+        while next_request < requests:
+            path = paths[next_request % len(paths)]
+            next_request += 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code != 200:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+    
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "elapsed": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": statistics.mean(latencies) * 1000,
+        "errors": errors,
+    }
+
+
+def report(result: Dict[str, Any]):
+    print(f"\n👥 {result['concurrency']} clients: {result['requests']} requests in {result['elapsed']:.1f}s "
+          f"({result['requests_per_second']:.0f} requests/s)")
+    print(f"⏱️  latency p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms "
+          f"p99={result['p99_ms']:.2f}ms mean={result['mean_ms']:.2f}ms")
+    print(f"{'✅' if result['errors'] == 0 else '❌'} {result['errors']} failed requests")
+
+
+def compare(before: List[Dict[str, Any]], after: List[Dict[str, Any]]):
+    before_by_level = {result["concurrency"]: result for result in before}
+    print(f"\n📊 {'clients':>8} {'before req/s':>13} {'after req/s':>12} {'speedup':>8} {'before p99':>11} {'after p99':>10}")
+    for result in after:
+        previous = before_by_level.get(result["concurrency"])
+        if not previous:
+            continue
+        print(f"   {result['concurrency']:>8} {previous['requests_per_second']:>13.0f} "
+              f"{result['requests_per_second']:>12.0f} "
+              f"{result['requests_per_second'] / previous['requests_per_second']:>7.2f}x "
+              f"{previous['p99_ms']:>9.0f}ms {result['p99_ms']:>8.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API load benchmark")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Server to benchmark")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 200, 1000], help="Concurrent clients per level")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per level")
+    parser.add_argument("--address", help="Wallet address for the per-user endpoints")
+    parser.add_argument("--output", help="Write the results of this run to a JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    args = parser.parse_args()
+    
+    try:
+        address = args.address or asyncio.run(discover_address(args.base_url))
+    except httpx.HTTPError as e:
+        print(f"❌ Server not available at {args.base_url}: {e}")
+        sys.exit(1)
+    if not address:
+        print("❌ No jobs found, pass --address")
+        sys.exit(1)
+    
+    paths = endpoint_mix(address.lower())
+    print(f"🧪 {len(paths)} endpoints, {args.requests} requests per level, address {address}")
+    
+    results = []
+    for concurrency in args.concurrency:
+        result = asyncio.run(run_level(args.base_url, paths, args.requests, concurrency))
+        report(result)
+        results.append(result)
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+    
+    if args.compare:
+        compare(json.loads(Path(args.compare).read_text()), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Synthetic job catalogue for search benchmarks
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+
+from app.services.search import SORT_RELEVANCE
+
+CATEGORIES = [
+    "Web Development", "Mobile Development", "Smart Contracts", "Design",
+    "Data Science", "DevOps", "Writing", "Marketing", "Blockchain", "Testing",
+]
+
+SKILLS = [
+    "python", "react", "solidity", "typescript", "javascript", "rust", "go",
+    "django", "fastapi", "nodejs", "postgresql", "redis", "docker", "kubernetes",
+    "aws", "figma", "tailwind", "web3", "hardhat", "ethers", "nextjs", "graphql",
+    "flutter", "swift", "kotlin", "pandas", "pytorch", "terraform", "seo", "copywriting",
+]
+
+TAGS = [
+    "frontend", "backend", "fullstack", "defi", "nft", "dao", "ui", "ux", "api",
+    "mobile", "audit", "urgent", "long-term", "remote", "mvp", "dashboard", "landing-page",
+    "bugfix", "migration", "integration",
+]
+
+TITLE_WORDS = [
+    "build", "develop", "design", "fix", "migrate", "audit", "optimize", "create",
+    "implement", "refactor", "integrate", "deploy", "app", "website", "dashboard",
+    "contract", "marketplace", "wallet", "platform", "api", "landing", "page", "bot",
+]
+
+DESCRIPTION_WORDS = [
+    "the", "and", "for", "with", "our", "we", "need", "looking", "experienced",
+    "developer", "project", "team", "users", "feature", "support", "existing",
+    "new", "deliver", "quality", "tests", "documentation", "deadline", "budget",
+    "communication", "milestone", "code", "review", "performance", "security",
+    "responsive", "integration", "backend", "frontend", "database", "deployment",
+] + SKILLS
+
+STATUSES = ["open"] * 6 + ["in_progress"] * 2 + ["submitted", "completed", "cancelled"]
+
+
+def _zipf_weights(size: int) -> List[float]:
+    """Word popularity following Zipf's law, like natural text"""
+    return [1.0 / rank for rank in range(1, size + 1)]
+
+
+def generate_jobs(count: int, seed: int = 42) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Generate (job_id, job_data) pairs shaped like job_to_document output
+    
+    Words, skills and tags are drawn with Zipf-distributed popularity so a
+    handful of terms match most jobs and a long tail matches few, which is
+    what makes intersection order and posting sizes matter.
+    """
+    rng = random.Random(seed)
+    title_weights = _zipf_weights(len(TITLE_WORDS))
+    description_weights = _zipf_weights(len(DESCRIPTION_WORDS))
+    skill_weights = _zipf_weights(len(SKILLS))
+    tag_weights = _zipf_weights(len(TAGS))
+    category_weights = _zipf_weights(len(CATEGORIES))
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    
+    for i in range(count):
+        job_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        created_at = start + timedelta(minutes=i)
+        skills = list(dict.fromkeys(rng.choices(SKILLS, skill_weights, k=rng.randint(1, 5))))
+        tags = list(dict.fromkeys(rng.choices(TAGS, tag_weights, k=rng.randint(0, 3))))
+        title = " ".join(rng.choices(TITLE_WORDS, title_weights, k=rng.randint(3, 7)) + skills[:1])
+        description = " ".join(rng.choices(DESCRIPTION_WORDS, description_weights, k=rng.randint(30, 200)))
+        
+        yield job_id, {
+            'id': job_id,
+            'client_address': f"0x{rng.getrandbits(160):040x}",
+            'freelancer_address': None,
+            'title': title.capitalize(),
+            'description': description,
+            'category': rng.choices(CATEGORIES, category_weights)[0],
+            'skills_required': skills,
+            'tags': tags,
+            'budget': round(rng.lognormvariate(6, 1), 2),
+            'deadline': (created_at + timedelta(days=rng.randint(3, 90))).isoformat(),
+            'status': rng.choice(STATUSES),
+            'ipfs_hash': None,
+            'blockchain_job_id': None,
+            'deliverable_url': None,
+            'client_confirmed_completion': False,
+            'freelancer_confirmed_completion': False,
+            'escrow_address': None,
+            'allow_escrow_revert': False,
+            'created_at': created_at.isoformat(),
+            'updated_at': created_at.isoformat(),
+            'proposal_count': rng.randint(0, 20),
+        }
+
+
+def generate_queries(count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """
+    Search_jobs keyword arguments for a mix of typical searches
+    
+    Covers multi-tag unions with a status filter, multi-term text search
+    within a category, and relevance-ranked text search with tags.
+    """
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        kind = rng.randrange(3)
+        if kind == 0:
+            queries.append({"tags": rng.sample(TAGS, rng.randint(2, 4)), "status": "open"})
+        elif kind == 1:
+            queries.append({
+                "query": " ".join(rng.sample(SKILLS, 2)),
+                "category": rng.choice(CATEGORIES),
+            })
+        else:
+            queries.append({
+                "query": rng.choice(SKILLS),
+                "tags": rng.sample(TAGS, 2),
+                "sort": SORT_RELEVANCE,
+            })
+    return queries
+
+
+def generate_query_mix(count: int, seed: int = 11) -> List[Dict[str, Any]]:
+    """
+    Search_jobs keyword arguments weighted like real traffic
+    
+    Mostly short text searches and category browsing, then tag filters,
+    relevance-ranked searches and budget-range listings sorted by budget
+    or deadline. Popular terms are drawn more often (Zipf), so the mix
+    repeats queries the way users do.
+    """
+    rng = random.Random(seed)
+    skill_weights = _zipf_weights(len(SKILLS))
+    category_weights = _zipf_weights(len(CATEGORIES))
+    tag_weights = _zipf_weights(len(TAGS))
+    kinds = ["term", "browse", "terms", "tags", "relevance", "budget"]
+    kind_weights = [30, 25, 15, 12, 10, 8]
+    
+    queries = []
+    for _ in range(count):
+        kind = rng.choices(kinds, kind_weights)[0]
+        if kind == "term":
+            queries.append({"query": rng.choices(SKILLS, skill_weights)[0]})
+        elif kind == "browse":
+            queries.append({"category": rng.choices(CATEGORIES, category_weights)[0], "status": "open"})
+        elif kind == "terms":
+            queries.append({"query": " ".join(dict.fromkeys(rng.choices(SKILLS, skill_weights, k=2)))})
+        elif kind == "tags":
+            queries.append({"tags": list(dict.fromkeys(rng.choices(TAGS, tag_weights, k=2))), "status": "open"})
+        elif kind == "relevance":
+            queries.append({"query": rng.choices(SKILLS, skill_weights)[0], "sort": SORT_RELEVANCE})
+        else:
+            low = rng.choice([100, 250, 500, 1000])
+            queries.append({
+                "min_budget": low,
+                "max_budget": low * rng.choice([2, 4, 10]),
+                "sort": rng.choice(["budget_desc", "deadline_asc"]),
+            })
+    return queries
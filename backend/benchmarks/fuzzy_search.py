@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Fuzzy search benchmark: trigram candidates vs scanning every job
+
+Indexes a synthetic catalogue into a throwaway key namespace, then looks up
+misspelled title/skill words (one transposition, deletion, insertion or
+substitution) two ways:
+
+- trigram: search_jobs with fuzzy matching (trigram shortlist + edit distance)
+- scan: read every cached job document and compare each title/skill word
+  with the term by edit distance, i.e. what a full-scan fallback costs
+
+Reports latency per query and how many typos each approach resolved.
+
+Usage (from backend/):
+    python benchmarks/fuzzy_search.py [--jobs 20000] [--queries 200]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import string
+import sys
+import time
+from pathlib import Path
+from typing import List, Set
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import init_redis, get_redis
+from app.services.search import SearchService, FUZZY_FIELDS, FUZZY_MIN_LENGTH, edit_distance, max_edits, tokenize
+from benchmarks.catalogue import generate_jobs, SKILLS, TITLE_WORDS
+
+NAMESPACE = "bench:fuzzy:"
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    """Apply one random typo to a word"""
+    i = rng.randrange(len(word) - 1)
+    kind = rng.randrange(4)
+    if kind == 0:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    if kind == 1:
+        return word[:i] + word[i + 1:]
+    if kind == 2:
+        return word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+    return word[:i] + rng.choice(string.ascii_lowercase.replace(word[i], '')) + word[i + 1:]
+
+
+def scan_search(service: SearchService, term: str, batch_size: int = 1000) -> Set[str]:
+    """Match the term against every job document (baseline)"""
+    limit = max_edits(term)
+    matches = set()
+    redis_client = get_redis()
+    keys = []
+    
+    def check(batch):
+        for value in redis_client.mget(batch):
+            if not value:
+                continue
+            job = json.loads(value)
+            text = ' '.join(service._field_text(job, field) for field in FUZZY_FIELDS)
+            if any(edit_distance(term, word, limit) <= limit for word in tokenize(text)):
+                matches.add(job['id'])
+    
+    for key in redis_client.scan_iter(match=f"{service.job_index_prefix}*", count=batch_size):
+        keys.append(key)
+        if len(keys) >= batch_size:
+            check(keys)
+            keys = []
+    if keys:
+        check(keys)
+    return matches
+
+
+def report(name: str, latencies: List[float], resolved: int, total: int):
+    latencies = sorted(latencies)
+    print(f"  {name:8} p50={latencies[len(latencies) // 2] * 1000:8.2f}ms "
+          f"p95={latencies[int(len(latencies) * 0.95)] * 1000:8.2f}ms "
+          f"mean={statistics.mean(latencies) * 1000:8.2f}ms "
+          f"resolved {resolved}/{total}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trigram fuzzy search vs full scan")
+    parser.add_argument("--jobs", type=int, default=20000, help="Synthetic jobs to index")
+    parser.add_argument("--queries", type=int, default=200, help="Misspelled queries to run")
+    parser.add_argument("--scan-queries", type=int, default=20, help="Queries also run through the scan baseline")
+    args = parser.parse_args()
+    
+    init_redis()
+    if not get_redis():
+        print("❌ Redis not available")
+        sys.exit(1)
+    
+    service = SearchService(namespace=NAMESPACE)
+    service.clear()
+    try:
+        started = time.perf_counter()
+        indexed = service.index_jobs(generate_jobs(args.jobs))
+        print(f"📦 Indexed {indexed} jobs in {time.perf_counter() - started:.1f}s")
+        
+        rng = random.Random(11)
+        vocabulary = [word for word in SKILLS + TITLE_WORDS if len(word) >= FUZZY_MIN_LENGTH + 1]
+        typos = []
+        while len(typos) < args.queries:
+            word = rng.choice(vocabulary)
+            typo = misspell(word, rng)
+            if len(typo) >= FUZZY_MIN_LENGTH and typo not in vocabulary:
+                typos.append((word, typo))
+        
+        fuzzy_latencies, scan_latencies = [], []
+        fuzzy_resolved = scan_resolved = recall_hits = recall_total = 0
+        for index, (word, typo) in enumerate(typos):
+            started = time.perf_counter()
+            page = service.search_jobs_page(query=typo, limit=100000)
+            fuzzy_latencies.append(time.perf_counter() - started)
+            if page["corrections"].get(typo) == word:
+                fuzzy_resolved += 1
+            
+            if index < args.scan_queries:
+                started = time.perf_counter()
+                scanned = scan_search(service, typo)
+                scan_latencies.append(time.perf_counter() - started)
+                if scanned:
+                    scan_resolved += 1
+                recall_hits += len(scanned & set(page["job_ids"]))
+                recall_total += len(scanned)
+        
+        print(f"🔎 {len(typos)} misspelled queries over {indexed} jobs")
+        report("trigram", fuzzy_latencies, fuzzy_resolved, len(fuzzy_latencies))
+        report("scan", scan_latencies, scan_resolved, len(scan_latencies))
+        if recall_total:
+            print(f"  trigram results cover {recall_hits / recall_total:.1%} of the jobs the scan matched")
+    finally:
+        service.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+In-process search engine benchmark
+
+Builds MemorySearchService indexes over synthetic catalogues of increasing
+size and reports index build time, memory per indexed job and query latency
+for the standard query mix. Needs neither Redis nor PostgreSQL.
+
+Usage (from backend/):
+    python benchmarks/memory_engine.py [--sizes 10000 100000] [--queries 200]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.search_memory import MemorySearchService
+from benchmarks.catalogue import generate_jobs, generate_queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process search engine benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="Catalogue sizes")
+    parser.add_argument("--queries", type=int, default=200, help="Distinct queries in the mix")
+    parser.add_argument("--rounds", type=int, default=3, help="Times the mix is replayed")
+    args = parser.parse_args()
+    
+    queries = generate_queries(args.queries)
+    for size in args.sizes:
+        engine = MemorySearchService()
+        started = time.perf_counter()
+        engine.index_jobs(generate_jobs(size))
+        build_time = time.perf_counter() - started
+        usage = engine.memory_usage()
+        
+        latencies = []
+        for _ in range(args.rounds):
+            for query in queries:
+                started = time.perf_counter()
+                engine.search_jobs(limit=50, **query)
+                latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        
+        print(f"📦 {size} jobs: built in {build_time:.1f}s, "
+              f"{usage['bytes'] / 1048576:.1f} MiB, {usage['bytes_per_job']:.0f} bytes per job, "
+              f"{usage['postings'] / size:.0f} postings per job")
+        print(f"   p50={latencies[len(latencies) // 2]:.2f}ms "
+              f"p95={latencies[int(len(latencies) * 0.95)]:.2f}ms "
+              f"p99={latencies[int(len(latencies) * 0.99)]:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
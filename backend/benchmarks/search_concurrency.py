@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for SearchService intersections
+
+Indexes a synthetic catalogue into a throwaway key namespace on the local
+Redis, computes the expected result of every query sequentially, then
+replays the queries from several worker processes at once (like uvicorn
+workers sharing one Redis) and checks every concurrent result against the
+expected one. Queries are chosen so they go through temporary intersection
+keys: multi-tag unions, multi-filter intersections and relevance ranking.
+
+Usage (from backend/):
+    python benchmarks/search_concurrency.py [--jobs 20000] [--workers 8] [--rounds 50]
+"""
+
+import argparse
+import multiprocessing
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import init_redis, get_redis
+from app.services.search import SearchService, SORT_RELEVANCE
+from benchmarks.catalogue import generate_jobs, generate_queries
+
+NAMESPACE = "bench:concurrency:"
+RESULT_LIMIT = 100000  # Large enough that results are complete and comparable
+
+
+def run_query(service: SearchService, query: Dict[str, Any]) -> List[str]:
+    return service.search_jobs(limit=RESULT_LIMIT, **query)
+
+
+def normalize(query: Dict[str, Any], result: List[str]) -> Any:
+    # Unranked results come from SSCAN, only the membership is meaningful
+    return result if query.get("sort") == SORT_RELEVANCE else sorted(result)
+
+
+def worker(args: Tuple[List[Dict[str, Any]], List[Any], int, int]) -> Tuple[int, int, List[float]]:
+    """Replay the queries in random order, returns (queries, mismatches, latencies)"""
+    queries, expected, rounds, seed = args
+    init_redis()
+    service = SearchService(namespace=NAMESPACE)
+    rng = random.Random(seed)
+    order = list(range(len(queries)))
+    mismatches = 0
+    latencies = []
+    for _ in range(rounds):
+        rng.shuffle(order)
+        for index in order:
+            started = time.perf_counter()
+            result = run_query(service, queries[index])
+            latencies.append(time.perf_counter() - started)
+            if normalize(queries[index], result) != expected[index]:
+                mismatches += 1
+    return len(order) * rounds, mismatches, latencies
+
+
+def percentile(values: List[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent search correctness and latency benchmark")
+    parser.add_argument("--jobs", type=int, default=20000, help="Synthetic jobs to index")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent worker processes")
+    parser.add_argument("--queries", type=int, default=50, help="Distinct queries in the mix")
+    parser.add_argument("--rounds", type=int, default=20, help="Times each worker replays the mix")
+    args = parser.parse_args()
+    
+    init_redis()
+    if not get_redis():
+        print("❌ Redis not available")
+        sys.exit(1)
+    
+    service = SearchService(namespace=NAMESPACE)
+    service.clear()
+    try:
+        started = time.perf_counter()
+        indexed = service.index_jobs(generate_jobs(args.jobs))
+        print(f"📦 Indexed {indexed} jobs in {time.perf_counter() - started:.1f}s")
+        
+        queries = generate_queries(args.queries)
+        expected = [normalize(query, run_query(service, query)) for query in queries]
+        
+        started = time.perf_counter()
+        with multiprocessing.Pool(args.workers) as pool:
+            results = pool.map(worker, [(queries, expected, args.rounds, seed) for seed in range(args.workers)])
+        elapsed = time.perf_counter() - started
+        
+        total = sum(count for count, _, _ in results)
+        mismatches = sum(bad for _, bad, _ in results)
+        latencies = [latency for _, _, worker_latencies in results for latency in worker_latencies]
+        
+        print(f"🔁 {total} queries from {args.workers} workers in {elapsed:.1f}s ({total / elapsed:.0f} queries/s)")
+        print(f"⏱️  latency p50={percentile(latencies, 50) * 1000:.2f}ms "
+              f"p95={percentile(latencies, 95) * 1000:.2f}ms "
+              f"p99={percentile(latencies, 99) * 1000:.2f}ms "
+              f"mean={statistics.mean(latencies) * 1000:.2f}ms")
+        leaked = sum(1 for _ in get_redis().scan_iter(match=f"{service.search_index_key}:temp:*"))
+        print(f"{'✅' if mismatches == 0 else '❌'} {mismatches} results differed from the sequential run")
+        print(f"{'✅' if leaked == 0 else '❌'} {leaked} temporary keys left behind")
+        sys.exit(0 if mismatches == 0 and leaked == 0 else 1)
+    finally:
+        service.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Search load benchmark: synthetic catalogue, query-mix replay, latency and Redis cost
+
+Generates a synthetic catalogue (Zipf-distributed words, skills and tags),
+indexes it one job at a time through SearchService.index_job, then replays
+a weighted query mix at the requested concurrency against:
+
+  service   SearchService.search_jobs, from a thread pool
+  endpoint  GET /api/v1/search/jobs, in process through the ASGI app or
+            against a running server with --base-url
+
+For each target it reports throughput, p50/p95/p99 latency and the Redis
+commands issued per query, taken from the difference of INFO commandstats
+before and after the replay (run it against an otherwise idle local Redis).
+
+The service target uses a throwaway key namespace. The endpoint target
+reads the live index, so its jobs are indexed under the live namespace and
+deleted again at the end; they are never written to PostgreSQL, and their
+documents are served from the Redis job cache. Result page caching is
+disabled for the service target unless --cache is given; the endpoint
+always goes through the cache, and its hit ratio is reported.
+
+Usage (from backend/):
+    python benchmarks/search_load.py [--jobs 50000] [--queries 500] [--concurrency 16] \\
+        [--target service endpoint] [--base-url http://localhost:8000] [--cache]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import init_redis, get_redis
+from app.services.search import SearchService, search_service
+from benchmarks.catalogue import generate_jobs, generate_query_mix
+
+NAMESPACE = "bench:load:"
+
+
+class UncachedSearchService(SearchService):
+    """SearchService with the result page cache bypassed, so every query hits the index"""
+    
+    def _cached_page(self, digest: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        return "", None
+    
+    def _cache_page(self, cache_key: str, page: Dict[str, Any]):
+        pass
+
+
+def percentile(values: List[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def command_stats() -> Dict[str, int]:
+    """Calls per Redis command since the server started"""
+    return {
+        command.replace("cmdstat_", ""): int(stats["calls"])
+        for command, stats in get_redis().info("commandstats").items()
+    }
+
+
+def index_catalogue(service: SearchService, count: int) -> List[str]:
+    started = time.perf_counter()
+    job_ids = []
+    for job_id, job_data in generate_jobs(count):
+        if service.index_job(job_id, job_data):
+            job_ids.append(job_id)
+    elapsed = time.perf_counter() - started
+    print(f"📦 Indexed {len(job_ids)} jobs with index_job in {elapsed:.1f}s ({len(job_ids) / elapsed:.0f} jobs/s)")
+    return job_ids
+
+
+def to_params(query: Dict[str, Any]) -> Dict[str, Any]:
+    """search_jobs keyword arguments as /api/v1/search/jobs query parameters"""
+    params = {("q" if key == "query" else key): value for key, value in query.items()}
+    params["fuzzy"] = "false"
+    return params
+
+
+def replay_service(service: SearchService, queries: List[Dict[str, Any]], requests: int, concurrency: int) -> Tuple[List[float], float]:
+    """Run `requests` queries from a thread pool, returns (latencies, elapsed)"""
+    def run(index: int) -> float:
+        query = queries[index % len(queries)]
+        started = time.perf_counter()
+        service.search_jobs(fuzzy=False, **query)
+        return time.perf_counter() - started
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        latencies = list(pool.map(run, range(requests)))
+    return latencies, time.perf_counter() - started
+
+
+async def replay_endpoint(
+    queries: List[Dict[str, Any]],
+    requests: int,
+    concurrency: int,
+    base_url: Optional[str]
+) -> Tuple[List[float], float, int]:
+    """Issue `requests` HTTP searches, at most `concurrency` in flight; returns (latencies, elapsed, errors)"""
+    if base_url:
+        client = httpx.AsyncClient(base_url=base_url, timeout=30)
+    else:
+        from app.main import app
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30)
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+    
+    async def run(index: int):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get("/api/v1/search/jobs", params=to_params(queries[index % len(queries)]))
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+    
+    async with client:
+        started = time.perf_counter()
+        await asyncio.gather(*(run(index) for index in range(requests)))
+        return latencies, time.perf_counter() - started, errors
+
+
+def report(name: str, latencies: List[float], elapsed: float, commands: Dict[str, int]):
+    total = len(latencies)
+    print(f"\n🔎 {name}: {total} queries in {elapsed:.1f}s ({total / elapsed:.0f} queries/s)")
+    print(f"⏱️  latency p50={percentile(latencies, 50) * 1000:.2f}ms "
+          f"p95={percentile(latencies, 95) * 1000:.2f}ms "
+          f"p99={percentile(latencies, 99) * 1000:.2f}ms "
+          f"mean={statistics.mean(latencies) * 1000:.2f}ms")
+    # INFO itself is counted once by the snapshot taken after the replay
+    commands = {command: calls for command, calls in commands.items() if command != "info" and calls > 0}
+    print(f"📮 Redis commands per query: {sum(commands.values()) / total:.1f}")
+    for command, calls in sorted(commands.items(), key=lambda item: -item[1]):
+        print(f"   {command:<18} {calls / total:6.2f}")
+
+
+def measure(run) -> Tuple[Any, Dict[str, int]]:
+    """Run a replay and return its result with the Redis command counts it caused"""
+    before = command_stats()
+    result = run()
+    after = command_stats()
+    return result, {command: calls - before.get(command, 0) for command, calls in after.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search load benchmark")
+    parser.add_argument("--jobs", type=int, default=50000, help="Synthetic jobs to index")
+    parser.add_argument("--queries", type=int, default=500, help="Queries in the mix")
+    parser.add_argument("--requests", type=int, default=5000, help="Queries replayed per target")
+    parser.add_argument("--concurrency", type=int, default=16, help="Queries in flight")
+    parser.add_argument("--target", nargs="+", choices=["service", "endpoint"], default=["service"], help="What to benchmark")
+    parser.add_argument("--base-url", help="Benchmark a running server instead of the in-process app")
+    parser.add_argument("--cache", action="store_true", help="Keep the result page cache on for the service target")
+    args = parser.parse_args()
+    
+    init_redis()
+    if not get_redis():
+        print("❌ Redis not available")
+        sys.exit(1)
+    
+    queries = generate_query_mix(args.queries)
+    print(f"🧪 {len(queries)} queries ({len({repr(sorted(query.items())) for query in queries})} distinct), "
+          f"concurrency {args.concurrency}")
+    
+    if "service" in args.target:
+        service = SearchService(namespace=NAMESPACE) if args.cache else UncachedSearchService(namespace=NAMESPACE)
+        service.clear()
+        try:
+            index_catalogue(service, args.jobs)
+            (latencies, elapsed), commands = measure(
+                lambda: replay_service(service, queries, args.requests, args.concurrency)
+            )
+            report(f"SearchService.search_jobs{'' if args.cache else ' (result cache off)'}", latencies, elapsed, commands)
+        finally:
+            service.clear()
+    
+    if "endpoint" in args.target:
+        job_ids = index_catalogue(search_service, args.jobs)
+        try:
+            metrics_before = search_service.cache_metrics()
+            (latencies, elapsed, errors), commands = measure(
+                lambda: asyncio.run(replay_endpoint(queries, args.requests, args.concurrency, args.base_url))
+            )
+            metrics_after = search_service.cache_metrics()
+            report(f"GET /api/v1/search/jobs ({args.base_url or 'in process'})", latencies, elapsed, commands)
+            lookups = metrics_after["lookups"] - metrics_before["lookups"]
+            hits = metrics_after["hits"] - metrics_before["hits"]
+            print(f"🗃️  result cache hit ratio {hits / lookups if lookups else 0:.1%}")
+            print(f"{'✅' if errors == 0 else '❌'} {errors} failed requests")
+        finally:
+            for job_id in job_ids:
+                search_service.delete_job(job_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Autocomplete latency benchmark
+
+Indexes a synthetic catalogue into a throwaway key namespace and replays
+keystroke sequences (every prefix of popular and rare words, as a user
+typing them) against SearchService.suggest, reporting p50/p95/p99. The
+target for the search box is p99 under 5 ms.
+
+Usage (from backend/):
+    python benchmarks/suggest_latency.py [--jobs 20000] [--rounds 20]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import init_redis, get_redis
+from app.services.search import SearchService
+from benchmarks.catalogue import generate_jobs, SKILLS, TAGS, TITLE_WORDS
+
+NAMESPACE = "bench:suggest:"
+P99_TARGET_MS = 5.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autocomplete latency benchmark")
+    parser.add_argument("--jobs", type=int, default=20000, help="Synthetic jobs to index")
+    parser.add_argument("--rounds", type=int, default=20, help="Times the keystroke sequences are replayed")
+    parser.add_argument("--limit", type=int, default=10, help="Suggestions per request")
+    args = parser.parse_args()
+    
+    init_redis()
+    if not get_redis():
+        print("❌ Redis not available")
+        sys.exit(1)
+    
+    service = SearchService(namespace=NAMESPACE)
+    service.clear()
+    try:
+        indexed = service.index_jobs(generate_jobs(args.jobs))
+        print(f"📦 Indexed {indexed} jobs")
+        
+        keystrokes = [word[:n] for word in SKILLS + TAGS + TITLE_WORDS for n in range(1, len(word) + 1)]
+        rng = random.Random(3)
+        latencies = []
+        for _ in range(args.rounds):
+            rng.shuffle(keystrokes)
+            for prefix in keystrokes:
+                started = time.perf_counter()
+                service.suggest(prefix, args.limit)
+                latencies.append((time.perf_counter() - started) * 1000)
+        
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99)]
+        print(f"⌨️  {len(latencies)} requests: "
+              f"p50={latencies[len(latencies) // 2]:.2f}ms "
+              f"p95={latencies[int(len(latencies) * 0.95)]:.2f}ms "
+              f"p99={p99:.2f}ms")
+        print(f"{'✅' if p99 < P99_TARGET_MS else '❌'} p99 target {P99_TARGET_MS}ms")
+    finally:
+        service.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Query plan regression check for the hot queries
+
+Runs EXPLAIN on the query shapes the API issues most (job listings, a
+user's notifications, a conversation's messages, the escrow dashboard) and
+fails when one of them would scan a whole table, or sort when it should
+read rows in order from an index.
+
+Sequential scans and sorts are disabled for the check (enable_seqscan and
+enable_sort off), so the planner picks a usable index whatever the size of
+the tables; a Seq Scan or Sort node left in a plan means no index can serve
+the query. It therefore works on an empty development database as well as
+on production data. Run it after schema or query changes (exit status 1 on
+a regression):
+
+Usage (from backend/):
+    alembic upgrade head
+    python scripts/check_query_plans.py [--verbose]
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, func, select, text, tuple_
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import engine, Job, Notification, Message
+
+ADDRESS = "0x0000000000000000000000000000000000000001"
+CONVERSATION_ID = "00000000-0000-0000-0000-000000000001"
+JOB_ID = "00000000-0000-0000-0000-000000000001"
+
+# Job listings page newest first on (created_at, id), resuming after a cursor
+NEWEST_FIRST = (Job.created_at.desc(), Job.id.desc())
+AFTER_CURSOR = tuple_(Job.created_at, Job.id) < tuple_(datetime(2026, 1, 1, tzinfo=timezone.utc), JOB_ID)
+
+# (name, statement, must come out of an index in ORDER BY order)
+HOT_QUERIES = [
+    ("latest jobs",
+     select(Job).order_by(*NEWEST_FIRST).limit(51), True),
+    ("latest jobs after cursor",
+     select(Job).where(AFTER_CURSOR).order_by(*NEWEST_FIRST).limit(51), True),
+    ("jobs by status after cursor",
+     select(Job).where(Job.status == "open", AFTER_CURSOR).order_by(*NEWEST_FIRST).limit(51), True),
+    ("jobs by category after cursor",
+     select(Job).where(Job.category == "web development", AFTER_CURSOR).order_by(*NEWEST_FIRST).limit(51), True),
+    ("jobs by status and category after cursor",
+     select(Job).where(Job.status == "open", Job.category == "web development", AFTER_CURSOR)
+     .order_by(*NEWEST_FIRST).limit(51), True),
+    ("client jobs after cursor",
+     select(Job).where(Job.client_address == ADDRESS, AFTER_CURSOR).order_by(*NEWEST_FIRST).limit(11), True),
+    ("freelancer jobs after cursor",
+     select(Job).where(Job.freelancer_address == ADDRESS, AFTER_CURSOR).order_by(*NEWEST_FIRST).limit(51), True),
+    ("client jobs count",
+     select(func.count()).select_from(Job).where(Job.client_address == ADDRESS), False),
+    ("escrow jobs awaiting release",
+     select(Job).where(and_(
+         Job.escrow_address == ADDRESS,
+         Job.client_confirmed_completion == True,
+         Job.freelancer_confirmed_completion == True,
+         Job.status.in_(["in_progress", "submitted", "completed"])
+     )), False),
+    ("escrow revertable jobs",
+     select(Job).where(and_(
+         Job.escrow_address == ADDRESS,
+         Job.allow_escrow_revert == True,
+         Job.status.in_(["open", "in_progress"]),
+         Job.freelancer_address.is_(None)
+     )), False),
+    ("notifications",
+     select(Notification).where(Notification.user_address == ADDRESS)
+     .order_by(Notification.created_at.desc()).limit(50), True),
+    ("unread notifications",
+     select(Notification).where(Notification.user_address == ADDRESS, Notification.is_read == False)
+     .order_by(Notification.created_at.desc()).limit(50), True),
+    ("notification counts",
+     select(func.count(), func.count().filter(Notification.is_read == False))
+     .where(Notification.user_address == ADDRESS), False),
+    ("conversation messages",
+     select(Message).where(Message.conversation_id == CONVERSATION_ID)
+     .order_by(Message.created_at.desc()).limit(50), True),
+    ("conversation last message",
+     select(Message).where(Message.conversation_id == CONVERSATION_ID)
+     .order_by(Message.created_at.desc()).limit(1), True),
+    ("conversation unread count",
+     select(func.count()).select_from(Message).where(
+         Message.conversation_id == CONVERSATION_ID,
+         Message.sender_address != ADDRESS,
+         Message.is_read == False
+     ), False),
+]
+
+
+def plan_nodes(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Every node of an EXPLAIN (FORMAT JSON) plan tree"""
+    nodes = [plan]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+def explain(connection, statement) -> Dict[str, Any]:
+    sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    result = connection.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def check(verbose: bool) -> bool:
+    """Explain every hot query, returns True if none scans a table or sorts"""
+    failures = 0
+    with engine.connect() as connection:
+        # SET LOCAL lasts until the rollback at the end
+        connection.execute(text("SET LOCAL enable_seqscan = off"))
+        connection.execute(text("SET LOCAL enable_sort = off"))
+        
+        for name, statement, ordered in HOT_QUERIES:
+            plan = explain(connection, statement)
+            nodes = plan_nodes(plan)
+            
+            problems = [
+                f"sequential scan on {node['Relation Name']}"
+                for node in nodes if node["Node Type"] == "Seq Scan"
+            ]
+            if ordered:
+                problems.extend(
+                    f"{node['Node Type'].lower()} on {', '.join(node.get('Sort Key', []))}"
+                    for node in nodes if node["Node Type"] in ("Sort", "Incremental Sort")
+                )
+            indexes: Set[str] = {node["Index Name"] for node in nodes if "Index Name" in node}
+            
+            if problems:
+                failures += 1
+                print(f"❌ {name}: {'; '.join(problems)}")
+            else:
+                print(f"✅ {name}: {', '.join(sorted(indexes))}")
+            if verbose or problems:
+                for node in nodes:
+                    relation = node.get("Index Name") or node.get("Relation Name") or ""
+                    print(f"      {node['Node Type']} {relation}".rstrip())
+        
+        connection.rollback()
+    
+    print(f"\n{'✅' if failures == 0 else '❌'} {len(HOT_QUERIES) - failures}/{len(HOT_QUERIES)} hot queries use an index")
+    return failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail when a hot query's plan scans a whole table or sorts")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not only failing ones")
+    args = parser.parse_args()
+    
+    if not check(args.verbose):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
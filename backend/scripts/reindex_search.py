@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Rebuild the Redis search index from the jobs table
+
+Streams every job from PostgreSQL in keyset-paginated chunks, indexes it
+into a shadow key namespace and swaps the shadow index in with RENAME once
+the build is complete. Searches keep being served from the old index while
+the rebuild runs, and memory use is bounded by the chunk size whatever the
+size of the table. Jobs the API writes to the live index meanwhile are
+recorded and re-synced from PostgreSQL after the swap.
+
+Usage (from backend/):
+    python scripts/reindex_search.py [--chunk-size 1000] [--batch-size 500]
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.database import SessionLocal, init_redis, get_redis
+from app.services.search import SearchService, stream_jobs, job_to_document
+
+
+def reindex(chunk_size: int, batch_size: int) -> bool:
+    """Rebuild the search index, returns True if the new index was swapped in"""
+    init_redis()
+    if not get_redis():
+        print("❌ Redis not available, aborting reindex")
+        return False
+    
+    live = SearchService()
+    shadow = SearchService(namespace=f"reindex:{uuid.uuid4().hex}:")
+    print(f"🔨 Building search index in shadow namespace {shadow.namespace}")
+    
+    started = time.monotonic()
+    rows = 0
+    
+    def documents():
+        nonlocal rows
+        for job in stream_jobs(db, chunk_size=chunk_size):
+            rows += 1
+            if rows % chunk_size == 0:
+                live.mark_rebuilding()
+                elapsed = time.monotonic() - started
+                print(f"   {rows} rows streamed ({rows / elapsed:.0f} rows/s)")
+            yield job.id, job_to_document(job)
+    
+    # Record live writes before the first row is read
+    live.mark_rebuilding()
+    try:
+        db = SessionLocal()
+        try:
+            indexed = shadow.index_jobs(documents(), batch_size=batch_size)
+        finally:
+            db.close()
+        
+        build_time = time.monotonic() - started
+        if indexed != rows:
+            print(f"❌ Indexed {indexed} of {rows} jobs, discarding shadow index")
+            shadow.clear()
+            return False
+        print(f"✅ Indexed {rows} jobs in {build_time:.1f}s ({rows / max(build_time, 1e-9):.0f} rows/s)")
+        
+        swap_started = time.monotonic()
+        live.mark_rebuilding()
+        swapped = live.swap_in(shadow, batch_size=batch_size)
+        print(f"✅ Swapped in {swapped} keys in {time.monotonic() - swap_started:.1f}s")
+    finally:
+        replayed = live.finish_rebuild(SessionLocal, batch_size=batch_size)
+        print(f"🔁 Re-synced {replayed} jobs written during the rebuild")
+    
+    total_time = time.monotonic() - started
+    print(f"🏁 Reindex finished in {total_time:.1f}s ({rows / max(total_time, 1e-9):.0f} rows/s overall)")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild the Redis search index from PostgreSQL")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows fetched per keyset page")
+    parser.add_argument("--batch-size", type=int, default=500, help="Jobs written per Redis pipeline flush")
+    args = parser.parse_args()
+    
+    sys.exit(0 if reindex(args.chunk_size, args.batch_size) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,20 @@ interface Proposal {
   job?: Job
 }
 
+// Listings are cursor-paginated; follow next_cursor so stats cover every job
+const fetchAllJobs = async (url: string, limit: number): Promise<Job[]> => {
+  const jobs: Job[] = []
+  let cursor: string | null = null
+  do {
+    const response = await axios.get(url, {
+      params: { limit, cursor: cursor || undefined }
+    })
+    jobs.push(...(response.data.jobs || []))
+    cursor = response.data.next_cursor || null
+  } while (cursor)
+  return jobs
+}
+
 export default function Dashboard() {
   const { address, isConnected } = useWallet()
   const [activeTab, setActiveTab] = useState<TabType>('active')
@@ -53,17 +67,11 @@ export default function Dashboard() {
     try {
       setLoading(true)
       
-      // Fetch all jobs where user is client
-      const clientJobsResponse = await axios.get(
-        `${config.apiUrl}/api/v1/jobs/client/${address}`
-      )
-      const clientJobs: Job[] = clientJobsResponse.data
+      // Fetch all jobs where user is client (page size capped at 50 by the API)
+      const clientJobs = await fetchAllJobs(`${config.apiUrl}/api/v1/jobs/client/${address}`, 50)
 
       // Fetch all jobs where user is freelancer
-      const freelancerJobsResponse = await axios.get(
-        `${config.apiUrl}/api/v1/jobs/freelancer/${address}`
-      )
-      const freelancerJobs: Job[] = freelancerJobsResponse.data
+      const freelancerJobs = await fetchAllJobs(`${config.apiUrl}/api/v1/jobs/freelancer/${address}`, 100)
 
       // Combine and filter jobs
       const allJobs = [...clientJobs, ...freelancerJobs]
@@ -67,8 +67,8 @@ export default function Jobs() {
           },
         }
       )
-      setJobs(response.data)
-      setFilteredJobs(response.data)
+      setJobs(response.data.jobs)
+      setFilteredJobs(response.data.jobs)
     } catch (error: any) {
       console.error('Error fetching jobs:', error)
       if (error.code === 'ECONNREFUSED' || error.message?.includes('Network Error') || !error.response) {
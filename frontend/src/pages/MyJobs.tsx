@@ -49,13 +49,16 @@ export default function MyJobs() {
   const [jobToDelete, setJobToDelete] = useState<{ id: string; title: string } | null>(null)
   const [deleting, setDeleting] = useState(false)
   const [currentPage, setCurrentPage] = useState(1)
-  const [pagination, setPagination] = useState({
-    page: 1,
+  // Cursor each page was fetched with (pageCursors[0] is the first page), so Previous can go back
+  const [pageCursors, setPageCursors] = useState<(string | null)[]>([null])
+  const [pagination, setPagination] = useState<{
+    limit: number
+    total: number
+    next_cursor: string | null
+  }>({
     limit: 10,
     total: 0,
-    total_pages: 1,
-    has_next: false,
-    has_prev: false
+    next_cursor: null
   })
 
   // Lock background scroll and hide footer when modal is open
@@ -108,34 +111,20 @@ export default function MyJobs() {
         `${config.apiUrl}/api/v1/jobs/client/${address}`,
         {
           params: {
-            page: currentPage,
-            limit: 10
+            limit: 10,
+            cursor: pageCursors[currentPage - 1] || undefined,
+            include_total: true
           }
         }
       )
       
-      // Handle both old format (array) and new format (object with pagination)
-      if (Array.isArray(response.data)) {
-        setJobs(response.data)
-        setPagination({
-          page: 1,
-          limit: 10,
-          total: response.data.length,
-          total_pages: 1,
-          has_next: false,
-          has_prev: false
-        })
-      } else {
-        setJobs(response.data.jobs || [])
-        setPagination(response.data.pagination || {
-          page: 1,
-          limit: 10,
-          total: 0,
-          total_pages: 1,
-          has_next: false,
-          has_prev: false
-        })
-      }
+      const pageJobs: Job[] = response.data.jobs || []
+      setJobs(pageJobs)
+      setPagination({
+        limit: 10,
+        total: response.data.total ?? pageJobs.length,
+        next_cursor: response.data.next_cursor || null
+      })
     } catch (error: any) {
       console.error('Error fetching jobs:', error)
       if (error.code === 'ECONNREFUSED' || error.message?.includes('Network Error') || !error.response) {
@@ -148,6 +137,17 @@ export default function MyJobs() {
     }
   }
 
+  const goToNextPage = () => {
+    if (!pagination.next_cursor) return
+    // Pages are fetched by cursor, so the next page can only be reached from this one
+    setPageCursors(prev => [...prev.slice(0, currentPage), pagination.next_cursor])
+    setCurrentPage(prev => prev + 1)
+  }
+
+  const goToPreviousPage = () => {
+    setCurrentPage(prev => Math.max(1, prev - 1))
+  }
+
   const openDeleteModal = (jobId: string, jobTitle: string) => {
     setJobToDelete({ id: jobId, title: jobTitle })
     setDeleteModalOpen(true)
@@ -183,7 +183,7 @@ export default function MyJobs() {
       
       // If current page becomes empty and not on first page, go to previous page
       if (jobs.length === 1 && currentPage > 1) {
-        setCurrentPage(prev => Math.max(1, prev - 1))
+        goToPreviousPage()
       }
     } catch (error: any) {
       console.error('Error deleting job:', error)
@@ -231,7 +231,7 @@ export default function MyJobs() {
 
   // Stats are calculated from all jobs (not just current page)
   // For accurate stats, we'd need a separate endpoint, but for now use current page data
-  // Note: These stats are approximate when using pagination
+  // Note: These stats are approximate when using pagination (the total is approximate too)
   const stats = {
     total: pagination.total || jobs.length,
     open: jobs.filter(j => j.status.toLowerCase() === 'open').length,
@@ -466,17 +466,17 @@ export default function MyJobs() {
           )}
 
           {/* Pagination */}
-          {!loading && filteredJobs.length > 0 && pagination.total_pages > 1 && (
+          {!loading && filteredJobs.length > 0 && (currentPage > 1 || pagination.next_cursor) && (
             <div className="mt-8 flex items-center justify-between">
               <div className="text-sm text-[#1D1616] font-bold">
-                Showing {((currentPage - 1) * pagination.limit) + 1} to {Math.min(currentPage * pagination.limit, pagination.total)} of {pagination.total} jobs
+                Page {currentPage} of about {Math.max(currentPage, Math.ceil(pagination.total / pagination.limit))} ({pagination.total} jobs)
               </div>
               <div className="flex items-center gap-2">
                 <button
-                  onClick={() => setCurrentPage(prev => Math.max(1, prev - 1))}
-                  disabled={!pagination.has_prev || loading}
+                  onClick={goToPreviousPage}
+                  disabled={currentPage === 1 || loading}
                   className={`px-4 py-2 rounded-2xl text-sm font-bold border-2 transition-all flex items-center gap-2 ${
-                    pagination.has_prev
+                    currentPage > 1
                       ? 'bg-white text-[#1D1616] border-[#1D1616] hover:bg-[#EEEEEE] hover:scale-105'
                       : 'bg-[#EEEEEE] text-gray-400 border-gray-300 cursor-not-allowed'
                   }`}
@@ -484,38 +484,11 @@ export default function MyJobs() {
                   <ChevronLeftIcon className="h-5 w-5" />
                   Previous
                 </button>
-                <div className="flex items-center gap-1">
-                  {Array.from({ length: Math.min(5, pagination.total_pages) }, (_, i) => {
-                    let pageNum: number
-                    if (pagination.total_pages <= 5) {
-                      pageNum = i + 1
-                    } else if (currentPage <= 3) {
-                      pageNum = i + 1
-                    } else if (currentPage >= pagination.total_pages - 2) {
-                      pageNum = pagination.total_pages - 4 + i
-                    } else {
-                      pageNum = currentPage - 2 + i
-                    }
-                    return (
-                      <button
-                        key={pageNum}
-                        onClick={() => setCurrentPage(pageNum)}
-                        className={`px-4 py-2 rounded-2xl text-sm font-bold border-2 transition-all ${
-                          currentPage === pageNum
-                            ? 'bg-[#1D1616] text-white border-[#1D1616]'
-                            : 'bg-white text-[#1D1616] border-[#1D1616] hover:bg-[#EEEEEE] hover:scale-105'
-                        }`}
-                      >
-                        {pageNum}
-                      </button>
-                    )
-                  })}
-                </div>
                 <button
-                  onClick={() => setCurrentPage(prev => Math.min(pagination.total_pages, prev + 1))}
-                  disabled={!pagination.has_next || loading}
+                  onClick={goToNextPage}
+                  disabled={!pagination.next_cursor || loading}
                   className={`px-4 py-2 rounded-2xl text-sm font-bold border-2 transition-all flex items-center gap-2 ${
-                    pagination.has_next
+                    pagination.next_cursor
                       ? 'bg-white text-[#1D1616] border-[#1D1616] hover:bg-[#EEEEEE] hover:scale-105'
                       : 'bg-[#EEEEEE] text-gray-400 border-gray-300 cursor-not-allowed'
                   }`}
@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 """
-Test script for IPFS and Blockchain integration
+Test script for IPFS, Blockchain, PostgreSQL search and job listing integration
 """
 
 import sys
 import os
 import json
+import uuid
+import asyncio
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Add backend to path
@@ -106,6 +109,228 @@ def test_blockchain():
         traceback.print_exc()
         return False
 
+def test_postgres_search():
+    """Test the PostgreSQL search backend against jobs written to the database"""
+    print("🧪 Testing PostgreSQL search backend...")
+    try:
+        from app.database import SessionLocal, Job, User
+        from app.services.search_postgres import PostgresSearchBackend
+        
+        # A made-up word and category keep the test jobs apart from real ones
+        marker = f"zq{uuid.uuid4().hex[:8]}"
+        category = f"Category {marker}"
+        client = f"0x{uuid.uuid4().hex}{uuid.uuid4().hex[:8]}"
+        now = datetime.now(timezone.utc)
+        specs = [
+            ("developer", [f"{marker}web", f"{marker}api"], 100.0, "open"),
+            ("designer", [f"{marker}web"], 300.0, "open"),
+            ("auditor", [f"{marker}web", f"{marker}api"], 200.0, "completed"),
+        ]
+        
+        db = SessionLocal()
+        try:
+            db.add(User(wallet_address=client, username=f"search test {marker}"))
+            jobs = [
+                Job(
+                    id=str(uuid.uuid4()), client_address=client, title=f"{marker} {role}",
+                    description="Search backend test job", category=category, skills_required=["python"],
+                    tags=tags, budget=budget, deadline=now + timedelta(days=7), status=status,
+                )
+                for role, tags, budget, status in specs
+            ]
+            db.add_all(jobs)
+            db.commit()
+            ids = [job.id for job in jobs]
+            
+            backend = PostgresSearchBackend(cache_ttl=0)
+            page = backend.search_jobs_page(query=marker, sort="budget_desc")
+            if page["job_ids"] != [ids[1], ids[2], ids[0]]:
+                print(f"❌ Budget-sorted search returned {page}")
+                return False
+            page = backend.search_jobs_page(query=marker, tags=[f"{marker}api"], status="open")
+            if page["job_ids"] != [ids[0]]:
+                print(f"❌ Filtered search returned {page}")
+                return False
+            print("✅ Searches filtered and sorted")
+            
+            facets = backend.facets(query=marker, status="open")
+            # Only the most popular tags of the whole database are counted
+            tag_counts = {f"{marker}web": 2, f"{marker}api": 1}
+            expected = {
+                "total": 2,
+                "tags": {tag: count for tag, count in tag_counts.items() if tag in facets["tags"]},
+                "categories": {category.lower(): 2},
+                "statuses": {"open": 2, "completed": 1},
+            }
+            if facets != expected:
+                print(f"❌ Facets returned {facets}")
+                return False
+            print("✅ Facets counted each dimension without its own filter")
+            
+            suggestions = backend.suggest(marker[:6], 3)
+            if suggestions[0] != {"text": marker, "type": "word", "count": 3} or \
+                    {"text": f"{marker}web", "type": "tag", "count": 3} not in suggestions:
+                print(f"❌ Suggestions returned {suggestions}")
+                return False
+            tags = backend.popular_tags(prefix=marker, limit=1)
+            if tags != {"tags": [{"tag": f"{marker}web", "count": 3}], "total": 2}:
+                print(f"❌ Popular tags returned {tags}")
+                return False
+            print("✅ Suggestions and tag counts aggregated from the jobs table")
+            return True
+        finally:
+            db.rollback()
+            db.query(Job).filter(Job.client_address == client).delete()
+            db.query(User).filter(User.wallet_address == client).delete()
+            db.commit()
+            db.close()
+    
+    except Exception as e:
+        print(f"❌ PostgreSQL search test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_keyset_listing():
+    """Test cursor paging of the job listings against jobs written to the database"""
+    print("🧪 Testing keyset job listing...")
+    try:
+        from app.database import SessionLocal, AsyncSessionLocal, async_engine, Job, User
+        from app.services.job_listing import JobListingService
+        
+        client = f"0x{uuid.uuid4().hex}{uuid.uuid4().hex[:8]}"
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        
+        db = SessionLocal()
+        try:
+            db.add(User(wallet_address=client, username=f"listing test {client[2:10]}"))
+            # Pairs of jobs share a created_at, so pages also split ties (broken by id)
+            jobs = [
+                Job(
+                    id=str(uuid.uuid4()), client_address=client, title=f"Listing test job {i}",
+                    description="Keyset listing test job", category="Testing", skills_required=[],
+                    tags=[], budget=1.0, deadline=start + timedelta(days=30), status="open",
+                    created_at=start + timedelta(minutes=i // 2),
+                )
+                for i in range(9)
+            ]
+            db.add_all(jobs)
+            db.commit()
+            expected = [job.id for job in sorted(jobs, key=lambda job: (job.created_at, job.id), reverse=True)]
+            
+            listing = JobListingService(cache_prefix=f"test:{uuid.uuid4().hex}:jobs:count:")
+            filters = {"client_address": client}
+            
+            async def walk(newer=None):
+                """Page through the client's jobs two at a time, adding a newer job after the first page"""
+                seen, cursor = [], None
+                async with AsyncSessionLocal() as session:
+                    for _ in range(len(jobs) + 1):
+                        rows, cursor = await listing.page(session, filters, 2, cursor)
+                        seen.extend(row.id for row in rows)
+                        if newer is not None:
+                            db.add(newer)
+                            db.commit()
+                            newer = None
+                        if not cursor:
+                            break
+                    total = await listing.approximate_total(session, filters)
+                await async_engine.dispose()
+                return seen, total
+            
+            # A job created while paging belongs before the cursor, so it is neither
+            # returned nor allowed to shift the remaining pages
+            newer = Job(
+                id=str(uuid.uuid4()), client_address=client, title="Listing test job created while paging",
+                description="Keyset listing test job", category="Testing", skills_required=[],
+                tags=[], budget=1.0, deadline=start + timedelta(days=30), status="open",
+                created_at=start + timedelta(days=1),
+            )
+            seen, total = asyncio.run(walk(newer))
+            if seen != expected:
+                print(f"❌ Paging returned {len(seen)} jobs ({len(set(seen))} distinct), expected {len(expected)}")
+                return False
+            if total != len(jobs) + 1:
+                print(f"❌ Approximate total returned {total}, expected {len(jobs) + 1}")
+                return False
+            print("✅ Listing paged newest first without gaps or repeats")
+            
+            async def malformed():
+                async with AsyncSessionLocal() as session:
+                    await listing.page(session, filters, 2, "not-a-cursor")
+            
+            try:
+                asyncio.run(malformed())
+                print("❌ Malformed cursor accepted")
+                return False
+            except ValueError:
+                pass
+            print("✅ Malformed cursor rejected")
+            return True
+        finally:
+            db.rollback()
+            db.query(Job).filter(Job.client_address == client).delete()
+            db.query(User).filter(User.wallet_address == client).delete()
+            db.commit()
+            db.close()
+    
+    except Exception as e:
+        print(f"❌ Keyset listing test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_job_rendering():
+    """Test that listings rendered with orjson match the JobListResponse body"""
+    print("🧪 Testing job listing rendering...")
+    try:
+        from types import SimpleNamespace
+        from app.database import Job
+        from app.models import JobResponse, JobListResponse
+        from app.services.job_listing import render_job_page, JOB_RESPONSE_COLUMNS
+        
+        created = datetime(2025, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        full = dict(
+            id=str(uuid.uuid4()), client_address="0x" + "a" * 40, freelancer_address="0x" + "b" * 40,
+            title="Rendered job", description="Émoji 🚀 and \"quotes\"", category="Design",
+            skills_required=["figma"], tags=["ui", "ux"], budget=2.5,
+            deadline=created.astimezone(timezone(timedelta(hours=2))), status="in_progress",
+            ipfs_hash="QmHash", blockchain_job_id=7, deliverable_url="https://example.com/work",
+            client_confirmed_completion=True, freelancer_confirmed_completion=False,
+            escrow_address="0x" + "c" * 40, allow_escrow_revert=True,
+            created_at=created, updated_at=created + timedelta(seconds=1), proposal_count=3,
+        )
+        # Every nullable column NULL, as in rows written before the columns had defaults
+        sparse = dict(
+            full, id=str(uuid.uuid4()), freelancer_address=None, skills_required=None, tags=None, budget=100.0,
+            status="open", ipfs_hash=None, blockchain_job_id=None, deliverable_url=None,
+            client_confirmed_completion=None, freelancer_confirmed_completion=None, escrow_address=None,
+            allow_escrow_revert=None, created_at=created.replace(microsecond=0), proposal_count=None,
+        )
+        
+        jobs = [Job(**fields) for fields in (full, sparse)]
+        rows = [
+            SimpleNamespace(_mapping={column.key: getattr(job, column.key) for column in JOB_RESPONSE_COLUMNS})
+            for job in jobs
+        ]
+        for next_cursor, total in ((None, None), ("next-page", 2)):
+            rendered = render_job_page(rows, next_cursor, total).body.decode()
+            expected = JobListResponse(
+                jobs=[JobResponse.model_validate(job) for job in jobs], next_cursor=next_cursor, total=total
+            ).model_dump_json()
+            if json.loads(rendered) != json.loads(expected):
+                print(f"❌ Rendered listing differs:\n   {rendered}\n   {expected}")
+                return False
+        
+        print("✅ orjson listing matched the JobListResponse body")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Job rendering test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
 def main():
     print("=" * 60)
     print("🚀 Integration Test Suite")
@@ -120,15 +345,27 @@ def main():
     # Test Blockchain
     blockchain_ok = test_blockchain()
     
+    # Test PostgreSQL search
+    postgres_ok = test_postgres_search()
+    
+    # Test job listing paging
+    listing_ok = test_keyset_listing()
+    
+    # Test job listing rendering
+    rendering_ok = test_job_rendering()
+    
     # Summary
     print("\n" + "=" * 60)
     print("📊 Test Results Summary")
     print("=" * 60)
     print(f"IPFS:       {'✅ PASS' if ipfs_ok else '❌ FAIL'}")
     print(f"Blockchain: {'✅ PASS' if blockchain_ok else '❌ FAIL'}")
+    print(f"PG search:  {'✅ PASS' if postgres_ok else '❌ FAIL'}")
+    print(f"Listing:    {'✅ PASS' if listing_ok else '❌ FAIL'}")
+    print(f"Rendering:  {'✅ PASS' if rendering_ok else '❌ FAIL'}")
     print("=" * 60)
     
-    if ipfs_ok and blockchain_ok:
+    if ipfs_ok and blockchain_ok and postgres_ok and listing_ok and rendering_ok:
         print("🎉 All tests passed!")
         return 0
     else:
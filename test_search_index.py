@@ -0,0 +1,972 @@
+#!/usr/bin/env python3
+"""
+Test script for the Redis search index
+
+Runs against the Redis server configured for the backend (REDIS_HOST,
+REDIS_PORT, REDIS_DB). Every test builds its own index under a throwaway key
+namespace and deletes it afterwards, so it is safe to run next to a live index.
+"""
+
+import sys
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend to path
+backend_path = Path(__file__).parent / "backend"
+sys.path.insert(0, str(backend_path))
+
+from app.services.search_base import tokenize
+
+CREATED_AT = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_job(title, skills=(), tags=(), category="Web Development", status="open", minutes=0):
+    """Search document shaped like job_to_document output"""
+    return {
+        'id': str(uuid.uuid4()),
+        'client_address': "0x0000000000000000000000000000000000000001",
+        'freelancer_address': None,
+        'title': title,
+        'description': f"{title} for our team",
+        'category': category,
+        'skills_required': list(skills),
+        'tags': list(tags),
+        'budget': 1.0,
+        'deadline': (CREATED_AT + timedelta(days=30)).isoformat(),
+        'status': status,
+        'ipfs_hash': None,
+        'blockchain_job_id': None,
+        'deliverable_url': None,
+        'client_confirmed_completion': False,
+        'freelancer_confirmed_completion': False,
+        'escrow_address': None,
+        'allow_escrow_revert': False,
+        'created_at': (CREATED_AT + timedelta(minutes=minutes)).isoformat(),
+        'updated_at': (CREATED_AT + timedelta(minutes=minutes)).isoformat(),
+        'proposal_count': 0,
+    }
+
+
+def index(service, jobs):
+    service.index_jobs((job['id'], job) for job in jobs)
+    return jobs
+
+
+def test_suggest_popularity(service):
+    """A popular completion wins even when hundreds of rarer ones sort before it"""
+    print("🧪 Testing autocomplete ranking...")
+    try:
+        # 300 one-off words starting with "pa", all alphabetically before "python"
+        rare = [f"pa{a}{b}{c}" for a in "abcdefghij" for b in "abcde" for c in "abcdef"]
+        index(service, [make_job(f"{word} task") for word in rare])
+        popular = index(service, [make_job("python scraper", skills=["python"]) for _ in range(5)])
+        
+        for prefix in ("p", "py", "pyth", "pytho"):
+            suggestions = service.suggest(prefix, 3)
+            if not suggestions or suggestions[0] != {"text": "python", "type": "word", "count": 5}:
+                print(f"❌ suggest({prefix!r}) returned {suggestions}")
+                return False
+        
+        # Counts follow deletions and edits
+        service.delete_job(popular[0]['id'])
+        service.reindex_job(popular[1]['id'], dict(popular[1], title="rust scraper", skills_required=["rust"]))
+        for prefix in ("py", "pytho"):
+            suggestions = service.suggest(prefix, 1)
+            if suggestions != [{"text": "python", "type": "word", "count": 3}]:
+                print(f"❌ suggest({prefix!r}) after changes returned {suggestions}")
+                return False
+        
+        # A word no job contains any more is no longer suggested for a long prefix
+        # and leaves the lexicographic entry set
+        service.delete_job(service.search_jobs_page(query="paaaa")["job_ids"][0])
+        suggestions = service.suggest("paaaa", 3)
+        if suggestions or service.redis.zscore(service.suggest_lex_key, "paaaa|word") is not None:
+            print(f"❌ suggest('paaaa') after deletion returned {suggestions}")
+            return False
+        
+        print("✅ Popular completions ranked first for every prefix length")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Autocomplete test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+class SteppedPipeline:
+    """Non-transactional pipeline that sends its commands one by one, calling between() after each"""
+    
+    def __init__(self, client, between):
+        self.client = client
+        self.between = between
+        self.commands = []
+    
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+    
+    def execute(self):
+        results = []
+        for name, args, kwargs in self.commands:
+            results.append(getattr(self.client, name)(*args, **kwargs))
+            self.between()
+        self.commands = []
+        return results
+
+
+class SteppedRedis:
+    """Redis client whose non-transactional pipelines are SteppedPipelines"""
+    
+    def __init__(self, client, between):
+        self.client = client
+        self.between = between
+    
+    def pipeline(self, transaction=True):
+        if transaction:
+            return self.client.pipeline(transaction=transaction)
+        return SteppedPipeline(self.client, self.between)
+    
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+
+def missing_postings(service, job_id):
+    """Posting keys in a job's reverse index that do not contain the job"""
+    missing = []
+    for key in service.redis.smembers(service._postings_key(job_id)):
+        if key.startswith(service._suggestion_marker("")):
+            continue
+        if service._is_sorted_key(key):
+            present = service.redis.zscore(key, job_id) is not None
+        else:
+            present = service.redis.sismember(key, job_id)
+        if not present:
+            missing.append(key)
+    return missing
+
+
+def test_popular_tags(service):
+    """Tag prefix pages are ordered by popularity and follow deletions, in both engines"""
+    print("🧪 Testing popular tags...")
+    from app.services.search_memory import MemorySearchService
+    try:
+        memory = MemorySearchService()
+        jobs = [
+            make_job("frontend work", tags=["react", "redux"]),
+            make_job("frontend work", tags=["react", "rust"]),
+            make_job("frontend work", tags=["react", "rust", "python"]),
+        ]
+        for engine in (service, memory):
+            index(engine, jobs)
+        
+        expected = [{"tag": "react", "count": 3}, {"tag": "rust", "count": 2}, {"tag": "redux", "count": 1}]
+        for engine in (service, memory):
+            pages = [engine.popular_tags("r", offset, 2) for offset in (0, 2)]
+            if [page["total"] for page in pages] != [3, 3] or pages[0]["tags"] + pages[1]["tags"] != expected:
+                print(f"❌ {engine.name} popular_tags('r') returned {pages}")
+                return False
+        
+        for engine in (service, memory):
+            engine.delete_job(jobs[0]['id'])
+            page = engine.popular_tags("re")
+            if page != {"tags": [{"tag": "react", "count": 2}], "total": 1}:
+                print(f"❌ {engine.name} popular_tags('re') after deletion returned {page}")
+                return False
+        if service.redis.zscore(service.tag_lex_key, "redux") is not None:
+            print("❌ Deleted tag left in the lexicographic tag set")
+            return False
+        
+        print("✅ Tag prefixes paged by popularity in both engines")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Popular tags test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_long_terms(service):
+    """Terms longer than the indexed prefixes match every word they start, in both engines"""
+    print("🧪 Testing long query terms...")
+    from app.services.search_memory import MemorySearchService
+    try:
+        memory = MemorySearchService()
+        developer, development, solidity, blockchain = jobs = [
+            make_job("react developer", category="Consulting", minutes=1),
+            make_job("software development lead", category="Consulting", minutes=2),
+            make_job("solidity auditor", category="Consulting", minutes=3),
+            make_job("blockchain engineer", skills=["solidity"], category="Consulting", minutes=4),
+        ]
+        for engine in (service, memory):
+            index(engine, jobs)
+        
+        searches = {
+            "develop": {developer['id'], development['id']},
+            "developer": {developer['id']},
+            "solid": {solidity['id'], blockchain['id']},
+            "blockch engineer": {blockchain['id']},
+        }
+        for query, expected in searches.items():
+            for engine in (service, memory):
+                for sort in (None, "relevance"):
+                    page = engine.search_jobs_page(query=query, sort=sort)
+                    if set(page["job_ids"]) != expected or page["corrections"]:
+                        print(f"❌ {engine.name} search {query!r} (sort={sort}) returned {page}")
+                        return False
+        
+        # A vocabulary word no job contains any more matches nothing and is dropped
+        service.delete_job(blockchain['id'])
+        page = service.search_jobs_page(query="blockch", fuzzy=False)
+        if page["job_ids"] or service.redis.zscore(service.vocabulary_key, "blockchain") is not None:
+            print(f"❌ Search 'blockch' after deletion returned {page}")
+            return False
+        
+        print("✅ Long terms matched every word they start")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Long term test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_fuzzy_correction(service):
+    """Misspelled terms are corrected to the closest word some job still contains"""
+    print("🧪 Testing fuzzy correction...")
+    try:
+        kotlin, kotlins = index(service, [make_job("kotlin developer"), make_job("kotlins tutor")])
+        
+        # "kotlin" also starts "kotlins", so the corrected search finds both
+        page = service.search_jobs_page(query="kotlni")
+        if page["corrections"] != {"kotlni": "kotlin"} or set(page["job_ids"]) != {kotlin['id'], kotlins['id']}:
+            print(f"❌ Search 'kotlni' returned {page}")
+            return False
+        
+        # Once no job contains "kotlin", the next closest word wins, and
+        # compaction drops it from the trigram index
+        service.delete_job(kotlin['id'])
+        page = service.search_jobs_page(query="kotlni")
+        if page["corrections"] != {"kotlni": "kotlins"} or page["job_ids"] != [kotlins['id']]:
+            print(f"❌ Search 'kotlni' after deletion returned {page}")
+            return False
+        
+        service.compact_index()
+        holders = {word for key in service.redis.scan_iter(match=service._trigram_key("*")) for word in service.redis.smembers(key)}
+        if "kotlin" in holders or "kotlins" not in holders:
+            print(f"❌ Trigram index after compaction holds {sorted(holders)}")
+            return False
+        
+        print("✅ Corrections only pointed at words still indexed")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Fuzzy correction test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_relevance_ranking(service):
+    """Relevance search orders matches by the field they match in, in both engines"""
+    print("🧪 Testing relevance ranking...")
+    from app.services.search_memory import MemorySearchService
+    try:
+        memory = MemorySearchService()
+        # Newest first would be the reverse of the expected relevance order
+        in_title, in_skills, in_description, _ = jobs = [
+            dict(make_job("solidity auditor", minutes=1), description="contract review"),
+            dict(make_job("contract auditor", skills=["solidity"], minutes=2), description="contract review"),
+            dict(make_job("contract auditor", minutes=3), description="solidity contract review"),
+            make_job("frontend developer", minutes=4),
+        ]
+        for engine in (service, memory):
+            index(engine, jobs)
+        
+        searches = {
+            "solidity": [in_title['id'], in_skills['id'], in_description['id']],
+            # Every match has "auditor" in its title, so "solidity" decides the order
+            "auditor solidity": [in_title['id'], in_skills['id'], in_description['id']],
+        }
+        for query, expected in searches.items():
+            for engine in (service, memory):
+                ranked = engine.search_jobs_page(query=query, sort="relevance")["job_ids"]
+                first = engine.search_jobs_page(query=query, sort="relevance", limit=2)
+                rest = engine.search_jobs_page(query=query, sort="relevance", limit=2, offset=2)
+                if ranked != expected or first["job_ids"] + rest["job_ids"] != expected:
+                    print(f"❌ {engine.name} relevance search {query!r} returned {ranked}, "
+                          f"paged {first['job_ids'] + rest['job_ids']}")
+                    return False
+        
+        print("✅ Title matches ranked above skills and description matches")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Relevance ranking test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_facets(service):
+    """Facet counts apply every filter but their own, match in both engines and follow writes"""
+    print("🧪 Testing facet counts...")
+    from collections import Counter
+    from app.services.search_memory import MemorySearchService
+    try:
+        memory = MemorySearchService()
+        jobs = [
+            make_job("react developer", tags=["Frontend", "remote"]),
+            make_job("react native developer", tags=["frontend"], category="Mobile Development"),
+            make_job("rust developer", tags=["backend", "remote"], status="completed"),
+            make_job("solidity auditor", tags=["security", "remote"], category="Blockchain"),
+            make_job("logo designer", tags=["design"], category="Design", status="in_progress"),
+        ]
+        for engine in (service, memory):
+            index(engine, jobs)
+        
+        def expected(query=None, tags=None, category=None, status=None):
+            """Facet counts computed job by job"""
+            terms = tokenize(query or '')
+            wanted_tags = {tag.lower() for tag in tags or []}
+            
+            def matches(job, skip):
+                words = set(tokenize(f"{job['title']} {job['description']} {job['category']} {' '.join(job['tags'])}"))
+                job_tags = {tag.lower() for tag in job['tags']}
+                return (all(any(word.startswith(term) for word in words) for term in terms)
+                        and (skip == "tags" or not wanted_tags or bool(job_tags & wanted_tags))
+                        and (skip == "category" or not category or job['category'].lower() == category.lower())
+                        and (skip == "status" or not status or job['status'] == status))
+            
+            return {
+                "total": sum(matches(job, None) for job in jobs),
+                "tags": dict(Counter(tag.lower() for job in jobs if matches(job, "tags") for tag in job['tags'])),
+                "categories": dict(Counter(job['category'].lower() for job in jobs if matches(job, "category"))),
+                "statuses": dict(Counter(job['status'] for job in jobs if matches(job, "status"))),
+            }
+        
+        searches = [
+            {},
+            {"query": "developer"},
+            {"tags": ["remote"]},
+            {"tags": ["remote", "design"], "status": "open"},
+            {"query": "react", "category": "Mobile Development"},
+        ]
+        for filters in searches:
+            for engine in (service, memory):
+                counts = engine.facets(**filters)
+                if counts != expected(**filters):
+                    print(f"❌ {engine.name} facets {filters} returned {counts}, expected {expected(**filters)}")
+                    return False
+        
+        # Cached counts are replaced once the index changes
+        service.facets(tags=["remote"])
+        jobs.append(index(service, [make_job("go developer", tags=["remote"], status="completed")])[0])
+        if service.facets(tags=["remote"]) != expected(tags=["remote"]):
+            print(f"❌ Stale facets after indexing: {service.facets(tags=['remote'])}")
+            return False
+        
+        print("✅ Facet counts matched a job-by-job count in both engines")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Facet test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_engine_parity(service):
+    """The in-memory engine returns the same pages as Redis, before and after edits"""
+    print("🧪 Testing in-memory engine parity...")
+    import random
+    from app.services.search_memory import MemorySearchService
+    try:
+        memory = MemorySearchService()
+        rng = random.Random(14)
+        words = ["react", "rust", "solidity", "python", "design", "auditor", "developer", "senior", "contract", "mobile"]
+        tags = ["frontend", "backend", "remote", "security", "urgent"]
+        categories = ["Web Development", "Blockchain", "Design"]
+        statuses = ["open", "in_progress", "completed"]
+        jobs = [
+            dict(make_job(" ".join(rng.sample(words, 3)), skills=rng.sample(words, 2), tags=rng.sample(tags, 2),
+                          category=rng.choice(categories), status=rng.choice(statuses), minutes=i),
+                 budget=float(rng.randint(1, 9)))
+            for i in range(80)
+        ]
+        for engine in (service, memory):
+            index(engine, jobs)
+        
+        searches = [
+            {},
+            {"query": "react"},
+            {"query": "solid dev"},
+            {"query": "python developer", "sort": "relevance"},
+            {"tags": ["remote", "urgent"], "status": "open"},
+            {"category": "Blockchain", "sort": "budget_desc"},
+            {"query": "senior", "min_budget": 3, "max_budget": 6, "sort": "budget_asc"},
+        ]
+        
+        def page_all(engine, filters):
+            seen, cursor, offset = [], None, 0
+            for _ in range(len(jobs)):
+                page = engine.search_jobs_page(limit=9, cursor=cursor, offset=offset, **filters)
+                seen.extend(page["job_ids"])
+                if filters.get("sort") == "relevance":
+                    offset += 9
+                    if len(page["job_ids"]) < 9:
+                        break
+                else:
+                    cursor = page["next_cursor"]
+                    if not cursor:
+                        break
+            return seen
+        
+        def compare(stage, ranked_order=True):
+            for filters in searches:
+                expected, found = page_all(service, filters), page_all(memory, filters)
+                if not ranked_order and filters.get("sort") == "relevance":
+                    expected, found = sorted(expected), sorted(found)
+                if found != expected or not expected:
+                    print(f"❌ {stage}: memory engine returned {len(found)} jobs for {filters}, Redis {len(expected)}")
+                    return False
+            return True
+        
+        if not compare("after indexing"):
+            return False
+        
+        for job in jobs[::4]:
+            for engine in (service, memory):
+                engine.delete_job(job['id'])
+        for job in jobs[1::4]:
+            edited = dict(job, title=f"{job['title']} react", tags=["remote"], status="open", budget=job['budget'] + 1)
+            for engine in (service, memory):
+                engine.reindex_job(job['id'], edited)
+        # Redis keeps the length normalisation each job was scored with when it
+        # was written, the memory engine uses the current average length, so
+        # relevance orders may differ once jobs are edited
+        if not compare("after edits", ranked_order=False):
+            return False
+        
+        usage = memory.memory_usage()
+        if usage["jobs"] != 60 or usage["bytes_per_job"] <= 0:
+            print(f"❌ Memory usage reported {usage}")
+            return False
+        
+        print(f"✅ Both engines returned the same pages ({usage['bytes_per_job']:.0f} bytes per job in memory)")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Engine parity test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_compaction_during_indexing(service):
+    """Compaction running between any two index writes keeps the job's postings"""
+    print("🧪 Testing compaction interleaved with indexing...")
+    try:
+        index(service, [make_job("existing listing", tags=["design"])])
+        
+        # Index writes of a second service are sent one command at a time,
+        # with a full compaction pass after every command
+        stepped = SteppedRedis(service.redis, service.compact_index)
+        
+        class SteppedSearchService(type(service)):
+            redis = property(lambda self: stepped)
+        
+        writer = SteppedSearchService(namespace=service.namespace)
+        job = make_job("solidity auditor", skills=["solidity"], tags=["security"], minutes=5)
+        edited = dict(job, title="solidity auditor wanted", tags=["security", "audit"], status="in_progress")
+        for version in (job, edited):
+            index(writer, [version])
+            missing = missing_postings(service, job['id'])
+            if missing:
+                print(f"❌ Postings lost to compaction: {sorted(missing)}")
+                return False
+        
+        for filters in ({"query": "auditor"}, {"tags": ["audit"]}, {"status": "in_progress"}, {}):
+            job_ids = service.search_jobs_page(**filters)["job_ids"]
+            if job['id'] not in job_ids:
+                print(f"❌ Job missing from search {filters}: {job_ids}")
+                return False
+        
+        print("✅ Every posting survived compaction between index writes")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Compaction interleaving test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_filtered_paging(service):
+    """Filtered searches page newest first to the end with a cursor, without gaps or repeats"""
+    print("🧪 Testing filtered search paging...")
+    try:
+        # Pairs of jobs share a created_at, so pages also split ties
+        jobs = index(service, [
+            make_job(f"react developer {i}", tags=["frontend"] if i % 3 else ["backend"],
+                     status="open" if i % 4 else "completed", minutes=i // 2)
+            for i in range(40)
+        ])
+        
+        for filters in ({"status": "open"}, {"tags": ["frontend"], "status": "open"}, {"query": "react developer"}):
+            expected = [
+                job['id'] for job in sorted(jobs, key=lambda job: (job['created_at'], job['id']), reverse=True)
+                if (filters.get("status") in (None, job['status']))
+                and (not filters.get("tags") or any(tag in job['tags'] for tag in filters["tags"]))
+            ]
+            seen, cursor = [], None
+            for _ in range(len(jobs)):
+                page = service.search_jobs_page(limit=7, cursor=cursor, **filters)
+                seen.extend(page["job_ids"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    break
+            if seen != expected:
+                print(f"❌ Paging {filters} returned {len(seen)} jobs ({len(set(seen))} distinct), expected {len(expected)}")
+                return False
+        
+        print("✅ Filtered searches paged to the end in a stable order")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Filtered paging test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_range_filters(service):
+    """Budget and deadline ranges are inclusive and attribute sorts page to the end, in both engines"""
+    print("🧪 Testing range filters and attribute sorts...")
+    from app.services.search_memory import MemorySearchService
+    try:
+        memory = MemorySearchService()
+        # Budgets repeat, so pages also split ties
+        jobs = [
+            dict(make_job(f"react developer {i}", status="open" if i % 5 else "completed", minutes=i),
+                 budget=float(i % 6), deadline=(CREATED_AT + timedelta(days=i % 9)).isoformat())
+            for i in range(30)
+        ]
+        for engine in (service, memory):
+            index(engine, jobs)
+        
+        searches = [
+            {"min_budget": 2, "max_budget": 4},
+            {"max_budget": 0, "sort": "budget_desc"},
+            {"min_budget": 3, "status": "open", "sort": "budget_asc"},
+            {"deadline_after": CREATED_AT + timedelta(days=2), "deadline_before": CREATED_AT + timedelta(days=5),
+             "sort": "deadline_asc"},
+            {"query": "react", "deadline_before": CREATED_AT + timedelta(days=3), "sort": "deadline_desc"},
+            {"min_budget": 1, "deadline_after": CREATED_AT + timedelta(days=8), "sort": "budget_desc"},
+        ]
+        
+        def expected(filters):
+            """Matching job IDs in sort order, computed job by job"""
+            def value(job, attribute):
+                return job['budget'] if attribute == "budget" else datetime.fromisoformat(job['deadline'])
+            
+            matching = [
+                job for job in jobs
+                if (filters.get("min_budget") is None or job['budget'] >= filters["min_budget"])
+                and (filters.get("max_budget") is None or job['budget'] <= filters["max_budget"])
+                and (filters.get("deadline_after") is None or value(job, "deadline") >= filters["deadline_after"])
+                and (filters.get("deadline_before") is None or value(job, "deadline") <= filters["deadline_before"])
+                and filters.get("status") in (None, job['status'])
+            ]
+            if "sort" not in filters:
+                return [job['id'] for job in sorted(matching, key=lambda job: (job['created_at'], job['id']), reverse=True)]
+            attribute, ascending = filters["sort"].split("_")[0], filters["sort"].endswith("_asc")
+            ordered = sorted(matching, key=lambda job: (value(job, attribute), job['id']), reverse=not ascending)
+            return [job['id'] for job in ordered]
+        
+        for filters in searches:
+            for engine in (service, memory):
+                seen, cursor = [], None
+                for _ in range(len(jobs)):
+                    page = engine.search_jobs_page(limit=4, cursor=cursor, **filters)
+                    seen.extend(page["job_ids"])
+                    cursor = page["next_cursor"]
+                    if not cursor:
+                        break
+                if seen != expected(filters) or not seen:
+                    print(f"❌ {engine.name} search {filters} returned {len(seen)} jobs, expected {len(expected(filters))}")
+                    return False
+        
+        # An edited budget moves the job in the range index
+        moved = dict(jobs[0], budget=100.0)
+        service.reindex_job(moved['id'], moved)
+        if service.search_jobs_page(sort="budget_desc", limit=1)["job_ids"] != [moved['id']] \
+                or moved['id'] in service.search_jobs_page(max_budget=5, limit=50)["job_ids"]:
+            print("❌ Edited budget not reflected in the range index")
+            return False
+        
+        print("✅ Range filters and attribute sorts matched a job-by-job filter")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Range filter test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_sorted_search_plans(service):
+    """Walking the sort index and intersecting the filters return the same pages"""
+    print("🧪 Testing sorted search plans...")
+    from app.services import search as search_module
+    settings = (search_module.SELECTIVE_FILTER_SIZE, search_module.SORTED_WALK_CHUNK, search_module.SORTED_WALK_BUDGET)
+    try:
+        index(service, [
+            dict(make_job(f"react developer {i}", tags=["frontend"] if i % 3 else ["backend"],
+                          status="open" if i % 4 else "completed", minutes=i // 2), budget=float(i % 7))
+            for i in range(60)
+        ])
+        searches = [
+            {"status": "open"},
+            {"tags": ["backend"], "sort": "budget_desc"},
+            {"query": "react", "min_budget": 2, "max_budget": 5, "sort": "budget_asc"},
+            {"tags": ["frontend"], "status": "completed", "max_budget": 3},
+        ]
+        plans = {
+            "intersect": (10 ** 9, 200, 5000),
+            "walk": (0, 4, 10 ** 9),
+            "walk then intersect": (0, 4, 8),
+        }
+        
+        def page_all(filters):
+            seen, cursor = [], None
+            for _ in range(60):
+                page = service.search_jobs_page(limit=7, cursor=cursor, **filters)
+                seen.extend(page["job_ids"])
+                cursor = page["next_cursor"]
+                if not cursor:
+                    break
+            return seen
+        
+        for filters in searches:
+            results = {}
+            for plan, values in plans.items():
+                search_module.SELECTIVE_FILTER_SIZE, search_module.SORTED_WALK_CHUNK, search_module.SORTED_WALK_BUDGET = values
+                service.redis.incr(service.generation_key)  # skip cached pages of the other plans
+                results[plan] = page_all(filters)
+            if len({tuple(seen) for seen in results.values()}) != 1 or not results["intersect"]:
+                print(f"❌ Plans disagree for {filters}: { {plan: len(seen) for plan, seen in results.items()} }")
+                return False
+        
+        print("✅ Walked and intersected searches returned the same pages")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Sorted search plan test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        search_module.SELECTIVE_FILTER_SIZE, search_module.SORTED_WALK_CHUNK, search_module.SORTED_WALK_BUDGET = settings
+
+
+def test_swap_in(service):
+    """A swapped-in shadow index replaces the live one, and later edits and deletes apply to it"""
+    print("🧪 Testing shadow index swap...")
+    try:
+        stale = index(service, [make_job("legacy listing", tags=["old"])])[0]
+        
+        shadow = type(service)(namespace=f"{service.namespace}shadow:")
+        kept, removed = index(shadow, [make_job("kept listing", tags=["design"]), make_job("removed listing")])
+        service.swap_in(shadow)
+        
+        job_ids = service.search_jobs_page()["job_ids"]
+        if sorted(job_ids) != sorted([kept['id'], removed['id']]):
+            print(f"❌ Live index after the swap holds {job_ids}")
+            return False
+        if service.search_jobs_page(tags=["old"])["job_ids"] or service.redis.exists(service._postings_key(stale['id'])):
+            print("❌ A job missing from the shadow index survived the swap")
+            return False
+        
+        # The swapped-in reverse index must point at live keys
+        service.delete_job(removed['id'])
+        service.reindex_job(kept['id'], dict(kept, tags=["branding"]))
+        for filters in ({"query": "removed"}, {"tags": ["design"]}):
+            if service.search_jobs_page(**filters)["job_ids"]:
+                print(f"❌ Search {filters} still matches after the change")
+                return False
+        if missing_postings(service, kept['id']) or service.search_jobs_page(tags=["branding"])["job_ids"] != [kept['id']]:
+            print("❌ Edited job not indexed under its new tag")
+            return False
+        
+        print("✅ Shadow index swapped in and kept in sync afterwards")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Swap test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_legacy_documents(service):
+    """Cached documents of the original indexer are treated as cache misses"""
+    print("🧪 Testing legacy cached documents...")
+    try:
+        import json
+        
+        current = index(service, [make_job("current listing")])[0]
+        legacy = make_job("legacy listing")
+        # The original index_job cached only these fields
+        legacy_blob = {field: legacy[field] for field in
+                       ('id', 'title', 'description', 'category', 'tags', 'status', 'skills_required')}
+        service.redis.setex(f"{service.job_index_prefix}{legacy['id']}", 3600, json.dumps(legacy_blob))
+        
+        documents = service.get_jobs([legacy['id'], current['id']])
+        if list(documents) != [current['id']] or documents[current['id']] != current:
+            print(f"❌ get_jobs returned {sorted(documents)}")
+            return False
+        if service.get_job(legacy['id']) is not None or service.get_job(current['id']) != current:
+            print("❌ get_job served a legacy document")
+            return False
+        
+        print("✅ Legacy documents are reloaded instead of served")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Legacy document test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_saved_search_matching(service):
+    """A saved search alerts on exactly the new jobs its search would return"""
+    print("🧪 Testing saved search matching...")
+    try:
+        from app.database import SavedSearch
+        from app.services.saved_search import search_match_keys, job_match_keys, job_terms, matches_saved_search
+        
+        jobs = index(service, [
+            make_job("react developer", skills=["react"], tags=["frontend", "remote"]),
+            make_job("react native developer", skills=["react"], tags=["frontend"], category="Mobile Development"),
+            make_job("solidity auditor", skills=["solidity"], tags=["remote", "security"]),
+            make_job("rust developer", skills=["rust"], tags=["backend", "remote"]),
+        ])
+        searches = [
+            {"query": "react"},
+            {"query": "developer react"},
+            {"tags": ["frontend", "remote"]},
+            {"tags": ["remote"]},
+            {"category": "Mobile Development"},
+            {"query": "dev", "tags": ["remote"]},
+        ]
+        
+        for criteria in searches:
+            terms = sorted(set(tokenize(criteria.get("query", ""))))
+            tags = sorted(tag.lower() for tag in criteria.get("tags", []))
+            category = criteria["category"].lower() if "category" in criteria else None
+            saved_search = SavedSearch(terms=terms, tags=tags, category=category,
+                                       match_keys=search_match_keys(terms, tags, category))
+            
+            expected = set(service.search_jobs_page(**criteria)["job_ids"])
+            for job in jobs:
+                job_tags = {tag.lower() for tag in job['tags']}
+                job_category = job['category'].lower()
+                terms_of_job = job_terms(job)
+                matched = matches_saved_search(saved_search, terms_of_job, job_tags, job_category)
+                found = bool(set(saved_search.match_keys) & set(job_match_keys(terms_of_job, job_tags, job_category)))
+                if matched != (job['id'] in expected) or (matched and not found):
+                    print(f"❌ Saved search {criteria} on {job['title']!r}: matched={matched}, "
+                          f"candidate={found}, returned by search={job['id'] in expected}")
+                    return False
+        
+        print("✅ Saved searches match the jobs their search returns")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Saved search test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_result_cache(service):
+    """Repeated searches are served from the cache until the index changes"""
+    print("🧪 Testing the result cache...")
+    try:
+        index(service, [make_job("python scraper")])
+        first = service.search_jobs_page(query="python")
+        second = service.search_jobs_page(query="Python python")
+        metrics = service.cache_metrics()
+        if second != first or (metrics["hits"], metrics["misses"]) != (1, 1):
+            print(f"❌ Equivalent searches not shared: {metrics}")
+            return False
+        
+        added = index(service, [make_job("python bot", minutes=1)])[0]
+        third = service.search_jobs_page(query="python")
+        metrics = service.cache_metrics()
+        if third["job_ids"][0] != added['id'] or (metrics["hits"], metrics["misses"]) != (1, 2):
+            print(f"❌ Stale page served after an index write: {third}, {metrics}")
+            return False
+        
+        print("✅ Result cache hits, misses and invalidation counted")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Result cache test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+class RowsSession:
+    """Session stand-in whose queries yield fixed (job_id, skills_required) rows"""
+    
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def query(self, *columns):
+        return self
+    
+    def filter(self, *criteria):
+        return self
+    
+    def yield_per(self, count):
+        return iter(self.rows)
+    
+    def close(self):
+        pass
+
+
+def test_recommendations(service):
+    """Recommendations rank open jobs by skill cosine similarity and follow job and profile changes"""
+    print("🧪 Testing skill recommendations...")
+    import math
+    from app.services.recommendation import RecommendationService, normalize_skill
+    try:
+        recommender = RecommendationService(cache_prefix=f"{service.namespace}recommend:")
+        skills = {
+            "django": ["Python", "Django"],
+            "python": ["python"],
+            "rust": ["Rust"],
+            "fullstack": ["python", "react", "postgres", "docker"],
+        }
+        recommender.build(RowsSession(list(skills.items())))
+        
+        def cosine(user_skills, job_skills):
+            user, job = {normalize_skill(skill) for skill in user_skills}, {normalize_skill(skill) for skill in job_skills}
+            return len(user & job) / math.sqrt(len(user) * len(job))
+        
+        user_skills = ["python", " DJANGO "]
+        expected = sorted(((job_id, cosine(user_skills, job)) for job_id, job in skills.items()
+                           if cosine(user_skills, job) > 0), key=lambda pair: -pair[1])
+        scored = recommender.score_jobs(user_skills, 10)
+        if [job_id for job_id, _ in scored] != [job_id for job_id, _ in expected] \
+                or any(abs(score - best) > 1e-6 for (_, score), (_, best) in zip(scored, expected)):
+            print(f"❌ score_jobs returned {scored}, expected {expected}")
+            return False
+        if recommender.score_jobs(["cobol"], 10) or [job_id for job_id, _ in recommender.score_jobs(user_skills, 1)] != ["django"]:
+            print("❌ Unknown skills or the limit not respected")
+            return False
+        
+        # New jobs are scored without a rebuild, closed jobs drop out
+        recommender.add_job("django-api", ["django", "python"])
+        recommender.remove_job("django")
+        ranked = [job_id for job_id, _ in recommender.score_jobs(user_skills, 10)]
+        if ranked != ["django-api", "python", "fullstack"]:
+            print(f"❌ score_jobs after changes returned {ranked}")
+            return False
+        
+        # Cached per user until the profile changes
+        address = "0x00000000000000000000000000000000000000AA"
+        first = recommender.recommend(address, user_skills, lambda: RowsSession([]))
+        recommender.add_job("rust-cli", ["rust"])
+        if recommender.recommend(address, ["rust"], lambda: RowsSession([])) != first:
+            print("❌ Cached recommendations not served")
+            return False
+        recommender.invalidate_user(address)
+        if [job_id for job_id, _ in recommender.recommend(address, ["rust"], lambda: RowsSession([]))] != ["rust", "rust-cli"]:
+            print("❌ Recommendations not recomputed after invalidation")
+            return False
+        
+        print("✅ Recommendations matched cosine similarity and followed changes")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Recommendation test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+TESTS = [
+    ("Relevance ranking", test_relevance_ranking),
+    ("Autocomplete ranking", test_suggest_popularity),
+    ("Popular tags", test_popular_tags),
+    ("Long query terms", test_long_terms),
+    ("Fuzzy correction", test_fuzzy_correction),
+    ("Facet counts", test_facets),
+    ("In-memory engine parity", test_engine_parity),
+    ("Compaction during indexing", test_compaction_during_indexing),
+    ("Filtered search paging", test_filtered_paging),
+    ("Range filters and sorts", test_range_filters),
+    ("Sorted search plans", test_sorted_search_plans),
+    ("Shadow index swap", test_swap_in),
+    ("Legacy cached documents", test_legacy_documents),
+    ("Saved search matching", test_saved_search_matching),
+    ("Result cache", test_result_cache),
+    ("Skill recommendations", test_recommendations),
+]
+
+
+def main():
+    print("=" * 60)
+    print("🚀 Search Index Test Suite")
+    print("=" * 60)
+    
+    # Change to backend directory
+    os.chdir(backend_path)
+    
+    from app.database import init_redis, get_redis
+    from app.services.search import SearchService
+    
+    init_redis()
+    if not get_redis():
+        print("❌ Redis not available")
+        return 1
+    
+    results = []
+    for name, test in TESTS:
+        service = SearchService(namespace=f"test:{uuid.uuid4().hex}:")
+        try:
+            results.append((name, test(service)))
+        finally:
+            # Every key of the test index, including its generation and result cache
+            keys = list(get_redis().scan_iter(match=f"{service.namespace}*", count=1000))
+            if keys:
+                get_redis().delete(*keys)
+    
+    # Summary
+    print("\n" + "=" * 60)
+    print("📊 Test Results Summary")
+    print("=" * 60)
+    for name, ok in results:
+        print(f"{name + ':':<28}{'✅ PASS' if ok else '❌ FAIL'}")
+    print("=" * 60)
+    
+    if all(ok for _, ok in results):
+        print("🎉 All tests passed!")
+        return 0
+    else:
+        print("⚠️  Some tests failed. Check the output above.")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())